@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'TexasPydEm'))
+# autopep8: off
+import HandEvaluator as HE
+import numpy as np
+from time import perf_counter
+# autopep8: on
+
+NUM_HANDS = 200000
+
+rng = np.random.default_rng(4711)
+# load the tables up front, this is not what we wanna measure
+HE.evaluateHands([list(range(7))])
+for numCards in range(5, 8):
+    hands = np.argsort(rng.random((NUM_HANDS, 52)), axis=1)[:, :numCards]
+    handLists = hands.tolist()
+
+    start = perf_counter()
+    single = [HE.evaluateStrength(hand) for hand in handLists]
+    singleTime = perf_counter() - start
+
+    start = perf_counter()
+    batch = HE.evaluateHands(hands)
+    batchTime = perf_counter() - start
+
+    if batch.tolist() != single:
+        raise RuntimeError('evaluateHands() disagrees with evaluateStrength()')
+    pattern = '{0} cards: evaluateStrength {1:.3f}s, evaluateHands {2:.3f}s, speedup {3:.1f}x'
+    print(pattern.format(numCards, singleTime, batchTime, singleTime / batchTime))
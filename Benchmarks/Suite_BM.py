@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'TexasPydEm'))
+# autopep8: off
+import argparse
+import gc
+import json
+import platform
+import HandEvaluator as HE
+from datetime import datetime
+from random import Random
+from statistics import median
+from time import perf_counter
+from typing import Callable, Dict, List, Tuple
+from BatchRunner import makeTable
+from Croupier import Croupier
+from Player import Player
+from TexasHoldEmGame import TexasHoldEmGame
+from Players.AlwaysCallPlayer import AlwaysCallPlayer as ACP
+from Players.FullyRandomPlayer import FullyRandomPlayer as FRP
+from Players.SimpleAIPlayer import SimpleAIPlayer as AIP
+# autopep8: on
+
+SEED = 4711
+NUM_HANDS = 2000  # number of hands per evaluator, outs, and croupier benchmark
+
+# Each benchmark is set up by a function returning the function to be timed and the number of operations the latter
+# performs per call. Only the call is timed, and it has to do the same work on each call.
+BENCHMARKS: Dict[str, Callable[[], Tuple[Callable[[], object], int]]] = {}
+
+CATEGORIES = ['highCard', 'pair', 'twoPair', 'threeOfAKind', 'straight', 'flush', 'fullHouse', 'fourOfAKind',
+              'straightFlush']  # names of the ranks of HandEvaluator in order
+
+
+# _______________ hands of a given rank _______________
+
+def _handCore(rank: int, rng: Random) -> List[int]:
+    """
+    Gets cards making a hand of the rank, to be filled up with random cards.
+    """
+    values = rng.sample(range(13), 2)
+    suits = rng.sample(range(4), 4)
+    if rank == HE.PAIR:
+        return [suit * 13 + values[0] for suit in suits[:2]]
+    if rank == HE.TWOPAIR:
+        return [suit * 13 + values[0] for suit in suits[:2]] + [suit * 13 + values[1] for suit in suits[2:]]
+    if rank == HE.THREE_OAK:
+        return [suit * 13 + values[0] for suit in suits[:3]]
+    if rank == HE.FULLHOUSE:
+        return [suit * 13 + values[0] for suit in suits[:3]] + [suit * 13 + values[1] for suit in suits[:2]]
+    if rank == HE.FOUR_OAK:
+        return [suit * 13 + values[0] for suit in suits]
+    if rank == HE.FLUSH:
+        return [suits[0] * 13 + value for value in rng.sample(range(13), 5)]
+    if rank in (HE.STRAIGHT, HE.STRAIGHFLUSH):
+        end = rng.randrange(3, 13)  # the ace is below the deuce in a straight ending with the five
+        flush = rank == HE.STRAIGHFLUSH
+        return [(suits[0] if flush else rng.randrange(4)) * 13 + (end - idx) % 13 for idx in range(5)]
+    return []
+
+
+def handsOfRank(rank: int, numHands: int, numCards: int, rng: Random) -> List[List[int]]:
+    """
+    Draws random hands of a rank.
+
+    rank:
+    The rank, e.g. HE.FLUSH.
+
+    numHands:
+    Number of hands.
+
+    numCards:
+    Number of cards in each hand.
+    """
+    hands = []
+    while len(hands) < numHands:
+        hand = _handCore(rank, rng)
+        hand += rng.sample([card for card in range(52) if card not in hand], numCards - len(hand))
+        if HE.evaluateHand(hand)[0] == rank:
+            hands.append(hand)
+    return hands
+
+
+def _evaluateHand(rank: int):
+    hands = handsOfRank(rank, NUM_HANDS, 7, Random(SEED + rank))
+
+    def run():
+        for hand in hands:
+            HE.evaluateHand(hand)
+    return run, len(hands)
+
+
+for _rank, _name in enumerate(CATEGORIES):
+    BENCHMARKS['evaluateHand.' + _name] = lambda rank=_rank: _evaluateHand(rank)
+
+
+# _______________ outs _______________
+
+def _outs(outsOf: Callable[[List[int]], object]):
+    rng = Random(SEED)
+    hands = [rng.sample(range(52), rng.choice((5, 6))) for _ in range(NUM_HANDS)]  # after the flop or the turn
+
+    def run():
+        for hand in hands:
+            outsOf(hand)
+    return run, len(hands)
+
+
+def _straightFlushOuts(hand: List[int]):
+    return HE.getStraightFlushOuts(HE.getStraightOuts(hand), HE.getFlushOuts(hand))
+
+
+BENCHMARKS['outs.straight'] = lambda: _outs(HE.getStraightOuts)
+BENCHMARKS['outs.flush'] = lambda: _outs(HE.getFlushOuts)
+BENCHMARKS['outs.straightFlush'] = lambda: _outs(_straightFlushOuts)
+BENCHMARKS['outs.threeOfAKind'] = lambda: _outs(lambda hand: HE.getXOfAKindOuts(hand, 3))
+BENCHMARKS['outs.twoPair'] = lambda: _outs(HE.getTwoPairOuts)
+BENCHMARKS['outs.fullHouse'] = lambda: _outs(HE.getFullHouseOuts)
+
+
+# _______________ croupier _______________
+
+def _drawCards(numPlayers: int, oneByOne: bool):
+    croupier = Croupier(Random(SEED))
+    # the cards of a hand: the pocket cards, then the flop, the turn, and the river
+    draws = [1] * (2 * numPlayers + 5) if oneByOne else [2 * numPlayers, 3, 1, 1]
+
+    def run():
+        croupier.rng.seed(SEED)
+        for _ in range(NUM_HANDS):
+            croupier.numLeft = 52  # all cards are still in the deck, just in another order
+            for numCards in draws:
+                croupier.drawCards(numCards)
+    return run, NUM_HANDS
+
+
+BENCHMARKS['drawCards.hand6'] = lambda: _drawCards(6, False)
+BENCHMARKS['drawCards.hand6OneByOne'] = lambda: _drawCards(6, True)
+BENCHMARKS['drawCards.hand10'] = lambda: _drawCards(10, False)
+
+
+# _______________ pots _______________
+
+def _potTable(numPlayers: int, numAllIn: int, numFolded: int, rng: Random) -> TexasHoldEmGame:
+    """
+    Sets up a table at the end of a hand: some players are all in for different amounts, some have folded, and the
+    rest has called the highest bet.
+    """
+    game = TexasHoldEmGame()
+    game.players = [Player('Player%d' % idx) for idx in range(numPlayers)]
+    game.dealIdx = 0
+    cards = rng.sample(range(52), 2 * numPlayers + 5)
+    game.comCards = cards[-5:]
+    game.curBet = 100 * (numAllIn + 1)
+    for idx, pl in enumerate(game.players):
+        pl.clearAll()
+        pl.pockets = cards[2 * idx:2 * idx + 2]
+        pl.bet = game.curBet
+    roles = rng.sample(range(numPlayers), numAllIn + numFolded)
+    for level, idx in enumerate(roles[:numAllIn]):
+        game.players[idx].bet = 100 * (level + 1)
+        game.players[idx].setEligibleOnly()
+    for idx in roles[numAllIn:]:
+        game.players[idx].bet = 50 * rng.randrange(1, 2 * numAllIn + 2)
+        game.players[idx].setInactive()
+    return game
+
+
+def _evaluatePots(numPlayers: int, numAllIn: int, numFolded: int):
+    rng = Random(SEED)
+    games = [_potTable(numPlayers, numAllIn, numFolded, rng) for _ in range(NUM_HANDS // 4)]
+
+    def run():
+        for game in games:
+            game.evaluatePots()
+    return run, len(games)
+
+
+BENCHMARKS['evaluatePots.headsUp'] = lambda: _evaluatePots(2, 0, 0)
+BENCHMARKS['evaluatePots.3way1SidePot'] = lambda: _evaluatePots(3, 1, 0)
+BENCHMARKS['evaluatePots.6way3SidePots'] = lambda: _evaluatePots(6, 3, 1)
+BENCHMARKS['evaluatePots.9way5SidePots'] = lambda: _evaluatePots(9, 5, 2)
+
+
+# _______________ whole hands and games _______________
+
+def _playAHand(bot, numPlayers: int, numHands: int):
+    factories = [lambda idx=idx: bot('Bot%d' % idx) for idx in range(numPlayers)]
+
+    def run():
+        played = 0
+        seed = SEED
+        while played < numHands:
+            game = makeTable(factories, seed=seed)
+            game.startGame()
+            while game.continueGame() and played < numHands:
+                game.playNextHand()
+                played += 1
+            seed += 1
+    return run, numHands
+
+
+def _runGame(bot, numPlayers: int, numGames: int):
+    factories = [lambda idx=idx: bot('Bot%d' % idx) for idx in range(numPlayers)]
+
+    def run():
+        for seed in range(SEED, SEED + numGames):
+            makeTable(factories, seed=seed).runGame()
+    return run, numGames
+
+
+BENCHMARKS['playAHand.simple6'] = lambda: _playAHand(AIP, 6, 500)
+BENCHMARKS['playAHand.call6'] = lambda: _playAHand(ACP, 6, 500)
+BENCHMARKS['playAHand.random6'] = lambda: _playAHand(FRP, 6, 500)
+BENCHMARKS['runGame.simple6'] = lambda: _runGame(AIP, 6, 10)
+BENCHMARKS['runGame.simple2'] = lambda: _runGame(AIP, 2, 20)
+
+
+# _______________ measuring and comparing _______________
+
+def measure(name: str, repeat: int) -> Dict[str, float]:
+    """
+    Times a benchmark. The garbage collector is off while timing.
+
+    name:
+    Name of the benchmark in BENCHMARKS.
+
+    repeat:
+    Number of times the benchmark is timed, after a warm up.
+
+    return:
+    The best and the median time per operation in nanoseconds, and the number of operations per timing.
+    """
+    run, numOps = BENCHMARKS[name]()
+    run()  # warm up, e.g. load the tables of the hand evaluator
+    times = []
+    gcWasOn = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = perf_counter()
+            run()
+            times.append(perf_counter() - start)
+    finally:
+        if gcWasOn:
+            gc.enable()
+    return {'best': min(times) / numOps * 1e9, 'median': median(times) / numOps * 1e9, 'ops': numOps}
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """
+    Compares the best times of the benchmarks measured in both runs.
+
+    threshold:
+    Relative slowdown from which on a benchmark counts as regressed, e.g. 0.1 for 10%.
+
+    return:
+    Names of the benchmarks regressed.
+    """
+    regressed = []
+    print('\n{0:32} {1:>12} {2:>12} {3:>8}'.format('benchmark', 'baseline ns', 'current ns', 'change'))
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]['best']
+        change = result['best'] / before - 1.0
+        flag = ''
+        if change > threshold:
+            regressed.append(name)
+            flag = '  REGRESSION'
+        print('{0:32} {1:12.0f} {2:12.0f} {3:+7.1%}{4}'.format(name, before, result['best'], change, flag))
+    return regressed
+
+
+parser = argparse.ArgumentParser(description='Times the hand evaluator, the outs, the croupier, the pot evaluation, '
+                                 'and whole hands of bots. The times are given per operation in nanoseconds.')
+parser.add_argument('--only', nargs='+', default=None, metavar='PREFIX',
+                    help='run only the benchmarks whose names start with any of the prefixes')
+parser.add_argument('--repeat', type=int, default=5, help='number of timings of each benchmark, the best counts')
+parser.add_argument('--save', default=None, metavar='FILE', help='file the results are written to as JSON')
+parser.add_argument('--baseline', default=None, metavar='FILE',
+                    help='results saved by an earlier run to compare with; exits with 1 on regressions')
+parser.add_argument('--threshold', type=float, default=0.1,
+                    help='relative slowdown counted as regression, 0.1 by default')
+parser.add_argument('--list', action='store_true', help='list the benchmarks and exit')
+args = parser.parse_args()
+
+names = [name for name in BENCHMARKS if args.only is None or name.startswith(tuple(args.only))]
+if args.list:
+    print('\n'.join(names))
+    sys.exit(0)
+
+results = {}
+for name in names:
+    results[name] = measure(name, args.repeat)
+    print('{0:32} {1:12.0f} ns  (median {2:.0f} ns)'.format(name, results[name]['best'], results[name]['median']))
+
+if args.save is not None:
+    report = {'date': datetime.now().isoformat(timespec='seconds'), 'python': platform.python_version(),
+              'machine': platform.platform(), 'repeat': args.repeat, 'results': results}
+    with open(args.save, 'w') as file:
+        json.dump(report, file, indent=1)
+
+if args.baseline is not None:
+    with open(args.baseline) as file:
+        baseline = json.load(file)['results']
+    regressed = compare(results, baseline, args.threshold)
+    if regressed:
+        print('\n%d of %d benchmarks regressed by more than %.0f%%' %
+              (len(regressed), len(results), 100 * args.threshold))
+        sys.exit(1)
@@ -0,0 +1,168 @@
+import asyncio
+from inspect import isawaitable
+from TexasHoldEmGame import TexasHoldEmGame
+from EventBus import isListening
+from Player import Player
+from UserAgent import UserAgent as UA
+from typing import Dict, List, Set, Tuple
+
+# number of community cards dealt before each betting interval after the first one
+_STREETS = [3, 1, 1]
+
+
+class AsyncGame(TexasHoldEmGame):
+    """
+    A game driven by an asyncio event loop, so that many tables can share one thread while their agents are waiting,
+    e.g. for a human or a remote bot. Player.demandBet() and the notification methods of user agents may be
+    coroutines. Plain methods are called as in TexasHoldEmGame, so all existing agents can take part; agents that
+    block, like CLIPlayer waiting for input, are asked in a worker thread when passed to self.runInThread().
+
+    Notifications that are coroutines are awaited in the order they have been sent, before the next player is
+    asked and at the end of each hand. Pauses are awaited then as well, instead of blocking the event loop.
+    """
+
+    threaded: Set[Player]  # players whose decisions are demanded in a worker thread
+    _pending: list         # awaitables returned by notifications, not awaited yet
+    _sleep: float          # duration of the pauses requested since the last flush
+
+    def __init__(self, seed: int = None):
+        """
+        seed = None:
+        Seed of all random numbers of the game, see TexasHoldEmGame.
+        """
+        super().__init__(seed)
+        self.threaded = set()
+        self._pending = []
+        self._sleep = 0
+
+    def runInThread(self, player: Player):
+        """
+        Demands the decisions of a player in a worker thread, so that a blocking demandBet() does not stall the
+        other tables.
+        """
+        self.threaded.add(player)
+
+    # _______________ notifications _______________
+
+    def broadcast(self, hook: str, *args):
+        for listener in self.bus.listeners[hook]:
+            result = listener(*args)
+            if result is not None and isawaitable(result):
+                self._pending.append(result)
+
+    def notifyAgents(self, agents: List[UA], hook: str, *args):
+        for ua in agents:
+            if isListening(ua, hook):
+                result = getattr(ua, hook)(*args)
+                if result is not None and isawaitable(result):
+                    self._pending.append(result)
+        self.bus.notify([], hook, *args)  # the buffers
+
+    def pause(self, seconds: float):
+        if seconds > 0:
+            self._sleep += seconds
+
+    async def flush(self):
+        """
+        Awaits the notifications and pauses pending, in the order they have been requested.
+        """
+        while self._pending:
+            pending = self._pending
+            self._pending = []
+            for awaitable in pending:
+                await awaitable
+        if self._sleep > 0:
+            seconds = self._sleep
+            self._sleep = 0
+            await asyncio.sleep(seconds)
+
+    # _______________ in game _______________
+
+    async def playAction(self, player: Player):
+        """
+        Demands a bet like TexasHoldEmGame.playAction(), awaiting the decision if it is a coroutine. If there is
+        a clock, decisions awaited are cancelled when out of time.
+        """
+        await self.flush()
+        minRaise = self.curBet + self.bb
+        clock = self.clock
+        if clock is not None:
+            allowance = clock.allowance(player)
+            start = clock.timer()
+        if player in self.threaded:
+            playersBet = asyncio.to_thread(player.demandBet, self.curBet, minRaise, self.potSize)
+        else:
+            playersBet = player.demandBet(self.curBet, minRaise, self.potSize)
+        timedOut = False
+        if isawaitable(playersBet):
+            try:
+                playersBet = await asyncio.wait_for(playersBet, None if clock is None else allowance)
+            except asyncio.TimeoutError:
+                timedOut = True
+        if clock is not None and not clock.charge(player, clock.timer() - start, timedOut):
+            playersBet = clock.defaultBet(player, self.curBet)
+        self.applyBet(player, playersBet)
+
+    async def playInterval(self):
+        """
+        Plays an entire interval, see TexasHoldEmGame.playInterval().
+        """
+        player = self._players[self.playIdx]
+        while self.doesIntervalGoOn(player):
+            player.yetUnasked = False
+            await self.playAction(player)
+            player = self.shiftPlayIndex(self.playIdx)
+            self.pause(self.shortSleep)
+
+    async def playAHand(self) -> Dict[Player, int]:
+        """
+        Plays an entire hand, see TexasHoldEmGame.playAHand().
+        """
+        self.prepareHand()
+        self.postBlinds()
+        await self.playInterval()
+        for numCards in _STREETS:
+            if not self.hasSeveralEligibles():
+                return self.evaluatePots()
+            self.dealCommunityCards(numCards)
+            self.pause(self.shortSleep)
+            if self.needsPlayingAnInterval():
+                self.prepareFurtherInterval()
+                await self.playInterval()
+        if not self.hasSeveralEligibles():
+            return self.evaluatePots()
+        return self.showdown()
+
+    async def playNextHand(self) -> Tuple[Dict[Player, int], List[Player]]:
+        """
+        Plays a hand, pays out the wins, eliminates the players without chips left, and passes the dealer button,
+        see TexasHoldEmGame.playNextHand(). Other tables get their turn afterwards.
+        """
+        wins = await self.playAHand()
+        out = self.finishHand(wins)
+        await self.flush()
+        await asyncio.sleep(0)
+        return wins, out
+
+    async def runGame(self) -> Dict[Player, int]:
+        """
+        Starts and runs the game until the game stops to continue, see TexasHoldEmGame.runGame().
+        """
+        self.startGame()
+        await self.flush()
+        while self.continueGame():
+            await self.playNextHand()
+        return {pl: pl.stack for pl in self._players}
+
+
+async def runGames(games: List[AsyncGame]) -> List[Dict[Player, int]]:
+    """
+    Runs games concurrently in the current event loop.
+
+    games:
+    The games with all players added.
+
+    return:
+    What the runGame() of each game returns, in the order of the games.
+    """
+    return await asyncio.gather(*(game.runGame() for game in games))
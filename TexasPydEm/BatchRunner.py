@@ -0,0 +1,183 @@
+from TexasHoldEmGame import TexasHoldEmGame
+from HeadlessGame import HeadlessGame
+from Player import Player
+import HandEvaluator as HE
+from Rng import streamSeed
+import random
+from typing import Callable, Dict, Iterator, List
+
+
+class HandResult():
+    """
+    What happened in a single hand of a batch run.
+    """
+
+    game: int                # number of the game (or tournament) in the batch run, starting at 0
+    hand: int                # number of the hand within the game, starting at 0
+    dealer: str              # name of the dealer
+    wins: Dict[str, int]     # gross wins by player name
+    stacks: Dict[str, int]   # stacks after the hand by player name, including eliminated players
+    showdown: Dict[str, int]  # hand strengths of the players in the showdown, empty if there was no showdown
+    eliminated: List[str]    # names of the players eliminated in this hand
+    final: bool              # is this the last hand of the game?
+
+    def __init__(self, game: int, hand: int, dealer: str):
+        self.game = game
+        self.hand = hand
+        self.dealer = dealer
+        self.wins = {}
+        self.stacks = {}
+        self.showdown = {}
+        self.eliminated = []
+        self.final = False
+
+    def toDict(self) -> dict:
+        """
+        Gets the result as a dictionary of plain values, for example for writing it as JSON.
+        """
+        return {'game': self.game, 'hand': self.hand, 'dealer': self.dealer, 'wins': self.wins,
+                'stacks': self.stacks, 'showdown': self.showdown, 'eliminated': self.eliminated,
+                'final': self.final}
+
+
+def makeTable(factories: List[Callable[[], Player]], smallBlind: int = 250, startStack: int = None,
+              headless: bool = True, seed: int = None, pooledDecks: bool = False) -> TexasHoldEmGame:
+    """
+    Sets up a game with new players.
+
+    factories:
+    Each factory creates one player when called. Players need distinct names.
+
+    smallBlind = 250:
+    The small blind. The big blind is twice as high.
+
+    startStack = None:
+    Stack of each player at the begin. 'None' for twenty big blinds.
+
+    headless = True:
+    Set up a HeadlessGame rather than a TexasHoldEmGame.
+
+    seed = None:
+    Seed of the game, see TexasHoldEmGame.
+
+    pooledDecks = False:
+    Take the decks from a pool in a HeadlessGame, see PooledCroupier.
+
+    return:
+    The game, ready to start.
+    """
+    game = HeadlessGame(seed, pooledDecks) if headless else TexasHoldEmGame(seed)
+    game.sb = smallBlind
+    game.bb = 2 * smallBlind
+    game.startStack = 20 * game.bb if startStack is None else startStack
+    for factory in factories:
+        game.addPlayer(factory())
+    return game
+
+
+def _gameSeed(seed: int, gameNum: int, rng: random.Random) -> int:
+    """
+    Derives the seed of a single game of a batch run. An unseeded batch run draws the seeds from its own generator.
+    """
+    return rng.getrandbits(64) if seed is None else streamSeed(seed, 'game', gameNum)
+
+
+def _showdownStrengths(game: TexasHoldEmGame, players: List[Player]) -> Dict[str, int]:
+    """
+    Evaluates the hands of the players in the showdown of the hand just played.
+
+    players:
+    The players that have taken part in the hand.
+    """
+    eligible = [pl for pl in players if pl.isEligible()]
+    if len(game.comCards) < 5 or len(eligible) < 2:
+        return {}
+    return {pl.name: HE.evaluateStrength(game.allSevenCards(pl)) for pl in eligible}
+
+
+def playGame(game: TexasHoldEmGame, gameNum: int = 0, maxHands: int = None) -> Iterator[HandResult]:
+    """
+    Runs a game hand by hand, like TexasHoldEmGame.runGame() does.
+
+    game:
+    The game, ready to start.
+
+    gameNum = 0:
+    Number of the game put into the results.
+
+    maxHands = None:
+    Stop after that many hands even if the game would go on. 'None' for no limit.
+
+    return:
+    Generator of the result of each hand.
+    """
+    seated = list(game.players)
+    game.startGame()
+    hand = 0
+    while game.continueGame() and (maxHands is None or hand < maxHands):
+        result = HandResult(gameNum, hand, game.players[game.dealIdx].name)
+        players = list(game.players)
+        wins, out = game.playNextHand()
+        result.wins = {pl.name: win for pl, win in wins.items()}
+        result.showdown = _showdownStrengths(game, players)
+        result.stacks = {pl.name: pl.stack for pl in seated}
+        result.eliminated = [pl.name for pl in out]
+        hand += 1
+        result.final = not game.continueGame() or hand == maxHands
+        yield result
+
+
+def runHands(factories: List[Callable[[], Player]], numHands: int, seed: int = None, smallBlind: int = 250,
+             startStack: int = None, headless: bool = True, pooledDecks: bool = False) -> Iterator[HandResult]:
+    """
+    Plays a number of hands at a table. Whenever a game is over, a new game with new players starts.
+
+    factories, smallBlind, startStack, headless, pooledDecks:
+    Configuration of the table, see makeTable().
+
+    numHands:
+    Number of hands in total.
+
+    seed = None:
+    Seed of the random numbers. Each game gets a seed of its own derived from it, and each agent a generator of
+    the game by setRng(). Agents drawing from the random module instead are not reproducible. 'None' gives
+    different results each time.
+
+    return:
+    Generator of the result of each hand. Results are not kept, so memory does not grow during long runs.
+    """
+    rng = random.Random(seed)
+    played = 0
+    gameNum = 0
+    while played < numHands:
+        game = makeTable(factories, smallBlind, startStack, headless, _gameSeed(seed, gameNum, rng), pooledDecks)
+        for result in playGame(game, gameNum, numHands - played):
+            played += 1
+            yield result
+        gameNum += 1
+
+
+def runTournaments(factories: List[Callable[[], Player]], numTournaments: int, seed: int = None,
+                   smallBlind: int = 250, startStack: int = None, headless: bool = True,
+                   pooledDecks: bool = False) -> Iterator[HandResult]:
+    """
+    Plays a number of games until only one player is left each.
+
+    factories, smallBlind, startStack, headless, pooledDecks:
+    Configuration of the table, see makeTable().
+
+    numTournaments:
+    Number of games.
+
+    seed = None:
+    Seed of the random numbers. Each game gets a seed of its own derived from it, and each agent a generator of
+    the game by setRng(). Agents drawing from the random module instead are not reproducible. 'None' gives
+    different results each time.
+
+    return:
+    Generator of the result of each hand. The last hand of each tournament is marked as final.
+    """
+    rng = random.Random(seed)
+    for gameNum in range(numTournaments):
+        game = makeTable(factories, smallBlind, startStack, headless, _gameSeed(seed, gameNum, rng), pooledDecks)
+        yield from playGame(game, gameNum)
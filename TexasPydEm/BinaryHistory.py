@@ -0,0 +1,301 @@
+import mmap
+import struct
+import sys
+from array import array
+from HandHistory import HandRecord
+from typing import Dict, Iterator, List
+try:
+    import numpy as np
+except ImportError:
+    np = None  # columns cannot be exported
+
+# Layout of a file, all numbers little endian:
+#   file header: MAGIC, version (u16), reserved (u16)
+#   hand records, each:
+#     record header: length of the record in bytes (u32), hand number (u32), number of seats (u8), seat of the
+#       dealer (u8), number of actions (u16), number of seats shown (u8), number of winners (u8), number of seats
+#       eliminated (u8)
+#     name of each seat: length (u8) and UTF-8 bytes
+#     stack of each seat at the begin of the hand (u32)
+#     pocket cards of each seat (2 x u8)
+#     board (5 x u8)
+#     actions: seat (u8), kind (u8), bet after the action (u32)
+#     seats shown (u8 each)
+#     winners: seat (u8), gross win (u32)
+#     seats eliminated (u8 each)
+#     streets: number of dealings of community cards (u8), number of actions before each dealing (u16 each)
+#   offset index, written when the file is closed: offset of each record (u64)
+#   footer: offset of the index (u64), number of records (u32), INDEX_MAGIC
+MAGIC = b'TPHH'
+INDEX_MAGIC = b'TPHI'
+VERSION = 1
+NO_CARD = 255  # placeholder of cards not dealt
+
+_FILE_HEADER = struct.Struct('<4sHH')
+_HEADER = struct.Struct('<IIBBHBBB')
+_ACTION = struct.Struct('<BBI')
+_WIN = struct.Struct('<BI')
+_FOOTER = struct.Struct('<QI4s')
+
+
+def encodeHand(hand: HandRecord) -> bytes:
+    """
+    Converts a record into its binary representation.
+    """
+    numSeats = len(hand.names)
+    parts = [b'']
+    for name in hand.names:
+        encoded = name.encode('utf-8')[:255]
+        parts.append(bytes((len(encoded),)))
+        parts.append(encoded)
+    parts.append(struct.pack('<%dI' % numSeats, *hand.stacks))
+    cards = bytearray([NO_CARD]) * (2 * numSeats + 5)
+    for seat, pockets in enumerate(hand.pockets):
+        cards[2 * seat:2 * seat + len(pockets)] = bytes(pockets)
+    cards[2 * numSeats:2 * numSeats + len(hand.board)] = bytes(hand.board)
+    parts.append(bytes(cards))
+    parts.extend([_ACTION.pack(*action) for action in hand.actions])
+    parts.append(bytes(hand.shown))
+    parts.extend(_WIN.pack(*win) for win in hand.wins)
+    parts.append(bytes(hand.out))
+    parts.append(bytes((len(hand.streets),)))
+    parts.append(struct.pack('<%dH' % len(hand.streets), *hand.streets))
+    body = b''.join(parts)
+    parts[0] = _HEADER.pack(_HEADER.size + len(body), hand.handNum, numSeats, hand.dealIdx, len(hand.actions),
+                            len(hand.shown), len(hand.wins), len(hand.out))
+    return parts[0] + body
+
+
+def decodeHand(buffer, offset: int) -> HandRecord:
+    """
+    Converts the binary representation of a record back into a record.
+
+    buffer:
+    Bytes or a memory map holding the record.
+
+    offset:
+    Position of the record in the buffer.
+    """
+    _, handNum, numSeats, dealIdx, numActions, numShown, numWins, numOut = _HEADER.unpack_from(buffer, offset)
+    hand = HandRecord(handNum)
+    hand.dealIdx = dealIdx
+    pos = offset + _HEADER.size
+    for _ in range(numSeats):
+        length = buffer[pos]
+        hand.names.append(bytes(buffer[pos + 1:pos + 1 + length]).decode('utf-8'))
+        pos += 1 + length
+    hand.stacks = list(struct.unpack_from('<%dI' % numSeats, buffer, pos))
+    pos += 4 * numSeats
+    cards = buffer[pos:pos + 2 * numSeats + 5]
+    hand.pockets = [[card for card in cards[2 * seat:2 * seat + 2] if card != NO_CARD] for seat in range(numSeats)]
+    hand.board = [card for card in cards[2 * numSeats:] if card != NO_CARD]
+    pos += 2 * numSeats + 5
+    end = pos + numActions * _ACTION.size
+    hand.actions = list(_ACTION.iter_unpack(buffer[pos:end]))
+    pos = end
+    hand.shown = list(buffer[pos:pos + numShown])
+    pos += numShown
+    end = pos + numWins * _WIN.size
+    hand.wins = list(_WIN.iter_unpack(buffer[pos:end]))
+    pos = end
+    hand.out = list(buffer[pos:pos + numOut])
+    pos += numOut
+    numStreets = buffer[pos]
+    hand.streets = list(struct.unpack_from('<%dH' % numStreets, buffer, pos + 1))
+    return hand
+
+
+class BinaryHistoryWriter():
+    """
+    Writes hand records in the binary format described above. Records are collected and written in batches; the
+    offset index is written when the writer is closed, also on leaving a with statement by an exception. Pass it to a
+    HandHistoryRecorder to record a game.
+    """
+
+    path: str
+    flushEvery: int         # number of hands written at once
+    _file: object           # the file written to
+    _pending: List[bytes]   # records not written yet
+    _offsets: array         # offset of each record
+    _position: int          # offset of the next record
+
+    def __init__(self, path: str, flushEvery: int = 1000):
+        """
+        path:
+        Path of the file. An existing file is overwritten.
+
+        flushEvery = 1000:
+        Number of hands written and flushed at once.
+        """
+        self.path = path
+        self.flushEvery = flushEvery
+        self._file = open(path, 'wb')
+        self._file.write(_FILE_HEADER.pack(MAGIC, VERSION, 0))
+        self._position = _FILE_HEADER.size
+        self._pending = []
+        self._offsets = array('Q')
+
+    def writeHand(self, hand: HandRecord):
+        """
+        Collects a record, and writes the records collected when there are enough.
+        """
+        encoded = encodeHand(hand)
+        self._offsets.append(self._position)
+        self._position += len(encoded)
+        self._pending.append(encoded)
+        if len(self._pending) >= self.flushEvery:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the records collected and flushes the file.
+        """
+        if self._pending:
+            self._file.write(b''.join(self._pending))
+            self._pending = []
+        self._file.flush()
+
+    def close(self):
+        """
+        Writes the records collected and the offset index, and closes the file.
+        """
+        if self._file.closed:
+            return
+        self.flush()
+        offsets = self._offsets
+        self._file.write(struct.pack('<%dQ' % len(offsets), *offsets))
+        self._file.write(_FOOTER.pack(self._position, len(offsets), INDEX_MAGIC))
+        self._file.close()
+
+    def __enter__(self) -> 'BinaryHistoryWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class BinaryHistoryReader():
+    """
+    Reads a file written by a BinaryHistoryWriter through a memory map, so that hands are decoded only when
+    accessed. The hands can be accessed by index, like a list. If the file has not been closed properly, the index
+    is rebuilt by skipping from record to record.
+    """
+
+    path: str
+    offsets: array      # offset of each record
+    _file: object       # the file mapped
+    _map: mmap.mmap     # the memory map of the file
+
+    def __init__(self, path: str):
+        """
+        path:
+        Path of the file.
+
+        raises:
+        ValueError if the file is not a binary hand history.
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # an empty file cannot be mapped
+            self._file.close()
+            raise ValueError('not a binary hand history: ' + path)
+        if len(self._map) < _FILE_HEADER.size or _FILE_HEADER.unpack_from(self._map, 0) != (MAGIC, VERSION, 0):
+            self.close()
+            raise ValueError('not a binary hand history: ' + path)
+        self.offsets = self._readIndex()
+
+    def _readIndex(self) -> array:
+        """
+        Reads the offset index from the end of the file, or rebuilds it.
+        """
+        size = len(self._map)
+        if size >= _FILE_HEADER.size + _FOOTER.size:
+            indexOffset, count, magic = _FOOTER.unpack_from(self._map, size - _FOOTER.size)
+            if magic == INDEX_MAGIC and indexOffset + 8 * count + _FOOTER.size == size:
+                offsets = array('Q')
+                offsets.frombytes(self._map[indexOffset:indexOffset + 8 * count])
+                if sys.byteorder == 'big':
+                    offsets.byteswap()
+                return offsets
+        offsets = array('Q')
+        pos = _FILE_HEADER.size
+        while pos + _HEADER.size <= size:
+            length = _HEADER.unpack_from(self._map, pos)[0]
+            if length < _HEADER.size or pos + length > size:
+                break  # cut off in the middle of a record
+            offsets.append(pos)
+            pos += length
+        return offsets
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> 'BinaryHistoryReader':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, idx: int) -> HandRecord:
+        return decodeHand(self._map, self.offsets[idx])
+
+    def __iter__(self) -> Iterator[HandRecord]:
+        for offset in self.offsets:
+            yield decodeHand(self._map, offset)
+
+    def columns(self) -> Dict[str, 'np.ndarray']:
+        """
+        Exports the numbers of all hands as NumPy arrays, without decoding the names. There are three tables, in
+        columns of equal length each:
+        - by hand: 'hand', 'dealer', 'board' (hands x 5, NO_CARD for cards not dealt), 'numSeats'
+        - by seat and hand: 'seatHand' (index of the hand in the file), 'seat', 'stack', 'pockets' (x 2)
+        - by action: 'actionHand' (index of the hand in the file), 'actionSeat', 'actionKind', 'actionBet'
+
+        raises:
+        ImportError if NumPy is not available.
+        """
+        if np is None:
+            raise ImportError('exporting columns requires numpy')
+        data = np.frombuffer(self._map, dtype=np.uint8)
+        numHands = len(self.offsets)
+        hands = np.empty(numHands, dtype=np.uint32)
+        dealers = np.empty(numHands, dtype=np.uint8)
+        numSeats = np.empty(numHands, dtype=np.int64)
+        numActions = np.empty(numHands, dtype=np.int64)
+        cardsAt = np.empty(numHands, dtype=np.int64)
+        stacksAt = np.empty(numHands, dtype=np.int64)
+        actionsAt = np.empty(numHands, dtype=np.int64)
+        buffer = self._map
+        for idx, offset in enumerate(self.offsets):
+            _, hands[idx], seats, dealers[idx], actions, _, _, _ = _HEADER.unpack_from(buffer, offset)
+            pos = offset + _HEADER.size
+            for _ in range(seats):
+                pos += 1 + buffer[pos]
+            numSeats[idx] = seats
+            numActions[idx] = actions
+            stacksAt[idx] = pos
+            cardsAt[idx] = pos + 4 * seats
+            actionsAt[idx] = pos + 6 * seats + 5
+
+        seatHand = np.repeat(np.arange(numHands), numSeats)
+        seat = np.arange(len(seatHand)) - np.repeat(np.cumsum(numSeats) - numSeats, numSeats)
+        stackPos = np.repeat(stacksAt, numSeats) + 4 * seat
+        stacks = data[stackPos[:, np.newaxis] + np.arange(4)].copy().view('<u4')[:, 0]
+        pocketPos = np.repeat(cardsAt, numSeats) + 2 * seat
+        pockets = data[pocketPos[:, np.newaxis] + np.arange(2)]
+        board = data[(cardsAt + 2 * numSeats)[:, np.newaxis] + np.arange(5)]
+
+        actionHand = np.repeat(np.arange(numHands), numActions)
+        action = np.arange(len(actionHand)) - np.repeat(np.cumsum(numActions) - numActions, numActions)
+        actionPos = np.repeat(actionsAt, numActions) + _ACTION.size * action
+        actionBets = data[(actionPos + 2)[:, np.newaxis] + np.arange(4)].copy().view('<u4')[:, 0]
+        return {'hand': hands, 'dealer': dealers, 'board': board, 'numSeats': numSeats,
+                'seatHand': seatHand, 'seat': seat, 'stack': stacks, 'pockets': pockets,
+                'actionHand': actionHand, 'actionSeat': data[actionPos], 'actionKind': data[actionPos + 1],
+                'actionBet': actionBets}
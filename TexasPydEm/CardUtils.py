@@ -1,3 +1,6 @@
+from typing import List
+
+
 def isHigherCard(cardA: int, cardB: int) -> bool:
     """
     Check if card A is higher than card B, considering the order of suits if both cards have the same value.
@@ -49,3 +52,58 @@ def getCardSuit(card: int) -> int:
     The suit of the card.
     """
     return card // 13
+
+
+# _______________  bit masks  _______________
+
+# number of bits used for each suit in a card mask
+SUIT_BITS = 13
+# bits of a single suit in a card mask
+SUIT_MASK = (1 << SUIT_BITS) - 1
+
+
+def cardsToMask(cards: List[int]) -> int:
+    """
+    Turns a list of cards into a card mask. In a card mask, the card with the numerical represent n is present if
+    and only if bit n is set. Thus, the mask consists of four 13 bit wide suit masks, where bit v of a suit mask
+    is set if the card of value v of that suit is present.
+
+    cards:
+    Numerical represents of the cards. Valid are values ranging from 0 to 51.
+
+    return:
+    The card mask.
+    """
+    mask = 0
+    for card in cards:
+        mask |= 1 << card
+    return mask
+
+
+def maskToCards(mask: int) -> List[int]:
+    """
+    Turns a card mask into a list of cards.
+
+    mask:
+    The card mask, see cardsToMask().
+
+    return:
+    Numerical represents of the cards in the mask, in ascending order.
+    """
+    return [card for card in range(52) if mask >> card & 1]
+
+
+def getSuitMask(mask: int, suit: int) -> int:
+    """
+    Gets the values of all cards of the given suit in the card mask.
+
+    mask:
+    The card mask, see cardsToMask().
+
+    suit:
+    The suit.
+
+    return:
+    13 bit wide mask where bit v is set if the card of value v and the given suit is in the card mask.
+    """
+    return (mask >> (suit * SUIT_BITS)) & SUIT_MASK
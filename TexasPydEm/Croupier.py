@@ -1,23 +1,90 @@
-from random import randint
+from random import Random
+from typing import List
+from Rng import GLOBAL_RNG, Rng, streamSeed
+try:
+    import numpy as np
+except ImportError:
+    np = None  # pooled decks are not available
 
 
 class Croupier():
     """
-    Handles the deck of cards.
+    Handles the deck of cards. The deck is a fixed list of all 52 cards; the cards left are those in front of
+    the list up to self.numLeft. Drawing a card swaps a randomly picked card left to the end of that range
+    (partial Fisher-Yates shuffle), so each card drawn costs constant time, and restoring the deck just resets
+    the number of cards left. The cards drawn are reproducible when the random generator has been seeded.
     """
 
-    def __init__(self):
+    cards: List[int]  # all cards, the cards left in the deck first
+    numLeft: int      # number of cards left in the deck
+    rng: Random       # generator the cards are picked by
+
+    def __init__(self, rng: Random = None):
+        """
+        rng = None:
+        The random generator. 'None' for the generator of the random module.
+        """
+        self.cards = list(range(0, 52))
+        self.rng = GLOBAL_RNG if rng is None else rng
         self.restoreDeck()
 
-    def restoreDeck(self):
+    def restoreDeck(self, rng: Random = None):
         """
         Restores the deck, which contains all cards again after this method has returned.
+
+        rng = None:
+        A new random generator to pick the cards by from now on. This also puts the cards back in order, so the
+        cards drawn depend on nothing but the new generator. 'None' keeps the generator.
         """
-        self.cards = list(range(0, 52))
+        if rng is not None:
+            self.rng = rng
+            self.cards.sort()
+        self.numLeft = len(self.cards)
+
+    def shuffleForHand(self, rng: Rng, handNum: int):
+        """
+        Restores the deck for a hand of a game. The cards drawn in the hand depend on nothing but the generator
+        of the table and the number of the hand.
+
+        rng:
+        The random generator of the table.
+
+        handNum:
+        The number of the hand.
+        """
+        self.restoreDeck(rng.substream('hand', handNum))
+
+    def getState(self) -> tuple:
+        """
+        Gets the state of the deck, including the state of the random generator, for self.setState().
+
+        return:
+        An immutable representation of the state.
+        """
+        return (tuple(self.cards), self.numLeft, self.rng.getstate())
+
+    def setState(self, state: tuple):
+        """
+        Sets the state of the deck got by self.getState(). The cards drawn afterwards are the same as those drawn
+        after the state has been got.
 
-    def drawCards(self, numCards: int):
+        state:
+        The state.
         """
-        Randomly picks removes cards from the deck and returns these cards removed.
+        cards, self.numLeft, rngState = state
+        self.cards = list(cards)
+        self.rng.setstate(rngState)
+
+    def cardsLeft(self) -> List[int]:
+        """
+        Gets the cards left in the deck, in no particular order.
+        """
+        return self.cards[:self.numLeft]
+
+    def drawCards(self, numCards: int) -> List[int]:
+        """
+        Randomly picks cards, removes them from the deck and returns these cards removed. Drawing many cards in
+        one call is cheaper than drawing them one by one, but gives the same cards.
 
         numCards:
         Number of cards to be drawn. This is clamped between 0 and the number of cards left in the deck.
@@ -25,10 +92,84 @@ class Croupier():
         return:
         List of the cards drawn.
         """
-        picks = min(max(0, numCards), len(self.cards))
-        drawn = []
-        for pick in range(picks):
-            cardIndex = randint(0, len(self.cards) - 1)
-            card = self.cards.pop(cardIndex)
-            drawn.append(card)
+        cards = self.cards
+        random = self.rng.random
+        left = self.numLeft
+        picks = min(max(0, numCards), left)
+        for _ in range(picks):
+            pick = int(random() * left)
+            left -= 1
+            cards[pick], cards[left] = cards[left], cards[pick]
+        self.numLeft = left
+        drawn = cards[left:left + picks]
+        drawn.reverse()  # in the order drawn
+        return drawn
+
+
+class PooledCroupier(Croupier):
+    """
+    A croupier that takes the deck of each hand from a pool of shuffled decks. The pool is generated in bulk by
+    NumPy, sorting random keys for many decks at once, so there are no random numbers drawn per card or per hand.
+    The pool of a hand is determined by the generator of the table and the number of the hand only, so the cards
+    are reproducible like those of Croupier, but different. Outside of hands, e.g. when finding the first dealer
+    after restoreDeck(), cards are drawn one by one like by Croupier.
+    """
+
+    poolSize: int           # number of decks per pool
+    _pool: List[List[int]]  # the current pool of shuffled decks
+    _poolKey: tuple         # root seed, path, and number of the current pool
+    _pooled: bool           # is self.cards a deck of the pool?
+
+    def __init__(self, rng: Random = None, poolSize: int = 64):
+        """
+        rng = None:
+        The random generator cards are drawn by outside of hands. 'None' for the generator of the random module.
+
+        poolSize = 64:
+        Number of decks generated at once.
+
+        raises:
+        ImportError if NumPy is not available.
+        """
+        if np is None:
+            raise ImportError('PooledCroupier requires numpy')
+        self.poolSize = poolSize
+        self._pool = []
+        self._poolKey = None
+        self._pooled = False
+        super().__init__(rng)
+
+    def restoreDeck(self, rng: Random = None):
+        if self._pooled:
+            self.cards = sorted(self.cards)  # a copy, the pool stays as it is
+            self._pooled = False
+        super().restoreDeck(rng)
+
+    def shuffleForHand(self, rng: Rng, handNum: int):
+        poolNum, deckIdx = divmod(handNum, self.poolSize)
+        key = (rng.rootSeed, rng.path, poolNum)
+        if key != self._poolKey:
+            seed = streamSeed(rng.rootSeed, *(rng.path + ('pool', poolNum)))
+            keys = np.random.Generator(np.random.PCG64(seed)).random((self.poolSize, len(self.cards)))
+            self._pool = np.argsort(keys, axis=1).tolist()
+            self._poolKey = key
+        self.cards = self._pool[deckIdx]
+        self._pooled = True
+        self.numLeft = len(self.cards)
+
+    def getState(self) -> tuple:
+        return super().getState() + (self._pooled,)
+
+    def setState(self, state: tuple):
+        super().setState(state[:-1])
+        self._pooled = state[-1]
+
+    def drawCards(self, numCards: int) -> List[int]:
+        if not self._pooled:
+            return super().drawCards(numCards)
+        left = self.numLeft
+        picks = min(max(0, numCards), left)
+        self.numLeft = left - picks
+        drawn = self.cards[left - picks:left]
+        drawn.reverse()
         return drawn
@@ -0,0 +1,211 @@
+from threading import Thread
+from time import perf_counter
+from Player import Player
+from typing import Callable, Dict, List
+
+CHECK = 'check'  # check on timeout if possible, otherwise fold
+FOLD = 'fold'    # fold on timeout
+
+
+class DecisionStats():
+    """
+    Latency of the decisions of a player.
+    """
+
+    __slots__ = ('count', 'total', 'longest', 'timeouts')
+
+    count: int      # number of decisions
+    total: float    # sum of the durations in seconds
+    longest: float  # longest duration in seconds
+    timeouts: int   # number of decisions replaced by the default action
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.longest = 0.0
+        self.timeouts = 0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count > 0 else 0.0
+
+
+class DecisionClock():
+    """
+    Bounds how long players may take for a decision. Each decision may take self.timeout seconds; a player with a
+    time bank may exceed that by what is left in the bank, which shrinks by the excess. A decision out of time is
+    replaced by the default action. The duration of each decision is recorded, see self.stats.
+
+    By default, the duration is measured after the decision has been made: a slow decision is replaced, but a bot
+    that never returns blocks the game forever. With preemptive set, decisions are made in a worker thread the game
+    stops waiting for on timeout. This protects the hand only, not the bot: the thread abandoned keeps running and
+    may still change the state of the bot, so a bot timed out this way should not be trusted to play on. AsyncGame
+    cancels coroutines on timeout in any case.
+    """
+
+    timeout: float                     # seconds per decision, 'None' for no limit
+    timeouts: Dict[Player, float]      # seconds per decision of single players, overriding self.timeout
+    banks: Dict[Player, float]         # seconds left in the time bank of each player
+    defaultBank: float                 # initial time bank of each player not in self.banks
+    defaultAction: str                 # CHECK or FOLD
+    preemptive: bool                   # make decisions in a worker thread?
+    stats: Dict[Player, DecisionStats]  # latency of the decisions of each player
+    timer: Callable[[], float]         # clock measuring the decisions in seconds
+
+    def __init__(self, timeout: float = None, timeBank: float = 0.0, defaultAction: str = CHECK,
+                 preemptive: bool = False, timer: Callable[[], float] = perf_counter):
+        """
+        timeout = None:
+        Seconds per decision. 'None' for no limit, only recording the durations.
+
+        timeBank = 0.0:
+        Initial time bank of each player in seconds.
+
+        defaultAction = CHECK:
+        Action on timeout: CHECK to check if possible and fold otherwise, or FOLD.
+
+        preemptive = False:
+        Make each decision in a worker thread, so that the game goes on when a player hangs.
+
+        timer = perf_counter:
+        Clock measuring the decisions in seconds.
+
+        raises:
+        ValueError if the default action is unknown.
+        """
+        if defaultAction not in (CHECK, FOLD):
+            raise ValueError('unknown default action: ' + str(defaultAction))
+        self.timeout = timeout
+        self.timeouts = {}
+        self.banks = {}
+        self.defaultBank = timeBank
+        self.defaultAction = defaultAction
+        self.preemptive = preemptive
+        self.stats = {}
+        self.timer = timer
+
+    def setTimeout(self, player: Player, seconds: float):
+        """
+        Sets the seconds per decision of a single player, e.g. to throttle a slow bot.
+        """
+        self.timeouts[player] = seconds
+
+    def setTimeBank(self, player: Player, seconds: float):
+        """
+        Sets what is left in the time bank of a player.
+        """
+        self.banks[player] = seconds
+
+    def allowance(self, player: Player) -> float:
+        """
+        Gets how long the player may take for the next decision, including the time bank.
+
+        return:
+        Seconds, or 'None' for no limit.
+        """
+        timeout = self.timeouts.get(player, self.timeout)
+        if timeout is None:
+            return None
+        return timeout + self.banks.get(player, self.defaultBank)
+
+    def charge(self, player: Player, seconds: float, timedOut: bool = False) -> bool:
+        """
+        Records the duration of a decision and draws the time beyond the timeout from the time bank.
+
+        player:
+        The player who has decided.
+
+        seconds:
+        The duration of the decision.
+
+        timedOut = False:
+        Has the decision been cut off for being out of time? The time bank is used up then, however long the
+        decision has taken.
+
+        return:
+        Has the decision been in time?
+        """
+        stats = self.stats.get(player)
+        if stats is None:
+            stats = self.stats[player] = DecisionStats()
+        stats.count += 1
+        stats.total += seconds
+        if seconds > stats.longest:
+            stats.longest = seconds
+        timeout = self.timeouts.get(player, self.timeout)
+        if timeout is None or (seconds <= timeout and not timedOut):
+            return True
+        bank = self.banks.get(player, self.defaultBank) - (seconds - timeout)
+        if bank < 0 or timedOut:
+            self.banks[player] = 0.0
+            stats.timeouts += 1
+            return False
+        self.banks[player] = bank
+        return True
+
+    def defaultBet(self, player: Player, demand: int) -> int:
+        """
+        Gets the default action as a bet, see Player.demandBet().
+        """
+        if self.defaultAction == CHECK and player.bet >= demand:
+            return player.bet
+        return -1
+
+    def demandBet(self, player: Player, demand: int, minRaiseValue: int, potSize: int) -> int:
+        """
+        Demands a bet like TexasHoldEmGame.playAction() does, but replaces decisions out of time by the default
+        action.
+
+        return:
+        The bet, see Player.demandBet().
+        """
+        allowance = self.allowance(player)
+        start = self.timer()
+        timedOut = False
+        if self.preemptive and allowance is not None:
+            bet = self._demandInThread(player, (demand, minRaiseValue, potSize), allowance)
+            timedOut = bet is None
+        else:
+            bet = player.demandBet(demand, minRaiseValue, potSize)
+        if not self.charge(player, self.timer() - start, timedOut) or bet is None:
+            return self.defaultBet(player, demand)
+        return bet
+
+    @staticmethod
+    def _demandInThread(player: Player, args: tuple, seconds: float) -> int:
+        """
+        Demands a bet in a daemon thread and waits for it, at most the given time.
+
+        return:
+        The bet, or 'None' if the player has not decided in time.
+
+        raises:
+        What demandBet() has raised.
+        """
+        result: List = []
+
+        def decide():
+            try:
+                result.append((player.demandBet(*args), None))
+            except Exception as error:
+                result.append((None, error))
+
+        thread = Thread(target=decide, daemon=True)
+        thread.start()
+        thread.join(seconds)
+        if not result:
+            return None
+        bet, error = result[0]
+        if error is not None:
+            raise error
+        return bet
+
+    def slowest(self, num: int = None) -> List[Player]:
+        """
+        Gets the players by mean duration of their decisions, the slowest first.
+
+        num = None:
+        Maximum number of players returned. 'None' for all.
+        """
+        players = sorted(self.stats, key=lambda pl: self.stats[pl].mean, reverse=True)
+        return players if num is None else players[:num]
@@ -0,0 +1,243 @@
+from TexasHoldEmGame import TexasHoldEmGame
+from Player import Player
+from typing import Dict, List, Tuple
+
+# number of community cards dealt before each betting interval
+_STREETS = [0, 3, 1, 1]
+
+
+class ExternalPlayer(Player):
+    """
+    A player whose decisions are made from outside by PokerEnv.step() instead of by demandBet().
+    """
+
+    def demandBet(self, demand: int, minRaiseValue: int, potSize: int) -> int:
+        raise RuntimeError('external players are driven by PokerEnv.step()')
+
+
+class Observation():
+    """
+    What the player in turn knows when asked for an action, and which actions are legal.
+    """
+
+    seat: int                # index of the player in turn in the list of players
+    names: Tuple[str, ...]   # names of all players
+    pockets: Tuple[int, ...]  # pocket cards of the player in turn
+    comCards: Tuple[int, ...]  # community cards
+    bets: Tuple[int, ...]    # bet of each player
+    stacks: Tuple[int, ...]  # stack of each player
+    status: Tuple[int, ...]  # status of each player, see TableState
+    dealIdx: int             # index of the dealer
+    potSize: int             # current pot size
+    demand: int              # bet needed to call or check
+    minRaise: int            # lowest bet that counts as a raise
+    maxBet: int              # highest possible bet, i.e. going all in
+
+    def __init__(self, game: TexasHoldEmGame):
+        """
+        Observes the game from the view of the player in turn.
+        """
+        table = game.table
+        player = game.players[game.playIdx]
+        self.seat = game.playIdx
+        self.names = tuple(pl.name for pl in game.players)
+        self.pockets = tuple(player.pockets)
+        self.comCards = tuple(game.comCards)
+        self.bets = tuple(table.bets)
+        self.stacks = tuple(table.stacks)
+        self.status = tuple(table.status)
+        self.dealIdx = game.dealIdx
+        self.potSize = table.potSize
+        self.demand = game.curBet
+        self.minRaise = game.curBet + game.bb
+        self.maxBet = player.bet + player.stack
+
+    def canRaise(self) -> bool:
+        """
+        Is raising a legal action? Betting between self.demand and self.minRaise is treated as calling.
+        """
+        return self.maxBet >= self.minRaise
+
+
+class PokerEnv():
+    """
+    Drives a game from outside, hand by hand and action by action, like an environment for reinforcement learning.
+    reset() deals a hand and step() executes an action of the player in turn. Both return once an ExternalPlayer
+    is asked for an action or the hand is over; decisions of all other players are demanded from them in between.
+    Actions are bets as returned by Player.demandBet(): negative for folding, otherwise the total bet in the hand.
+    """
+
+    game: TexasHoldEmGame
+    seated: List[Player]     # the players at the begin of the game
+    done: bool               # is the current hand over?
+    _started: bool           # has the game been started?
+    _street: int             # index of the current betting interval in _STREETS
+    _player: Player          # the player in turn, 'None' if no betting interval is going on
+    _startStacks: Dict[Player, int]  # stacks at the begin of the current hand
+
+    def __init__(self, game: TexasHoldEmGame):
+        """
+        game:
+        The game with all players added, but not started yet.
+        """
+        self.game = game
+        self.seated = list(game.players)
+        self.done = True
+        self._started = False
+        self._street = 0
+        self._player = None
+        self._startStacks = {}
+
+    def reset(self) -> Tuple[Observation, Dict[str, int], bool, dict]:
+        """
+        Deals a new hand. When the game is over, a new game starts with all players.
+
+        return:
+        See step().
+        """
+        game = self.game
+        if not self._started or not game.continueGame():
+            game.players = list(self.seated)
+            game.startGame()
+            self._started = True
+        self._startStacks = {pl: pl.stack for pl in game.players}
+        self.done = False
+        game.prepareHand()
+        game.postBlinds()
+        self._street = 0
+        self._player = game.players[game.playIdx]
+        return self._advance()
+
+    def step(self, action: int) -> Tuple[Observation, Dict[str, int], bool, dict]:
+        """
+        Executes the action of the player in turn.
+
+        action:
+        The bet of the player, see Player.demandBet(). It is clamped like the reaction of any player.
+
+        return:
+        A tuple of
+        - the observation of the next ExternalPlayer in turn, 'None' when the hand is over,
+        - the net win of each player in this hand by name, empty unless the hand is over,
+        - is the hand over,
+        - further information: the gross wins ('wins') and the players eliminated ('out') when the hand is over.
+
+        raises:
+        RuntimeError if no hand is going on.
+        """
+        if self.done:
+            raise RuntimeError('no hand is going on, call reset() first')
+        self._act(action)
+        return self._advance()
+
+    def _act(self, action: int):
+        """
+        Executes the action of the player in turn and passes the turn.
+        """
+        game = self.game
+        player = self._player
+        player.yetUnasked = False
+        game.applyBet(player, action)
+        self._player = game.shiftPlayIndex(game.playIdx)
+        game.pause(game.shortSleep)
+
+    def _advance(self) -> Tuple[Observation, Dict[str, int], bool, dict]:
+        """
+        Goes on with the hand until an ExternalPlayer is in turn or the hand is over.
+        """
+        game = self.game
+        while True:
+            while game.doesIntervalGoOn(self._player):
+                if isinstance(self._player, ExternalPlayer):
+                    return Observation(game), {}, False, {}
+                self._act(game.demandBet(self._player))
+            if not game.hasSeveralEligibles() or self._street == len(_STREETS) - 1:
+                return self._finish()
+            self._street += 1
+            game.dealCommunityCards(_STREETS[self._street])
+            game.pause(game.shortSleep)
+            if game.needsPlayingAnInterval():
+                game.prepareFurtherInterval()
+                self._player = game.players[game.playIdx]
+            else:
+                self._player = None
+
+    def _finish(self) -> Tuple[Observation, Dict[str, int], bool, dict]:
+        """
+        Evaluates the pots and finishes the hand.
+        """
+        game = self.game
+        if self._street == len(_STREETS) - 1 and game.hasSeveralEligibles():
+            wins = game.showdown()
+        else:
+            wins = game.evaluatePots()
+        out = game.finishHand(wins)
+        self.done = True
+        self._player = None
+        rewards = {pl.name: pl.stack - stack for pl, stack in self._startStacks.items()}
+        return None, rewards, True, {'wins': {pl.name: win for pl, win in wins.items()},
+                                     'out': [pl.name for pl in out]}
+
+
+class VectorPokerEnv():
+    """
+    Steps many independent tables at once, e.g. for self-play. A table whose hand is over deals the next hand
+    right away, so there is always an observation for each table.
+    """
+
+    envs: List[PokerEnv]
+
+    def __init__(self, games: List[TexasHoldEmGame]):
+        """
+        games:
+        The games, each with all players added, but not started yet.
+
+        raises:
+        ValueError if there is no ExternalPlayer at a table.
+        """
+        for game in games:
+            if not any(isinstance(pl, ExternalPlayer) for pl in game.players):
+                raise ValueError('each table needs an external player')
+        self.envs = [PokerEnv(game) for game in games]
+
+    def reset(self) -> List[Observation]:
+        """
+        Deals a new hand at each table.
+
+        return:
+        The observation of each table.
+        """
+        return [self._untilObservation(env, env.reset()) for env in self.envs]
+
+    def step(self, actions: List[int]) -> Tuple[List[Observation], List[Dict[str, int]], List[bool], List[dict]]:
+        """
+        Executes one action at each table.
+
+        actions:
+        The action of the player in turn at each table, see PokerEnv.step().
+
+        return:
+        For each table, what PokerEnv.step() returns. If a hand is over, the observation is that of the next
+        hand, while the net wins and the further information are those of the hand finished.
+        """
+        observations, rewards, dones, infos = [], [], [], []
+        for env, action in zip(self.envs, actions):
+            observation, reward, done, info = env.step(action)
+            if done:
+                observation = self._untilObservation(env, env.reset())
+            observations.append(observation)
+            rewards.append(reward)
+            dones.append(done)
+            infos.append(info)
+        return observations, rewards, dones, infos
+
+    @staticmethod
+    def _untilObservation(env: PokerEnv, result: Tuple[Observation, Dict[str, int], bool, dict]) -> Observation:
+        """
+        Deals new hands until an ExternalPlayer is asked for an action, e.g. when all of them have been folded
+        out by the blinds already.
+        """
+        observation, _, done, _ = result
+        while done:
+            observation, _, done, _ = env.reset()
+        return observation
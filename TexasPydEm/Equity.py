@@ -0,0 +1,417 @@
+import HandEvaluator as HE
+import CardUtils as CU
+import Parallel
+from itertools import combinations, islice, permutations
+from multiprocessing import cpu_count
+from random import Random
+from time import time
+from typing import List
+try:
+    import numpy as np
+except ImportError:
+    np = None  # rollouts are played one by one
+
+
+class Equity():
+    """
+    Outcome of an equity computation, seen from the player the pocket cards have been given for.
+    """
+
+    win: float       # probability of winning the pot alone
+    tie: float       # probability of splitting the pot
+    lose: float      # probability of losing the pot
+    equity: float    # expected share of the pot, where split pots count by their share
+    rollouts: int    # number of boards and opponent hands the probabilities are based on
+
+    def __init__(self, wins: float = 0, ties: float = 0, losses: float = 0, shares: float = 0, rollouts: int = 0):
+        """
+        Computes the probabilities from counts.
+
+        wins, ties, losses:
+        How often the pot has been won, split, or lost.
+
+        shares:
+        Sum of the shares of the pot won.
+
+        rollouts:
+        Total number of rollouts.
+        """
+        self.rollouts = rollouts
+        total = max(rollouts, 1)
+        self.win = wins / total
+        self.tie = ties / total
+        self.lose = losses / total
+        self.equity = shares / total
+
+    def __repr__(self) -> str:
+        pattern = 'Equity(win={0:.4f}, tie={1:.4f}, lose={2:.4f}, equity={3:.4f}, rollouts={4})'
+        return pattern.format(self.win, self.tie, self.lose, self.equity, self.rollouts)
+
+
+def _checkCards(pockets: List[int], board: List[int], dead: List[int], opponents: int) -> List[int]:
+    """
+    Checks the arguments of an equity computation.
+
+    return:
+    The cards still in the deck.
+
+    raises:
+    ValueError if the arguments do not make up a valid situation.
+    """
+    known = list(pockets) + list(board) + list(dead)
+    if len(pockets) != 2:
+        raise ValueError('exactly two pocket cards needed')
+    if len(board) > 5:
+        raise ValueError('not more than five community cards')
+    if opponents < 1:
+        raise ValueError('at least one opponent needed')
+    if len(set(known)) != len(known) or min(known) < 0 or max(known) > 51:
+        raise ValueError('cards must be valid and distinct')
+    deck = [card for card in range(52) if card not in known]
+    if len(deck) < 5 - len(board) + 2 * opponents:
+        raise ValueError('not enough cards left in the deck')
+    return deck
+
+
+def _rolloutsPython(rnd: Random, pockets: List[int], board: List[int], deck: List[int], opponents: int,
+                    num: int) -> List[float]:
+    """
+    Plays rollouts one by one.
+
+    return:
+    Counts of wins, ties, and losses as well as the sum of the shares won.
+    """
+    missing = 5 - len(board)
+    need = missing + 2 * opponents
+    wins = ties = losses = 0
+    shares = 0.0
+    for _ in range(num):
+        drawn = rnd.sample(deck, need)
+        coms = board + drawn[:missing]
+        own = HE.evaluateStrength(pockets + coms)
+        best = 0
+        numBest = 0
+        for opp in range(opponents):
+            start = missing + 2 * opp
+            strength = HE.evaluateStrength(drawn[start:start + 2] + coms)
+            if strength > best:
+                best = strength
+                numBest = 1
+            elif strength == best:
+                numBest += 1
+        if own > best:
+            wins += 1
+            shares += 1
+        elif own == best:
+            ties += 1
+            shares += 1 / (numBest + 1)
+        else:
+            losses += 1
+    return [wins, ties, losses, shares]
+
+
+def _drawBatch(rng, deck, need: int, num: int):
+    """
+    Draws cards for a batch of rollouts by a partial Fisher-Yates shuffle of one deck per rollout, which is done
+    for all decks at once.
+
+    rng:
+    The NumPy random generator.
+
+    deck:
+    Array of the cards in the deck.
+
+    need:
+    Number of cards drawn per rollout.
+
+    num:
+    Number of rollouts.
+
+    return:
+    Array of shape (num, need) with the cards drawn.
+    """
+    decks = np.tile(deck, (num, 1))
+    rows = np.arange(num)
+    for pos in range(need):
+        swap = rng.integers(pos, len(deck), size=num)
+        picked = decks[rows, swap]
+        decks[rows, swap] = decks[:, pos]
+        decks[:, pos] = picked
+    return decks[:, :need]
+
+
+def _rolloutsNumpy(rng, pockets: List[int], board: List[int], deck: List[int], opponents: int,
+                   num: int) -> List[float]:
+    """
+    Plays a batch of rollouts at once with HandEvaluator.evaluateHands().
+
+    return:
+    Counts of wins, ties, and losses as well as the sum of the shares won.
+    """
+    missing = 5 - len(board)
+    drawn = _drawBatch(rng, np.array(deck, dtype=np.int8), missing + 2 * opponents, num)
+    coms = np.concatenate((np.tile(np.array(board, dtype=np.int8), (num, 1)), drawn[:, :missing]), axis=1)
+    own = HE.evaluateHands(np.concatenate((np.tile(np.array(pockets, dtype=np.int8), (num, 1)), coms), axis=1))
+    # hands of all opponents, opponent by opponent
+    oppPockets = drawn[:, missing:].reshape(num * opponents, 2)
+    oppHands = np.concatenate((oppPockets, np.repeat(coms, opponents, axis=0)), axis=1)
+    others = HE.evaluateHands(oppHands).reshape(num, opponents)
+    best = others.max(axis=1)
+    numBest = (others == best[:, np.newaxis]).sum(axis=1)
+    won = own > best
+    tied = own == best
+    wins = int(won.sum())
+    ties = int(tied.sum())
+    shares = wins + float((1 / (numBest[tied] + 1)).sum())
+    return [wins, ties, num - wins - ties, shares]
+
+
+def _monteCarloShard(pockets: List[int], board: List[int], deck: List[int], opponents: int, rollouts: int,
+                     deadline: float, seed: int, batchSize: int) -> List[float]:
+    """
+    Plays rollouts with a random generator of its own. This is the unit of work a process gets.
+
+    deadline:
+    Time, as returned by time.time(), after which no further batch is started. 'None' for no deadline.
+
+    return:
+    Counts of wins, ties, and losses, the sum of the shares won, and the number of rollouts played.
+    """
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        play = _rolloutsNumpy
+    else:
+        rng = Random(seed)
+        play = _rolloutsPython
+
+    counts = [0, 0, 0, 0.0]
+    done = 0
+    while done < rollouts:
+        num = min(batchSize, rollouts - done)
+        batch = play(rng, pockets, board, deck, opponents, num)
+        counts = [counts[idx] + batch[idx] for idx in range(len(counts))]
+        done += num
+        if deadline is not None and time() > deadline:
+            break
+    return counts + [done]
+
+
+def monteCarloEquity(pockets: List[int], board: List[int] = [], dead: List[int] = [], opponents: int = 1,
+                     rollouts: int = 10000, timeLimit: float = None, seed: int = None,
+                     batchSize: int = 2500, workers: int = 1, chunkSize: int = None) -> Equity:
+    """
+    Estimates the chances of a hand against a number of opponents with random pocket cards by dealing the
+    remaining community cards and the opponents' pockets randomly many times. The rollouts are played in
+    batches with HandEvaluator.evaluateHands() if NumPy is available, and one by one otherwise.
+
+    pockets:
+    The two pocket cards.
+
+    board = []:
+    Community cards already known, from zero to five cards.
+
+    dead = []:
+    Cards that are known to be out of the deck, like folded cards that have been shown.
+
+    opponents = 1:
+    Number of opponents.
+
+    rollouts = 10000:
+    Maximum number of rollouts.
+
+    timeLimit = None:
+    Maximum time in seconds spent on the rollouts. At least one batch is played. 'None' deactivates this limit.
+    Note that results are reproducible only if no time limit is set.
+
+    seed = None:
+    Seed of the random generator. 'None' gives different results each time.
+
+    batchSize = 2500:
+    Number of rollouts played at once.
+
+    workers = 1:
+    Number of processes the rollouts are distributed over, see Parallel.mapShards(). For more than one worker,
+    the rollouts are split into shards, each with a random stream derived from the seed, so that the result
+    for a given seed and chunkSize does not depend on the number of workers.
+
+    chunkSize = None:
+    Number of rollouts per shard when using more than one worker. 'None' makes four shards per worker.
+
+    return:
+    The estimated equity.
+
+    raises:
+    ValueError if the cards or the number of opponents do not make up a valid situation.
+    """
+    deck = _checkCards(pockets, board, dead, opponents)
+    pockets = list(pockets)
+    board = list(board)
+    deadline = None if timeLimit is None else time() + timeLimit
+
+    if workers == 1:
+        shards = [(pockets, board, deck, opponents, rollouts, deadline, seed, batchSize)]
+    else:
+        if chunkSize is None:
+            chunkSize = -(-rollouts // (4 * (workers or cpu_count())))
+        sizes = [min(chunkSize, rollouts - start) for start in range(0, rollouts, chunkSize)]
+        seeds = Parallel.spawnSeeds(seed, len(sizes))
+        shards = [(pockets, board, deck, opponents, sizes[idx], deadline, seeds[idx], batchSize)
+                  for idx in range(len(sizes))]
+
+    counts = [0, 0, 0, 0.0, 0]
+    for result in Parallel.mapShards(_monteCarloShard, shards, workers):
+        counts = [counts[idx] + result[idx] for idx in range(len(counts))]
+    return Equity(*counts)
+
+
+# _______________  exhaustive enumeration  _______________
+
+def _suitSymmetries(groups: List[List[int]]) -> List[List[int]]:
+    """
+    Finds all permutations of the suits that map each group of cards onto itself. Runouts that are mapped onto
+    each other by such a permutation are equally good for everybody.
+
+    groups:
+    The groups of known cards, like the hands of the players.
+
+    return:
+    For each permutation, a list that maps each card to the card it is permuted to. The identity is included.
+    """
+    symmetries = []
+    for suits in permutations(range(4)):
+        perm = [suits[CU.getCardSuit(card)] * 13 + CU.getCardValue(card) for card in range(52)]
+        if all(set(perm[card] for card in group) == set(group) for group in groups):
+            symmetries.append(perm)
+    return symmetries
+
+
+def _enumeratePython(hands: List[List[int]], board: List[int], deck: List[int], symmetries: List[List[int]],
+                     counts: List[List[float]]):
+    """
+    Evaluates each runout that is the lowest of its kind under the suit symmetries one after another. The hash
+    keys of pockets and board are computed once, so only the runout cards are added for each runout.
+
+    counts:
+    Counts of wins, ties, losses, and pot shares of each hand. Runouts are counted by the number of runouts
+    of their kind.
+    """
+    emptyKey = HE.cardsKey([])
+    bases = [HE.cardsKey(hand + board) - emptyKey for hand in hands]
+    others = symmetries[1:]  # the identity comes first
+    strengths = [0] * len(hands)
+    for runout in combinations(deck, 5 - len(board)):
+        weight = 1
+        if others:
+            lowest = True
+            stable = 1
+            for perm in others:
+                image = tuple(sorted([perm[card] for card in runout]))
+                if image < runout:
+                    lowest = False
+                    break
+                stable += image == runout
+            if not lowest:
+                continue
+            weight = len(symmetries) // stable
+        runoutKey = HE.cardsKey(runout)
+        for idx in range(len(hands)):
+            strengths[idx] = HE.evaluateKey(bases[idx] + runoutKey, hands[idx] + board + list(runout))
+        _countShowdown(strengths, weight, counts)
+
+
+def _enumerateNumpy(hands: List[List[int]], board: List[int], deck: List[int], symmetries: List[List[int]],
+                    counts: List[List[float]], chunkSize: int = 200000):
+    """
+    Like _enumeratePython(), but processes the runouts in chunks with HandEvaluator.evaluateHands(). Runouts are
+    encoded as numbers in base 52, such that comparing the codes compares the runouts.
+    """
+    missing = 5 - len(board)
+    places = 52 ** np.arange(missing - 1, -1, -1, dtype=np.int64)
+    perms = np.array(symmetries[1:], dtype=np.int8).reshape(len(symmetries) - 1, 52)
+    runouts = combinations(deck, missing)
+    while True:
+        chunk = np.fromiter(islice(runouts, chunkSize), dtype=np.dtype((np.int8, missing)))
+        if len(chunk) == 0:
+            break
+        codes = chunk.astype(np.int64) @ places
+        lowest = np.ones(len(chunk), dtype=bool)
+        stable = np.ones(len(chunk), dtype=np.int64)
+        for perm in perms:
+            imageCodes = np.sort(perm[chunk], axis=1).astype(np.int64) @ places
+            lowest &= imageCodes >= codes
+            stable += imageCodes == codes
+        chunk = chunk[lowest]
+        weights = len(symmetries) // stable[lowest]
+
+        common = np.concatenate((np.tile(np.array(board, dtype=np.int8), (len(chunk), 1)), chunk), axis=1)
+        strengths = np.empty((len(chunk), len(hands)), dtype=np.int64)
+        for idx in range(len(hands)):
+            pockets = np.tile(np.array(hands[idx], dtype=np.int8), (len(chunk), 1))
+            strengths[:, idx] = HE.evaluateHands(np.concatenate((pockets, common), axis=1))
+        best = strengths.max(axis=1)
+        isBest = strengths == best[:, np.newaxis]
+        numBest = isBest.sum(axis=1)
+        for idx in range(len(hands)):
+            won = isBest[:, idx] & (numBest == 1)
+            tied = isBest[:, idx] & (numBest > 1)
+            counts[idx][0] += int(weights[won].sum())
+            counts[idx][1] += int(weights[tied].sum())
+            counts[idx][2] += int(weights[~isBest[:, idx]].sum())
+            counts[idx][3] += int(weights[won].sum()) + float((weights[tied] / numBest[tied]).sum())
+
+
+def _countShowdown(strengths: List[int], weight: int, counts: List[List[float]]):
+    """
+    Counts the outcome of a single runout.
+    """
+    best = max(strengths)
+    numBest = strengths.count(best)
+    for idx in range(len(strengths)):
+        if strengths[idx] < best:
+            counts[idx][2] += weight
+        elif numBest == 1:
+            counts[idx][0] += weight
+            counts[idx][3] += weight
+        else:
+            counts[idx][1] += weight
+            counts[idx][3] += weight / numBest
+
+
+def exactEquity(hands: List[List[int]], board: List[int] = [], dead: List[int] = []) -> List[Equity]:
+    """
+    Computes the exact chances of each hand in a showdown where all pocket cards are known, for example when all
+    players are all in, by evaluating every possible runout of the remaining community cards. Runouts that are
+    the same but for the suits not involved are evaluated only once.
+
+    hands:
+    The pocket cards of each player, two cards per player.
+
+    board = []:
+    Community cards already known, from zero to five cards.
+
+    dead = []:
+    Cards that are known to be out of the deck, like folded cards that have been shown.
+
+    return:
+    The equity of each hand, in the order of 'hands'. The rollouts are the number of possible runouts.
+
+    raises:
+    ValueError if there are less than two hands or the cards do not make up a valid situation.
+    """
+    if len(hands) < 2:
+        raise ValueError('at least two hands needed')
+    for hand in hands:
+        if len(hand) != 2:
+            raise ValueError('exactly two pocket cards needed')
+    deck = _checkCards(hands[0], board, list(dead) + [card for hand in hands[1:] for card in hand], 1)
+    hands = [list(hand) for hand in hands]
+    board = list(board)
+    symmetries = _suitSymmetries(hands + [board, list(dead)])
+
+    counts = [[0, 0, 0, 0.0] for _ in hands]
+    if np is not None and len(board) < 5:
+        _enumerateNumpy(hands, board, deck, symmetries, counts)
+    else:
+        _enumeratePython(hands, board, deck, symmetries, counts)
+    total = sum(counts[0][:3])
+    return [Equity(wins, ties, losses, shares, total) for wins, ties, losses, shares in counts]
@@ -0,0 +1,198 @@
+from UserAgent import UserAgent as UA
+from functools import partial
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+# methods of UserAgent that do nothing unless overridden
+SILENT_HOOKS = frozenset(['announceFirstDealer', 'notifyBeginOfHand', 'notifyCardDealing', 'notifySmallBlind',
+                          'notifyBigBlind', 'notifyFolding', 'notifyCheck', 'notifyRaise', 'notifyCall',
+                          'notifyLastPenny', 'notifyAllIn', 'notifyPotWin', 'notifyCommunityCards', 'notifyShowdown',
+                          'notifyElimination', 'notifyEndOfHand', 'revealAllCards'])
+
+# results of isListening() by class of user agent and method name
+_listening: Dict[Tuple[type, str], bool] = {}
+
+
+def isListening(ua: UA, hook: str) -> bool:
+    """
+    Checks if a user agent does something when being notified.
+
+    ua:
+    The user agent.
+
+    hook:
+    Name of the method of UserAgent.
+
+    return:
+    Does the method do anything, i.e., is it not one of the SILENT_HOOKS or has the user agent overridden it, in its
+    class or by an attribute of its own?
+    """
+    key = (type(ua), hook)
+    listening = _listening.get(key)
+    if listening is None:
+        listening = hook not in SILENT_HOOKS or getattr(type(ua), hook) is not getattr(UA, hook)
+        _listening[key] = listening
+    return listening or hook in ua.__dict__
+
+
+class Event(NamedTuple):
+    """
+    A notification of the game as a record: the method of UserAgent it is delivered by and the arguments. The
+    arguments are those passed to the method, i.e., players are referenced, not copied.
+    """
+
+    hook: str    # name of the method of UserAgent, e.g. 'notifyFolding'
+    args: tuple  # arguments of the method
+
+
+class EventBuffer():
+    """
+    Collects events so that they can be consumed later, at once, e.g. by a spectator that follows the game at its
+    own pace. Buffers receive all notifications spectators receive.
+    """
+
+    hooks: frozenset    # the kinds of events collected, 'None' for all
+    events: List[Event]  # the events collected and not consumed yet
+
+    def __init__(self, hooks: frozenset = None):
+        """
+        hooks = None:
+        Names of the methods of UserAgent whose events are collected. 'None' for all.
+        """
+        self.hooks = hooks
+        self.events = []
+
+    def wants(self, hook: str) -> bool:
+        return self.hooks is None or hook in self.hooks
+
+    def record(self, hook: str, *args):
+        """
+        Appends an event.
+        """
+        self.events.append(Event(hook, args))
+
+    def drain(self) -> List[Event]:
+        """
+        Takes all events collected.
+
+        return:
+        The events in the order they have happened. The buffer is empty afterwards.
+        """
+        events = self.events
+        self.events = []
+        return events
+
+    def deliver(self, ua: UA):
+        """
+        Takes all events collected and calls the method of each on a user agent.
+        """
+        for hook, args in self.drain():
+            getattr(ua, hook)(*args)
+
+
+class _Listeners(dict):
+    """
+    The listeners of a bus by name of the method of UserAgent, looked up when first needed.
+    """
+
+    def __init__(self, bus: 'EventBus'):
+        super().__init__()
+        self.bus = bus
+
+    def __missing__(self, hook: str) -> List[Callable]:
+        listeners = self[hook] = self.bus.findListeners(hook)
+        return listeners
+
+
+class EventBus():
+    """
+    Delivers the notifications of a game. User agents are subscribed to the kinds of events whose methods they have
+    overridden only, see isListening(), so agents that do not listen cost nothing. The listeners of each kind are
+    looked up once and cached in self.listeners until the subscriptions change.
+    """
+
+    listeners: Dict[str, List[Callable]]  # everything to be called on an event by name of the method of UserAgent
+    _agents: List[UA]                     # the user agents subscribed
+    _buffers: List[EventBuffer]           # the event buffers subscribed
+
+    def __init__(self):
+        self.listeners = _Listeners(self)
+        self._agents = []
+        self._buffers = []
+
+    def setAgents(self, agents: List[UA]):
+        """
+        Subscribes the user agents given instead of the agents subscribed before.
+
+        agents:
+        The user agents. The list is copied.
+        """
+        self._agents = list(agents)
+        self.listeners.clear()
+
+    def addBuffer(self, hooks: frozenset = None) -> EventBuffer:
+        """
+        Subscribes a new event buffer.
+
+        hooks = None:
+        Names of the methods of UserAgent whose events are collected. 'None' for all.
+
+        return:
+        The buffer.
+        """
+        buffer = EventBuffer(hooks)
+        self._buffers.append(buffer)
+        self.listeners.clear()
+        return buffer
+
+    def removeBuffer(self, buffer: EventBuffer):
+        """
+        Unsubscribes an event buffer. The events collected remain in the buffer.
+        """
+        self._buffers.remove(buffer)
+        self.listeners.clear()
+
+    def findListeners(self, hook: str) -> List[Callable]:
+        """
+        Finds everything to be called on an event. Use self.listeners to get the result cached.
+
+        hook:
+        Name of the method of UserAgent.
+
+        return:
+        The bound methods of the user agents listening and the recorders of the buffers wanting the event.
+        """
+        listeners = [getattr(ua, hook) for ua in self._agents if isListening(ua, hook)]
+        return listeners + [partial(buffer.record, hook) for buffer in self._buffers if buffer.wants(hook)]
+
+    def publish(self, hook: str, *args):
+        """
+        Notifies all subscribers listening.
+
+        hook:
+        Name of the method of UserAgent to be called, e.g. 'notifyFolding'.
+
+        args:
+        Arguments passed to the method.
+        """
+        for listener in self.listeners[hook]:
+            listener(*args)
+
+    def notify(self, agents: List[UA], hook: str, *args):
+        """
+        Notifies some user agents and all buffers, e.g. of cards not everybody may see.
+
+        agents:
+        The user agents to be notified, if listening.
+
+        hook:
+        Name of the method of UserAgent to be called, e.g. 'notifyCardDealing'.
+
+        args:
+        Arguments passed to the method.
+        """
+        for ua in agents:
+            if isListening(ua, hook):
+                getattr(ua, hook)(*args)
+        for buffer in self._buffers:
+            if buffer.wants(hook):
+                buffer.record(hook, *args)
@@ -0,0 +1,48 @@
+from Player import Player
+from Pot import Pot
+from typing import List, NamedTuple, Tuple
+
+
+class GameSnapshot(NamedTuple):
+    """
+    The state of a game at some point of a hand, as taken by TexasHoldEmGame.snapshot(). It is immutable, so a
+    single snapshot can be restored any number of times, and snapshots share what has not changed in between,
+    like the players and their cards.
+    """
+
+    players: Tuple[Player, ...]          # the competing players in seating order
+    status: Tuple[int, ...]              # status of each player, see TableState
+    bets: Tuple[int, ...]                # bet of each player
+    stacks: Tuple[int, ...]              # stack of each player
+    yetUnasked: Tuple[bool, ...]         # has each player yet not been asked in the current betting interval?
+    pockets: Tuple[Tuple[int, ...], ...]  # pocket cards of each player
+    opens: Tuple[Tuple[int, ...], ...]   # open cards of each player
+    deck: tuple                          # state of the deck, see Croupier.getState()
+    comCards: Tuple[int, ...]            # community cards
+    pots: Tuple[Tuple[int, Tuple[Player, ...]], ...]  # betting level and eligible players of each pot
+    curBet: int                          # current height of the bet
+    dealIdx: int                         # index of the dealer
+    playIdx: int                         # index of the player in turn
+    raiser: Player                       # player who has raised last
+    handNum: int                         # number of the hand
+    sb: int                              # small blind
+    bb: int                              # big blind
+
+    @staticmethod
+    def packPots(pots: List[Pot]) -> Tuple[Tuple[int, Tuple[Player, ...]], ...]:
+        """
+        Converts pots into their immutable representation.
+        """
+        return tuple((pot.bet, tuple(pot.eligible)) for pot in pots)
+
+    @staticmethod
+    def unpackPots(pots: Tuple[Tuple[int, Tuple[Player, ...]], ...]) -> List[Pot]:
+        """
+        Converts the immutable representation of pots back into pots.
+        """
+        unpacked = []
+        for bet, eligible in pots:
+            pot = Pot(bet)
+            pot.eligible = list(eligible)
+            unpacked.append(pot)
+        return unpacked
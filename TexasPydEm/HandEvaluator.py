@@ -1,5 +1,12 @@
 import CardUtils as CU
-from typing import List, Tuple, Set
+import os
+import pickle
+from itertools import combinations, combinations_with_replacement
+from typing import Dict, List, Tuple, Set
+try:
+    import numpy as np
+except ImportError:
+    np = None  # batch evaluation is not available
 
 HIGH = 0
 PAIR = 1
@@ -49,17 +56,16 @@ def getSuitFreqs(cards: List[int]) -> List[int]:
 
 
 # return: hand value, combination value, kicker values
-def evaluateHand(cards: List[int]) -> Tuple[int]:
+def _evaluateHandDirect(cards: List[int]) -> Tuple[int]:
     """
-    Evaluates the rank of a hand.
+    Evaluates the rank of a hand by inspecting the cards directly. This is slow, but serves as the ground truth
+    the lookup tables behind evaluateHand() are built from.
 
     cards:
     The cards to be evaluated.
 
     return:
-    A tuple where the first entry is the rank. Each further entry represents the rank on
-    a less important criteria (pairs of tens or pairs of sevens?) with decreasing significance
-    (ending with the rank of kickers)
+    Same as evaluateHand().
     """
     flushLength = 5
     straighLength = 5
@@ -71,20 +77,22 @@ def evaluateHand(cards: List[int]) -> Tuple[int]:
     straightEnds = _checkStraigh(valFreqs)
     flushSuits = _checkFlushes(suitFreqs)
 
+    sfVal = -1
     if len(flushSuits) > 0 and len(straightEnds) > 0:
         sfVal = _checkStraightIsFlush(cards, straightEnds)
-        if sfVal >= 0:
-            combi = (STRAIGHFLUSH, sfVal, -1)
+
+    if sfVal >= 0:
+        combi = (STRAIGHFLUSH, sfVal, -1)
 
     elif len(fourVals) > 0:
         fourVal = max(fourVals)
         kickers = _getCardsOfOtherValue(cards, [fourVal])
-        print(kickers)
         combi = (FOUR_OAK, fourVal, kickers[0])
 
-    elif len(pairVals) > 0 and len(threeVals) > 0:
+    elif len(threeVals) > 0 and len(pairVals) + len(threeVals) > 1:
         threeVal = max(threeVals)
-        pairVal = max(pairVals)
+        # a second triplet serves as the pair
+        pairVal = max(pairVals + [val for val in threeVals if val != threeVal])
         combi = (FULLHOUSE, threeVal, pairVal)
 
     elif len(flushSuits) > 0:
@@ -130,6 +138,407 @@ def evaluateHand(cards: List[int]) -> Tuple[int]:
     return combi
 
 
+# _______________  lookup tables  _______________
+
+# file the lookup tables are cached in, so they need to be computed only once
+TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'HandEvaluator.tables')
+
+# number of entries of the hand evaluation tuple, including the rank, for each rank
+_HAND_LENGTHS = [6, 5, 4, 4, 3, 6, 3, 3, 3]
+# bits used for each entry of the hand evaluation tuple in the integer strength
+_SLOT_BITS = 4
+# number of entries after the rank in the integer strength
+_SLOTS = 5
+
+# per card summand of the hash key: 5^value in the lower 31 bits counts the values (up to four of a kind), and
+# a 4 bit wide counter per suit starting at 3 above sets its highest bit as soon as the suit appears five times
+_VALUE_BITS = 31
+_VALUE_MASK = (1 << _VALUE_BITS) - 1
+_SUIT_BIAS = sum(3 << (_VALUE_BITS + 4 * suit) for suit in range(4))
+_FLUSH_MASK = sum(8 << (_VALUE_BITS + 4 * suit) for suit in range(4))
+_CARD_KEYS = [5 ** CU.getCardValue(card) + (1 << (_VALUE_BITS + 4 * CU.getCardSuit(card))) for card in range(52)]
+_CARD_BITS = [1 << CU.getCardValue(card) for card in range(52)]
+
+# format of the tables cached in TABLE_FILE: the version, to be increased whenever the tables are computed in another
+# way, and the encoding of the keys and strengths they depend on; a cache of another format is rebuilt
+TABLE_VERSION = 1
+_TABLE_FORMAT = (TABLE_VERSION, _VALUE_BITS, _SUIT_BIAS, tuple(_CARD_KEYS), _SLOT_BITS, _SLOTS, tuple(_HAND_LENGTHS))
+
+_valueTable: Dict[int, int] = None  # maps the value part of the hash key to the strength of a hand without a flush
+_flushTable: Dict[int, int] = None  # maps a 13 bit mask of suited card values to the strength of the flush
+
+
+def handToStrength(hand: Tuple[int]) -> int:
+    """
+    Packs a hand evaluation result into a single integer. Comparing the integers of two results gives the same
+    answer as compareHands() on the results.
+
+    hand:
+    A *hand evaluation result* as returned by evaluateHand().
+
+    return:
+    The strength of the hand.
+    """
+    strength = hand[0]
+    for idx in range(1, _SLOTS + 1):
+        entry = hand[idx] + 1 if idx < len(hand) else 0
+        strength = (strength << _SLOT_BITS) | entry
+    return strength
+
+
+def strengthToHand(strength: int) -> Tuple[int]:
+    """
+    Unpacks an integer strength into the hand evaluation result it has been made from.
+
+    strength:
+    The strength as returned by evaluateStrength() or handToStrength().
+
+    return:
+    The *hand evaluation result*, same as evaluateHand() would have returned.
+    """
+    rank = strength >> (_SLOT_BITS * _SLOTS)
+    entries = [rank]
+    for idx in range(1, _HAND_LENGTHS[rank]):
+        entries.append(((strength >> (_SLOT_BITS * (_SLOTS - idx))) & 0xF) - 1)
+    return tuple(entries)
+
+
+def _buildTables() -> Tuple[Dict[int, int], Dict[int, int]]:
+    """
+    Computes the lookup tables for hands of five to seven cards by evaluating one representative hand for each
+    combination of card values and each suited combination with _evaluateHandDirect().
+
+    return:
+    The value table and the flush table.
+    """
+    valueTable = {}
+    for numCards in range(5, 8):
+        for values in combinations_with_replacement(range(13), numCards):
+            if max(values.count(val) for val in set(values)) > 4:
+                continue
+            # dealing the suits round robin never gives a flush
+            cards = [values[idx] + 13 * (idx % 4) for idx in range(numCards)]
+            valueTable[sum(5 ** val for val in values)] = handToStrength(_evaluateHandDirect(cards))
+
+    flushTable = {}
+    for numCards in range(5, 8):
+        for values in combinations(range(13), numCards):
+            # there is no room for a better hand besides a flush in seven cards, so the other suits do not matter
+            mask = sum(1 << val for val in values)
+            flushTable[mask] = handToStrength(_evaluateHandDirect(list(values)))
+    return valueTable, flushTable
+
+
+def loadTables(rebuild: bool = False):
+    """
+    Makes the lookup tables available. They are read from TABLE_FILE if possible, otherwise they are computed and
+    written to that file. A file written in another format, see TABLE_VERSION, is rebuilt. It is not necessary to
+    call this function, as the tables are loaded on first usage anyway.
+
+    rebuild = False:
+    Compute the tables even if they could be read from the file.
+    """
+    global _valueTable, _flushTable
+    tables = None
+    if not rebuild:
+        try:
+            with open(TABLE_FILE, 'rb') as file:
+                cached = pickle.load(file)
+            if isinstance(cached, tuple) and len(cached) == 3 and cached[0] == _TABLE_FORMAT:
+                tables = cached[1:]
+        except Exception:
+            tables = None  # unreadable or foreign, rebuilt like a file in another format
+    if tables is None:
+        tables = _buildTables()
+        try:
+            with open(TABLE_FILE, 'wb') as file:
+                pickle.dump((_TABLE_FORMAT,) + tables, file)
+        except OSError:
+            pass  # tables are just rebuilt next time
+    _valueTable, _flushTable = tables
+
+
+def cardsKey(cards: List[int]) -> int:
+    """
+    Computes the hash key the lookup tables are addressed with. Keys are additive: the key of some cards plus
+    the key of further cards is the key of all these cards together, minus cardsKey([]).
+
+    cards:
+    The cards.
+
+    return:
+    The hash key.
+    """
+    key = _SUIT_BIAS
+    for card in cards:
+        key += _CARD_KEYS[card]
+    return key
+
+
+def evaluateKey(key: int, cards: List[int]) -> int:
+    """
+    Evaluates the strength of a hand from its hash key. This allows for computing the keys incrementally when
+    many hands sharing some cards are evaluated.
+
+    key:
+    The hash key of the hand, see cardsKey().
+
+    cards:
+    The cards of the hand. These are only inspected if the hand contains a flush.
+
+    return:
+    Same as evaluateStrength().
+
+    raises:
+    Same as evaluateStrength().
+    """
+    if _valueTable is None:
+        loadTables()
+    flush = key & _FLUSH_MASK
+    if flush:
+        suit = (flush.bit_length() - _VALUE_BITS - 4) // 4
+        mask = 0
+        for card in cards:
+            if card // 13 == suit:
+                mask |= _CARD_BITS[card]
+        return _flushTable[mask]
+    try:
+        return _valueTable[key & _VALUE_MASK]
+    except KeyError:
+        raise ValueError('can only evaluate five to seven cards')
+
+
+def evaluateStrength(cards: List[int]) -> int:
+    """
+    Evaluates the strength of a hand of five to seven cards as a single integer by table lookup. The higher
+    the strength, the better the hand.
+
+    cards:
+    The cards to be evaluated.
+
+    return:
+    The strength of the hand. strengthToHand() turns it into the result of evaluateHand().
+
+    raises:
+    ValueError if there are less than five or more than seven cards.
+    """
+    key = _SUIT_BIAS
+    for card in cards:
+        key += _CARD_KEYS[card]
+    return evaluateKey(key, cards)
+
+
+def evaluateHand(cards: List[int]) -> Tuple[int]:
+    """
+    Evaluates the rank of a hand.
+
+    cards:
+    The cards to be evaluated. These are five to seven cards.
+
+    return:
+    A tuple where the first entry is the rank. Each further entry represents the rank on
+    a less important criteria (pairs of tens or pairs of sevens?) with decreasing significance
+    (ending with the rank of kickers)
+    """
+    return strengthToHand(evaluateStrength(cards))
+
+
+# _______________  batch evaluation  _______________
+
+_npCardKeys = None       # _CARD_KEYS as array
+_npCardBits = None       # _CARD_BITS as array
+_npValueKeys = None      # sorted keys of the value table
+_npValueStrengths = None  # strengths in the order of _npValueKeys
+_npFlushTable = None     # flush table as array indexed by the mask
+
+
+def _loadArrays():
+    """
+    Provides the lookup tables as NumPy arrays.
+    """
+    global _npCardKeys, _npCardBits, _npValueKeys, _npValueStrengths, _npFlushTable
+    if _valueTable is None:
+        loadTables()
+    _npCardKeys = np.array(_CARD_KEYS, dtype=np.int64)
+    _npCardBits = np.array(_CARD_BITS, dtype=np.int64)
+    keys = sorted(_valueTable)
+    _npValueKeys = np.array(keys, dtype=np.int64)
+    _npValueStrengths = np.array([_valueTable[key] for key in keys], dtype=np.int64)
+    _npFlushTable = np.zeros(1 << 13, dtype=np.int64)
+    for mask, strength in _flushTable.items():
+        _npFlushTable[mask] = strength
+
+
+def evaluateHands(cards) -> 'np.ndarray':
+    """
+    Evaluates the strengths of many hands at once. Requires NumPy.
+
+    cards:
+    Array-like of shape (N, M) with M ranging from 5 to 7. Each row holds the cards of one hand.
+
+    return:
+    Array of shape (N,) with the strength of each hand, same as evaluateStrength() returns for each row.
+
+    raises:
+    ImportError if NumPy is not available. ValueError if there are less than five or more than seven cards per hand,
+    or if a hand holds a card twice.
+    """
+    if np is None:
+        raise ImportError('evaluateHands() requires numpy')
+    if _npCardKeys is None:
+        _loadArrays()
+    cards = np.asarray(cards, dtype=np.intp)
+    if cards.ndim != 2 or cards.shape[1] < 5 or cards.shape[1] > 7:
+        raise ValueError('can only evaluate five to seven cards')
+
+    keys = _npCardKeys[cards].sum(axis=1) + _SUIT_BIAS
+    strengths = np.empty(len(cards), dtype=np.int64)
+
+    flushBits = keys & _FLUSH_MASK
+    isFlush = flushBits != 0
+    noFlush = ~isFlush
+
+    values = keys[noFlush] & _VALUE_MASK
+    # searching sorted keys is way more cache friendly
+    order = np.argsort(values)
+    found = np.empty_like(order)
+    found[order] = np.searchsorted(_npValueKeys, values[order])
+    np.minimum(found, len(_npValueKeys) - 1, out=found)
+    invalid = _npValueKeys[found] != values
+    if invalid.any():
+        raise ValueError('hands %s hold a card twice' % np.flatnonzero(noFlush)[invalid].tolist())
+    strengths[noFlush] = _npValueStrengths[found]
+
+    if isFlush.any():
+        flushCards = cards[isFlush]
+        # there is a single flush bit per hand, the suit follows from its position
+        suits = (np.log2(flushBits[isFlush]).astype(np.intp) - _VALUE_BITS - 3) // 4
+        suited = (flushCards // 13) == suits[:, np.newaxis]
+        bits = _npCardBits[flushCards] * suited
+        masks = bits.sum(axis=1)
+        invalid = np.bitwise_or.reduce(bits, axis=1) != masks
+        if invalid.any():
+            raise ValueError('hands %s hold a card twice' % np.flatnonzero(isFlush)[invalid].tolist())
+        strengths[isFlush] = _npFlushTable[masks]
+    return strengths
+
+
+# _______________  bit masks  _______________
+
+# number of set bits in each 13 bit wide suit mask
+_POPCOUNT = [bin(mask).count('1') for mask in range(1 << CU.SUIT_BITS)]
+
+
+def _straightEnd(values: int) -> int:
+    """
+    Finds the highest straight in a mask of card values.
+
+    values:
+    13 bit wide mask where bit v is set if a card of value v is present.
+
+    return:
+    Value of the last card of the highest straight, or -1 if there is no straight.
+    """
+    # shift by one and put the ace to the bottom, too, so that bit v+1 stands for value v
+    ext = (values << 1) | (values >> 12)
+    runs = ext & (ext >> 1) & (ext >> 2) & (ext >> 3) & (ext >> 4)
+    if runs:
+        return runs.bit_length() + 2
+    return -1
+
+
+def _appendTopValues(strength: int, values: int, num: int) -> int:
+    """
+    Appends the highest values of a mask to a hand strength.
+
+    strength:
+    The strength so far.
+
+    values:
+    13 bit wide mask of card values.
+
+    num:
+    How many values are to be appended, in descending order.
+
+    return:
+    The extended strength.
+    """
+    for _ in range(num):
+        top = values.bit_length() - 1
+        values ^= 1 << top
+        strength = (strength << _SLOT_BITS) | (top + 1)
+    return strength
+
+
+def evaluateMask(mask: int) -> int:
+    """
+    Evaluates the strength of a hand of five to seven cards given as card mask, see CardUtils.cardsToMask(). All
+    hand ranks are detected by bit operations on the four suit masks.
+
+    mask:
+    The card mask of the hand.
+
+    return:
+    The strength of the hand, same as evaluateStrength() on the cards of the mask returns.
+    """
+    clubs = mask & CU.SUIT_MASK
+    diamonds = (mask >> CU.SUIT_BITS) & CU.SUIT_MASK
+    hearts = (mask >> (2 * CU.SUIT_BITS)) & CU.SUIT_MASK
+    spades = mask >> (3 * CU.SUIT_BITS)
+
+    flush = 0
+    for suited in (clubs, diamonds, hearts, spades):
+        if _POPCOUNT[suited] >= 5:
+            flush = suited
+    if flush:
+        end = _straightEnd(flush)
+        if end >= 0:
+            return (((STRAIGHFLUSH << _SLOT_BITS) | (end + 1)) << (_SLOT_BITS * (_SLOTS - 1)))
+
+    values = clubs | diamonds | hearts | spades
+    twoPlus = (clubs & diamonds) | (hearts & spades) | ((clubs | diamonds) & (hearts | spades))
+    threePlus = (clubs & diamonds & (hearts | spades)) | (hearts & spades & (clubs | diamonds))
+    four = clubs & diamonds & hearts & spades
+
+    if four:
+        strength = _appendTopValues(FOUR_OAK, four, 1)
+        strength = _appendTopValues(strength, values & ~four, 1)
+        return strength << (_SLOT_BITS * (_SLOTS - 2))
+
+    if threePlus and _POPCOUNT[twoPlus] >= 2:
+        three = 1 << (threePlus.bit_length() - 1)
+        strength = _appendTopValues(FULLHOUSE, three, 1)
+        strength = _appendTopValues(strength, twoPlus & ~three, 1)
+        return strength << (_SLOT_BITS * (_SLOTS - 2))
+
+    if flush:
+        return _appendTopValues(FLUSH, flush, 5)
+
+    end = _straightEnd(values)
+    if end >= 0:
+        return (((STRAIGHT << _SLOT_BITS) | (end + 1)) << (_SLOT_BITS * (_SLOTS - 1)))
+
+    if threePlus:
+        strength = _appendTopValues(THREE_OAK, threePlus, 1)
+        strength = _appendTopValues(strength, values & ~threePlus, 2)
+        return strength << (_SLOT_BITS * (_SLOTS - 3))
+
+    numPairs = _POPCOUNT[twoPlus]
+    if numPairs >= 2:
+        high = 1 << (twoPlus.bit_length() - 1)
+        low = 1 << ((twoPlus ^ high).bit_length() - 1)
+        strength = _appendTopValues(TWOPAIR, twoPlus, 2)
+        strength = _appendTopValues(strength, values & ~(high | low), 1)
+        return strength << (_SLOT_BITS * (_SLOTS - 3))
+
+    if numPairs == 1:
+        strength = _appendTopValues(PAIR, twoPlus, 1)
+        strength = _appendTopValues(strength, values & ~twoPlus, 3)
+        return strength << (_SLOT_BITS * (_SLOTS - 4))
+
+    return _appendTopValues(HIGH, values, 5)
+
+
 def compareHands(hand: Tuple[int], against: Tuple[int]) -> int:
     """
     Checks how good one hand is in comparison to another.
@@ -0,0 +1,269 @@
+import json
+from UserAgent import UserAgent as UA
+from typing import Dict, IO, Iterator, List, Tuple
+
+# kinds of actions in a hand record, the index in ACTIONS is the code stored
+SMALL_BLIND = 0
+BIG_BLIND = 1
+FOLD = 2
+CHECK = 3
+CALL = 4
+RAISE = 5
+LAST_PENNY = 6  # calling with less than needed, see TexasHoldEmGame.checkBilance()
+ALL_IN = 7
+ACTIONS = ('sb', 'bb', 'fold', 'check', 'call', 'raise', 'lastPenny', 'allIn')
+# kinds of actions that are decisions of a player, i.e. the reaction to demandBet()
+DECISIONS = frozenset([FOLD, CHECK, CALL, RAISE, LAST_PENNY])
+
+# encoder of the lines written, without spaces
+_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+
+class HandRecord():
+    """
+    What happened in a single hand, as seen by a spectator. Players are referred to by their seat, i.e. their index
+    in self.names.
+    """
+
+    handNum: int                         # number of the hand in the recording, starting at 0
+    names: List[str]                     # names of the players in seating order
+    stacks: List[int]                    # stack of each player at the begin of the hand
+    dealIdx: int                         # seat of the dealer
+    pockets: List[List[int]]             # pocket cards of each player
+    actions: List[Tuple[int, int, int]]  # seat, kind (see ACTIONS), and bet of the player after each action
+    board: List[int]                     # community cards
+    streets: List[int]                   # number of actions before the flop, the turn, and the river were dealt
+    shown: List[int]                     # seats of the players revealing their cards in the showdown
+    wins: List[Tuple[int, int]]          # seat and gross win of each winner
+    out: List[int]                       # seats of the players eliminated
+
+    def __init__(self, handNum: int = 0):
+        self.handNum = handNum
+        self.names = []
+        self.stacks = []
+        self.dealIdx = 0
+        self.pockets = []
+        self.actions = []
+        self.board = []
+        self.streets = []
+        self.shown = []
+        self.wins = []
+        self.out = []
+
+    def toDict(self) -> dict:
+        """
+        Gets the record as a dictionary of plain values, for example for writing it as JSON.
+        """
+        return {'hand': self.handNum, 'names': self.names, 'stacks': self.stacks, 'dealer': self.dealIdx,
+                'pockets': self.pockets, 'actions': self.actions, 'board': self.board, 'streets': self.streets,
+                'shown': self.shown, 'wins': self.wins, 'out': self.out}
+
+    @staticmethod
+    def fromDict(values: dict) -> 'HandRecord':
+        """
+        Creates a record from a dictionary as returned by toDict().
+        """
+        record = HandRecord(values['hand'])
+        record.names = values['names']
+        record.stacks = values['stacks']
+        record.dealIdx = values['dealer']
+        record.pockets = values['pockets']
+        record.actions = [tuple(action) for action in values['actions']]
+        record.board = values['board']
+        record.streets = values['streets']
+        record.shown = values['shown']
+        record.wins = [tuple(win) for win in values['wins']]
+        record.out = values['out']
+        return record
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, HandRecord) and self.toDict() == other.toDict()
+
+
+class JsonHistoryWriter():
+    """
+    Writes hand records as lines of JSON to a stream. Lines are collected and written in batches.
+    """
+
+    stream: IO[str]    # where the records are written to
+    flushEvery: int    # number of hands written at once
+    _ownsStream: bool  # has the stream been opened by the writer?
+    _lines: List[str]  # lines not written yet
+
+    def __init__(self, target, flushEvery: int = 1000):
+        """
+        target:
+        A text stream, or the path of a file the records are appended to.
+
+        flushEvery = 1000:
+        Number of hands written and flushed at once.
+        """
+        if isinstance(target, str):
+            self.stream = open(target, 'a')
+            self._ownsStream = True
+        else:
+            self.stream = target
+            self._ownsStream = False
+        self.flushEvery = flushEvery
+        self._lines = []
+
+    def encode(self, hand: HandRecord) -> str:
+        """
+        Converts a record into the line written to the stream.
+        """
+        return _ENCODER.encode(hand.toDict()) + '\n'
+
+    def writeHand(self, hand: HandRecord):
+        """
+        Collects a record, and writes the records collected when there are enough.
+        """
+        self._lines.append(self.encode(hand))
+        if len(self._lines) >= self.flushEvery:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the lines collected and flushes the stream.
+        """
+        if self._lines:
+            self.stream.write(''.join(self._lines))
+            self._lines = []
+        self.stream.flush()
+
+    def close(self):
+        """
+        Writes the lines collected, and closes the file if it has been opened by the writer.
+        """
+        self.flush()
+        if self._ownsStream:
+            self.stream.close()
+
+
+class HandHistoryRecorder(UA):
+    """
+    A spectator recording each hand and passing the record to a writer, by default a JsonHistoryWriter. Only the hand
+    going on is kept by the recorder itself. Add it to a game by TexasHoldEmGame.addSpectator().
+    """
+
+    writer: object          # what the records are passed to, see JsonHistoryWriter
+    numHands: int           # number of hands recorded
+    _hand: HandRecord       # the hand going on, 'None' between hands
+    _seats: Dict[int, int]  # seat of each player in the hand going on by id of the player
+
+    def __init__(self, target, name: str = 'Recorder', flushEvery: int = 1000):
+        """
+        target:
+        A writer with the methods of JsonHistoryWriter, like BinaryHistoryWriter, or a text stream or the path of
+        a file for a JsonHistoryWriter.
+
+        name = 'Recorder':
+        Name of the spectator.
+
+        flushEvery = 1000:
+        Number of hands written and flushed at once by a JsonHistoryWriter.
+        """
+        super().__init__(name)
+        self.writer = target if hasattr(target, 'writeHand') else JsonHistoryWriter(target, flushEvery)
+        self.numHands = 0
+        self._hand = None
+        self._seats = {}
+
+    def flush(self):
+        """
+        Writes the records collected by the writer.
+        """
+        self.writer.flush()
+
+    def close(self):
+        """
+        Closes the writer.
+        """
+        self.writer.close()
+
+    def __enter__(self) -> 'HandHistoryRecorder':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # _______________ notifications _______________
+
+    def notifyBeginOfHand(self, dealer):
+        players = self.players
+        hand = self._hand = HandRecord(self.numHands)
+        self._seats = {id(pl): seat for seat, pl in enumerate(players)}
+        hand.names = [pl.name for pl in players]
+        hand.stacks = [pl.stack for pl in players]
+        hand.dealIdx = self._seats[id(dealer)]
+        hand.pockets = [[] for _ in players]
+
+    def notifyCardDealing(self, player):
+        if self._hand is not None:
+            self._hand.pockets[self._seats[id(player)]] = list(player.pockets)
+
+    def _act(self, player, kind: int):
+        if self._hand is not None:
+            self._hand.actions.append((self._seats[id(player)], kind, player.bet))
+
+    def notifySmallBlind(self, player):
+        self._act(player, SMALL_BLIND)
+
+    def notifyBigBlind(self, player):
+        self._act(player, BIG_BLIND)
+
+    def notifyFolding(self, player):
+        self._act(player, FOLD)
+
+    def notifyCheck(self, player):
+        self._act(player, CHECK)
+
+    def notifyRaise(self, player):
+        self._act(player, RAISE)
+
+    def notifyCall(self, player):
+        self._act(player, CALL)
+
+    def notifyLastPenny(self, player):
+        self._act(player, LAST_PENNY)
+
+    def notifyAllIn(self, player):
+        self._act(player, ALL_IN)
+
+    def notifyCommunityCards(self, cards: List[int]):
+        if self._hand is not None:
+            self._hand.board = list(cards)
+            self._hand.streets.append(len(self._hand.actions))
+
+    def revealAllCards(self, player):
+        if self._hand is not None:
+            self._hand.shown.append(self._seats[id(player)])
+
+    def notifyPotWin(self, player, win: int):
+        if self._hand is not None:
+            self._hand.wins.append((self._seats[id(player)], win))
+
+    def notifyElimination(self, player):
+        if self._hand is not None:
+            self._hand.out.append(self._seats[id(player)])
+
+    def notifyEndOfHand(self):
+        if self._hand is not None:
+            self.writer.writeHand(self._hand)
+            self.numHands += 1
+            self._hand = None
+            self._seats = {}
+
+
+def readHistory(path: str) -> Iterator[HandRecord]:
+    """
+    Reads the records written by a HandHistoryRecorder.
+
+    path:
+    Path of the file.
+
+    return:
+    Generator of the records in the order they have been written.
+    """
+    with open(path) as file:
+        for line in file:
+            yield HandRecord.fromDict(json.loads(line))
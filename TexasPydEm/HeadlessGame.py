@@ -0,0 +1,24 @@
+from TexasHoldEmGame import TexasHoldEmGame
+from Croupier import PooledCroupier
+
+
+class HeadlessGame(TexasHoldEmGame):
+    """
+    A game for bots only, tuned for playing as many hands per second as possible: there are no pauses. The course
+    of the game is the same as in TexasHoldEmGame, unless the decks are taken from a pool.
+    """
+
+    def __init__(self, seed: int = None, pooledDecks: bool = False):
+        """
+        seed = None:
+        Seed of all random numbers of the game, see TexasHoldEmGame.
+
+        pooledDecks = False:
+        Take the decks from a pool generated in bulk, see PooledCroupier. This requires NumPy.
+        """
+        super().__init__(seed)
+        if pooledDecks:
+            self.croupier = PooledCroupier(self.rng.substream('deal'))
+
+    def pause(self, seconds: float):
+        pass
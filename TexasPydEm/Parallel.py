@@ -0,0 +1,102 @@
+from multiprocessing import Pool
+from random import Random
+from typing import Callable, Dict, List
+try:
+    import numpy as np
+except ImportError:
+    np = None  # seeds are derived with the random module
+
+
+def spawnSeeds(seed: int, num: int) -> List[int]:
+    """
+    Derives seeds for independent random streams from a single seed. The same seed always gives the same seeds.
+
+    seed:
+    The root seed. 'None' gives different seeds each time.
+
+    num:
+    Number of seeds needed.
+
+    return:
+    List of 'num' seeds.
+    """
+    if np is not None:
+        children = np.random.SeedSequence(seed).spawn(num)
+        return [int(child.generate_state(2, np.uint64)[0]) for child in children]
+    rnd = Random(seed)
+    return [rnd.getrandbits(64) for _ in range(num)]
+
+
+def mapShards(task: Callable, shards: List[tuple], workers: int = None, chunkSize: int = 1) -> List:
+    """
+    Calls a task once for each shard of work, using a pool of processes. The results come in the order of the
+    shards no matter which process has been done first, so merging them is deterministic.
+
+    task:
+    The task. It needs to be picklable, i.e. a function defined at the top level of a module.
+
+    shards:
+    The arguments of each call of the task.
+
+    workers = None:
+    Number of processes. 'None' uses as many processes as there are cores. For a single worker, the tasks are
+    executed in this process without any pool.
+
+    chunkSize = 1:
+    Number of shards handed over to a process at once.
+
+    return:
+    List of the results of each call of the task.
+    """
+    if workers == 1 or len(shards) <= 1:
+        return [task(*shard) for shard in shards]
+    with Pool(workers) as pool:
+        return pool.starmap(task, shards, chunksize=chunkSize)
+
+
+def _playGame(makeGame: Callable, seed: int) -> Dict[str, int]:
+    """
+    Plays a single game in a worker process.
+
+    makeGame:
+    Creates the game, including the players, when called with the seed.
+
+    seed:
+    Seed of the game, passed on to TexasHoldEmGame().
+
+    return:
+    Final stack of each player remaining, by name.
+    """
+    game = makeGame(seed)
+    stacks = game.runGame()
+    return {pl.name: stack for pl, stack in stacks.items()}
+
+
+def runGames(makeGame: Callable, numGames: int, seed: int = None, workers: int = None,
+             chunkSize: int = 1) -> List[Dict[str, int]]:
+    """
+    Plays many games of Texas Hold'em, distributed over several processes. Each game gets its own seed, so the
+    results do not depend on the number of workers.
+
+    makeGame:
+    Creates a game that is ready to run, i.e., with all players added, when called with the seed of the game,
+    which it passes on to TexasHoldEmGame(). Needs to be picklable, like a function defined at the top level of a
+    module.
+
+    numGames:
+    Number of games played.
+
+    seed = None:
+    Root seed of the seeds of each game. 'None' gives different results each time.
+
+    workers = None:
+    Number of processes, see mapShards().
+
+    chunkSize = 1:
+    Number of games handed over to a process at once.
+
+    return:
+    For each game in order, the final stack of each remaining player by name.
+    """
+    seeds = spawnSeeds(seed, numGames)
+    return mapShards(_playGame, [(makeGame, gameSeed) for gameSeed in seeds], workers, chunkSize)
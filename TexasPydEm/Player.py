@@ -1,30 +1,67 @@
 from UserAgent import UserAgent
+from TableState import TableState, INACTIVE, ELIGIBLE, ACTIVE
 from typing import List
 
 
 class Player(UserAgent):
 
     FOLD = -1
-    _INACTIVE = 0
-    _ELIGIBLE = 1
-    _ACTIVE = 2
 
     opens: List[int]    # player's open cards
     pockets: List[int]  # player's concealed cards
-    stack: int          # number of chips the player owns and that have not been betted
-    bet: int            # number of chips the player is betting in the current hand
-    active: bool        # DEPRECATED (replaced by __status)
+    active: bool        # DEPRECATED (replaced by the status of the seat)
     # has the player yet *not* been asked for action in the current betting interval
     yetUnasked: bool
-    __status: int       # status when playing a hand: active, eligible, or inactive
+    # the table state holding the player's status when playing a hand (active, eligible, or inactive), bet, and
+    # stack. A player not seated at a game has a table of her/his own.
+    _table: TableState
+    _seat: int          # index of the player's seat in self._table
 
     def __init__(self, name):
         super().__init__(name)
         self.opens = []
         self.pockets = []
-        self.bet = 0
-        self.stack = 0
-        self.__status = Player._ACTIVE
+        self.yetUnasked = False
+        self._table = TableState()
+        self._seat = self._table.addSeat()
+
+    def sitAt(self, table: TableState, seat: int = None):
+        """
+        Moves the player to a seat at a table.
+
+        table:
+        The table state the player gets a seat in.
+
+        seat = None:
+        Index of an existing seat the player takes over, including its state. 'None' adds a new seat, taking along
+        the player's status, bet, and stack.
+        """
+        if seat is None:
+            seat = table.addSeat(self._table.status[self._seat], self.bet, self.stack)
+        self._table = table
+        self._seat = seat
+
+    @property
+    def stack(self) -> int:
+        """
+        Number of chips the player owns and that have not been betted.
+        """
+        return self._table.stacks[self._seat]
+
+    @stack.setter
+    def stack(self, value: int):
+        self._table.stacks[self._seat] = value
+
+    @property
+    def bet(self) -> int:
+        """
+        Number of chips the player is betting in the current hand.
+        """
+        return self._table.bets[self._seat]
+
+    @bet.setter
+    def bet(self, value: int):
+        self._table.setBet(self._seat, value)
 
     def isActive(self):
         """
@@ -33,7 +70,7 @@ class Player(UserAgent):
         return:
         Is this player active?
         """
-        return self.__status == Player._ACTIVE
+        return self._table.status[self._seat] == ACTIVE
 
     def isEligible(self):
         """
@@ -43,14 +80,14 @@ class Player(UserAgent):
         return:
         Is this player eligible?
         """
-        return self.__status == Player._ELIGIBLE or self.__status == Player._ACTIVE
+        return self._table.status[self._seat] != INACTIVE
 
     def setActive(self):
         """
         A player is active when he/she is still actively participating in playing a hand. ACTIVE players are also
         ELIGIBLE.
         """
-        self.__status = Player._ACTIVE
+        self._table.setStatus(self._seat, ACTIVE)
 
     def setEligibleOnly(self):
         """
@@ -59,7 +96,7 @@ class Player(UserAgent):
 
         This method sets this player's status to ELIGIBLE. Note that this player won't be ACTIVE anymore.
         """
-        self.__status = Player._ELIGIBLE
+        self._table.setStatus(self._seat, ELIGIBLE)
 
     def setInactive(self):
         """
@@ -68,7 +105,7 @@ class Player(UserAgent):
 
         This method sets this player's status to INACTIVE.
         """
-        self.__status = Player._INACTIVE
+        self._table.setStatus(self._seat, INACTIVE)
 
     def getOpenCards(self) -> List[int]:
         return self.opens
@@ -87,7 +124,7 @@ class Player(UserAgent):
         self.clearAllCards()
         self.bet = 0
         self.active = True
-        self.__status = Player._ACTIVE
+        self._table.setStatus(self._seat, ACTIVE)
 
     def incBet(self, value: int):
         """
@@ -98,11 +135,14 @@ class Player(UserAgent):
         Number of chips to become at stakes now. Passing a negative number indeed "unbets" the chips and puts them back
         to the player's stack. Thsi could lead to a negative bet.
         """
-        self.bet += value
-        self.stack -= value
-        if (self.stack < 0):
-            self.bet += self.stack
-            self.stack = 0
+        table = self._table
+        seat = self._seat
+        stack = table.stacks[seat] - value
+        if stack < 0:
+            value += stack
+            stack = 0
+        table.stacks[seat] = stack
+        table.setBet(seat, table.bets[seat] + value)
 
     def demandBet(self, demand: int, minRaiseValue: int, potSize: int) -> int:
         """
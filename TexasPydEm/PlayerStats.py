@@ -0,0 +1,298 @@
+from UserAgent import UserAgent as UA
+from HandHistory import HandRecord, DECISIONS, SMALL_BLIND, BIG_BLIND, FOLD, CHECK, CALL, RAISE, LAST_PENNY, ALL_IN
+from typing import Dict, Iterable, List, Tuple
+
+_COUNTERS = ('hands', 'voluntary', 'preflopRaises', 'threeBetChances', 'threeBets', 'aggressive', 'passive',
+             'sawFlop', 'showdowns', 'wonShowdowns', 'net')
+
+
+class PlayerStats():
+    """
+    Counters of the play of a single player. The usual statistics are derived from them as properties.
+    """
+
+    __slots__ = _COUNTERS
+
+    hands: int            # number of hands dealt
+    voluntary: int        # hands putting chips into the pot before the flop without being forced to
+    preflopRaises: int    # hands raising before the flop
+    threeBetChances: int  # hands facing a single raise before the flop
+    threeBets: int        # hands re-raising a single raise before the flop
+    aggressive: int       # bets and raises after the flop
+    passive: int          # calls after the flop
+    sawFlop: int          # hands seeing the flop
+    showdowns: int        # hands going to the showdown
+    wonShowdowns: int     # showdowns winning chips
+    net: int              # chips won minus chips bet
+
+    def __init__(self):
+        for counter in _COUNTERS:
+            setattr(self, counter, 0)
+
+    def toDict(self) -> Dict[str, int]:
+        """
+        Gets the counters as a dictionary.
+        """
+        return {counter: getattr(self, counter) for counter in _COUNTERS}
+
+    @staticmethod
+    def fromDict(values: Dict[str, int]) -> 'PlayerStats':
+        """
+        Creates statistics from a dictionary as returned by toDict().
+        """
+        stats = PlayerStats()
+        for counter in _COUNTERS:
+            setattr(stats, counter, values[counter])
+        return stats
+
+    @property
+    def vpip(self) -> float:
+        """
+        Share of hands voluntarily putting chips into the pot before the flop.
+        """
+        return self.voluntary / self.hands if self.hands > 0 else 0.0
+
+    @property
+    def pfr(self) -> float:
+        """
+        Share of hands raising before the flop.
+        """
+        return self.preflopRaises / self.hands if self.hands > 0 else 0.0
+
+    @property
+    def threeBet(self) -> float:
+        """
+        Share of re-raises when facing a single raise before the flop.
+        """
+        return self.threeBets / self.threeBetChances if self.threeBetChances > 0 else 0.0
+
+    @property
+    def aggression(self) -> float:
+        """
+        Bets and raises per call after the flop, infinite for a player never calling but betting.
+        """
+        if self.passive > 0:
+            return self.aggressive / self.passive
+        return float('inf') if self.aggressive > 0 else 0.0
+
+    @property
+    def wtsd(self) -> float:
+        """
+        Share of hands going to the showdown when having seen the flop.
+        """
+        return self.showdowns / self.sawFlop if self.sawFlop > 0 else 0.0
+
+    @property
+    def wsd(self) -> float:
+        """
+        Share of showdowns winning chips.
+        """
+        return self.wonShowdowns / self.showdowns if self.showdowns > 0 else 0.0
+
+    @property
+    def netPerHand(self) -> float:
+        """
+        Mean number of chips won per hand, negative for a losing player. This is the actual result, not the chip EV:
+        the luck of all-in hands is not taken out.
+        """
+        return self.net / self.hands if self.hands > 0 else 0.0
+
+
+class StatsAggregator(UA):
+    """
+    A spectator keeping the statistics of each player, see PlayerStats. The counters are updated by each action, so
+    a bot can look up the statistics of its opponents at any time. Live notifications and recorded hands pass the
+    same actions through the same code. Add it to a game by
+    TexasHoldEmGame.addSpectator(), or pass recorded hands to addHand(). Players are told apart by name.
+    """
+
+    stats: Dict[str, PlayerStats]                 # statistics of each player by name
+    numHands: int                                 # number of hands counted
+    snapshotEvery: int                            # number of hands between snapshots, 0 for none
+    snapshots: List[Tuple[int, Dict[str, dict]]]  # number of hands counted and snapshot() after each period
+    _hand: List[PlayerStats]                      # statistics of each seat in the hand going on, 'None' between hands
+    _seats: Dict[int, int]                        # seat of each player in the hand going on by id of the player
+    _street: int                                  # number of dealings of community cards in the hand going on
+    _raises: int                                  # number of raises before the flop
+    _bets: List[int]                              # bet of each seat
+    _wins: List[int]                              # gross win of each seat
+    _folded: List[bool]                           # has the seat folded?
+    _shown: List[bool]                            # has the seat revealed its cards in the showdown?
+    _counted: List[set]                           # counters of each seat increased at most once per hand
+
+    def __init__(self, name: str = 'Stats', snapshotEvery: int = 0):
+        """
+        name = 'Stats':
+        Name of the spectator.
+
+        snapshotEvery = 0:
+        Number of hands between snapshots of the statistics, 0 for none.
+        """
+        super().__init__(name)
+        self.stats = {}
+        self.numHands = 0
+        self.snapshotEvery = snapshotEvery
+        self.snapshots = []
+        self._hand = None
+        self._seats = {}
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Gets the counters of each player, see PlayerStats.toDict().
+        """
+        return {name: stats.toDict() for name, stats in self.stats.items()}
+
+    def addHand(self, hand: HandRecord):
+        """
+        Counts a recorded hand.
+
+        raises:
+        ValueError if the streets of the record do not fit its board.
+        """
+        if len(hand.streets) != max(0, len(hand.board) - 2):
+            raise ValueError('streets of hand %d do not fit the board' % hand.handNum)
+        self._beginHand(hand.names)
+        streets = hand.streets
+        street = 0
+        for idx, (seat, kind, bet) in enumerate(hand.actions):
+            while street < len(streets) and streets[street] == idx:
+                self._nextStreet()
+                street += 1
+            self._act(seat, kind, bet)
+        for _ in range(street, len(streets)):
+            self._nextStreet()
+        for seat in hand.shown:
+            self._show(seat)
+        for seat, win in hand.wins:
+            self._win(seat, win)
+        self._endHand()
+
+    def addHands(self, hands: Iterable[HandRecord]):
+        """
+        Counts recorded hands, e.g. read by readHistory() or a BinaryHistoryReader, see addHand().
+        """
+        for hand in hands:
+            self.addHand(hand)
+
+    # _______________ counting _______________
+
+    def _beginHand(self, names: List[str]):
+        stats = self.stats
+        hand = self._hand = []
+        for name in names:
+            if name not in stats:
+                stats[name] = PlayerStats()
+            hand.append(stats[name])
+            stats[name].hands += 1
+        numSeats = len(names)
+        self._street = 0
+        self._raises = 0
+        self._bets = [0] * numSeats
+        self._wins = [0] * numSeats
+        self._folded = [False] * numSeats
+        self._shown = [False] * numSeats
+        self._counted = [set() for _ in names]
+
+    def _countOnce(self, seat: int, counter: str):
+        counted = self._counted[seat]
+        if counter not in counted:
+            counted.add(counter)
+            stats = self._hand[seat]
+            setattr(stats, counter, getattr(stats, counter) + 1)
+
+    def _act(self, seat: int, kind: int, bet: int):
+        self._bets[seat] = bet
+        if kind == FOLD:
+            self._folded[seat] = True
+        if self._street == 0:
+            if kind in DECISIONS:
+                if kind != FOLD and kind != CHECK:
+                    self._countOnce(seat, 'voluntary')
+                if self._raises == 1:
+                    self._countOnce(seat, 'threeBetChances')
+                if kind == RAISE:
+                    self._countOnce(seat, 'preflopRaises')
+                    if self._raises == 1:
+                        self._countOnce(seat, 'threeBets')
+                    self._raises += 1
+        elif kind == RAISE:
+            self._hand[seat].aggressive += 1
+        elif kind in (CALL, LAST_PENNY):
+            self._hand[seat].passive += 1
+
+    def _nextStreet(self):
+        if self._street == 0:
+            for stats, folded in zip(self._hand, self._folded):
+                if not folded:
+                    stats.sawFlop += 1
+        self._street += 1
+
+    def _show(self, seat: int):
+        if not self._shown[seat]:
+            self._shown[seat] = True
+            self._hand[seat].showdowns += 1
+
+    def _win(self, seat: int, win: int):
+        self._wins[seat] += win
+        if self._shown[seat]:
+            self._countOnce(seat, 'wonShowdowns')
+
+    def _endHand(self):
+        for stats, bet, win in zip(self._hand, self._bets, self._wins):
+            stats.net += win - bet
+        self._hand = None
+        self.numHands += 1
+        if self.snapshotEvery > 0 and self.numHands % self.snapshotEvery == 0:
+            self.snapshots.append((self.numHands, self.snapshot()))
+
+    # _______________ notifications _______________
+
+    def notifyBeginOfHand(self, dealer):
+        players = self.players
+        self._seats = {id(pl): seat for seat, pl in enumerate(players)}
+        self._beginHand([pl.name for pl in players])
+
+    def _actLive(self, player, kind: int):
+        if self._hand is not None:
+            self._act(self._seats[id(player)], kind, player.bet)
+
+    def notifySmallBlind(self, player):
+        self._actLive(player, SMALL_BLIND)
+
+    def notifyBigBlind(self, player):
+        self._actLive(player, BIG_BLIND)
+
+    def notifyFolding(self, player):
+        self._actLive(player, FOLD)
+
+    def notifyCheck(self, player):
+        self._actLive(player, CHECK)
+
+    def notifyRaise(self, player):
+        self._actLive(player, RAISE)
+
+    def notifyCall(self, player):
+        self._actLive(player, CALL)
+
+    def notifyLastPenny(self, player):
+        self._actLive(player, LAST_PENNY)
+
+    def notifyAllIn(self, player):
+        self._actLive(player, ALL_IN)
+
+    def notifyCommunityCards(self, cards: List[int]):
+        if self._hand is not None:
+            self._nextStreet()
+
+    def revealAllCards(self, player):
+        if self._hand is not None:
+            self._show(self._seats[id(player)])
+
+    def notifyPotWin(self, player, win: int):
+        if self._hand is not None:
+            self._win(self._seats[id(player)], win)
+
+    def notifyEndOfHand(self):
+        if self._hand is not None:
+            self._endHand()
+            self._seats = {}
@@ -2,5 +2,5 @@ from Player import Player
 
 class AlwaysCallPlayer(Player):
 
-    def demandBet(self, demand: int, minRaiseValue) -> int:
-        return demand
\ No newline at end of file
+    def demandBet(self, demand: int, minRaiseValue: int, potSize: int) -> int:
+        return demand
@@ -1,5 +1,4 @@
 from Player import Player
-from random import randint
 
 
 class FullyRandomPlayer(Player):
@@ -17,10 +16,10 @@ class FullyRandomPlayer(Player):
             opts.append(FullyRandomPlayer.CHECK)
 
         # choose an option
-        dice = randint(0, len(opts)-1)
+        dice = self.rng.randint(0, len(opts)-1)
         opt = opts[dice]
         if opt == FullyRandomPlayer.RAISE:
-            dice = randint(minRaiseValue, round(
+            dice = self.rng.randint(minRaiseValue, round(
                 1.025 * (self.stack + self.bet)))
             return dice
         elif opt == FullyRandomPlayer.CHECK:
@@ -1,31 +1,13 @@
 from Player import Player as Pl
-import CardUtils as CU
-from random import randint, random
+from random import Random
 from typing import List
 from copy import copy
 import HandEvaluator as HE
+import Preflop as PF
 
 
 class SimpleAIPlayer(Pl):
 
-    # estimate of the strength of any pair of pocket cards. Upper right half are suitaed cards and
-    # lower right are off-suited cards
-    _pocketStrength = [
-        [100, 100,  90,  90,  80,  60,  60,  60,  60,  60,  60,  60,  60],  # A
-        [90, 100,  90,  80,  70,  50,  40,  40,  40,  40,  40,  40,  40],   # K
-        [80,  70, 100,  80,  70,  60,  40,   0,   0,   0,   0,   0,   0],   # Q
-        [70,  60,  60, 100,  80,  70,  50,  30,   0,   0,   0,   0,   0],   # J
-        [50,  50,  50,  60,  90,  70,  60,  40,   0,   0,   0,   0,   0],   # T
-        [30,  30,  30,  40,  40,  80,  70,  60,  30,   0,   0,   0,   0],   # 9
-        [0,   0,   0,  30,  30,  40,  70,  60,  50,  30,   0,   0,   0],    # 8
-        [0,   0,   0,   0,   0,   0,  30,  60,  60,  40,  30,   0,   0],    # 7
-        [0,   0,   0,   0,   0,   0,   0,  30,  50,  60,  40,   0,   0],    # 6
-        [0,   0,   0,   0,   0,   0,   0,   0,  30,  40,  40,  30,   0],    # 5
-        [0,   0,   0,   0,   0,   0,   0,   0,   0,  30,  40,  40,  30],    # 4
-        [0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  40,  30],    # 3
-        [0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  40]     # 2
-    ]
-
     # subtracted from playing probabilities, rendering the player tighter or looser
     _tightness: int
     _coms: List[int]  # community cards
@@ -41,10 +23,20 @@ class SimpleAIPlayer(Pl):
 
     def __init__(self, name):
         super().__init__(name)
-        self._tightness = randint(-25, 25)
-        self._bluffiness = randint(1, 30)
-        self._usePotOdds = randint(0, 1) == 1
-        self._calcAccuracy = random() * 0.05
+        self._drawCharacter()
+
+    def setRng(self, rng: Random):
+        super().setRng(rng)
+        self._drawCharacter()
+
+    def _drawCharacter(self):
+        """
+        Randomly sets tightness, bluffiness, and the use of pot odds.
+        """
+        self._tightness = self.rng.randint(-25, 25)
+        self._bluffiness = self.rng.randint(1, 30)
+        self._usePotOdds = self.rng.randint(0, 1) == 1
+        self._calcAccuracy = self.rng.random() * 0.05
 
     def notifyBeginOfHand(self, dealer):
         self._coms = []
@@ -66,26 +58,15 @@ class SimpleAIPlayer(Pl):
     # _______________ evaluate pocket cards _______________
 
     def _preFlopBet(self, demand: int, minRaiseValue: int) -> int:
-        threshold = self._getPocketStrength() + randint(-3, 3)
-        dice = randint(0, 99)
+        threshold = self._getPocketStrength() + self.rng.randint(-3, 3)
+        dice = self.rng.randint(0, 99)
         return self._getBet(demand, minRaiseValue, threshold, dice)
 
     def _getPocketStrength(self) -> int:
-        highVal = CU.getCardValue(self.pockets[0])
-        lowVal = CU.getCardValue(self.pockets[1])
-        if (lowVal < highVal):
-            aux = highVal
-            highVal = lowVal
-            lowVal = aux
-
-        highVal = len(self._pocketStrength) - highVal - 1
-        lowVal = len(self._pocketStrength) - lowVal - 1
-
-        if CU.getCardSuit(self.pockets[0]) != CU.getCardSuit(self.pockets[1]):
-            pktStr = self._pocketStrength[lowVal][highVal]
-        else:
-            pktStr = self._pocketStrength[highVal][lowVal]
-
+        opponents = len([pl for pl in self.players if pl.isEligible() and pl is not self])
+        opponents = min(max(opponents, 1), PF.MAX_OPPONENTS)
+        # squaring leaves only the top half of the starting hands a good chance of being played
+        pktStr = round(100 * PF.getPreflopRank(self.pockets, opponents) ** 2)
         return pktStr - self._tightness
 
     # _______________  evaluate post flop hands  _______________
@@ -100,17 +81,17 @@ class SimpleAIPlayer(Pl):
         outThreshold = 0
         if self._usePotOdds:
             outs = self._getOuts(cards, hand[0])
-            improveProp = len(outs) / 52 - len(cards)
-            improveProp += 2 * self._calcAccuracy * random() - self._calcAccuracy
+            improveProp = len(outs) / (52 - len(cards))
+            improveProp += 2 * self._calcAccuracy * self.rng.random() - self._calcAccuracy
             improveProp = max(improveProp, 0)
             potShare = demand / (potSize + demand - self.bet)
-            potShare += 2 * self._calcAccuracy * random() - self._calcAccuracy
+            potShare += 2 * self._calcAccuracy * self.rng.random() - self._calcAccuracy
             potShare = max(potShare, 0)
             if improveProp > potShare:
                 outThreshold = 100
         # decide
         threshold = max(rankThreshold, outThreshold)
-        dice = randint(0, 13 * HE.STRAIGHFLUSH + 12)
+        dice = self.rng.randint(0, 13 * HE.STRAIGHFLUSH + 12)
         return self._getBet(demand, minRaiseValue, threshold, dice)
 
     def _getOuts(self, cards, handRank):
@@ -174,7 +155,7 @@ class SimpleAIPlayer(Pl):
         """
         if threshold < self._bluffing:
             threshold = self._bluffing
-            self._bluffing += 20 + randint(-3, 3)
+            self._bluffing += 20 + self.rng.randint(-3, 3)
 
         if dice >= threshold:
             return -1  # fold
@@ -186,5 +167,5 @@ class SimpleAIPlayer(Pl):
         if own < minRaiseValue:
             return own  # call / check
 
-        betNow = randint(minRaiseValue, own)
+        betNow = self.rng.randint(minRaiseValue, own)
         return betNow
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+import CardUtils as CU
+import Equity as EQ
+import os
+import sys
+from array import array
+from typing import List
+
+# file the preflop equities are shipped in
+TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'PreflopEquity.bin')
+# the table covers one to this many opponents
+MAX_OPPONENTS = 9
+# number of classes of starting hands: 13 pairs, 78 suited and 78 offsuited combinations of values
+NUM_CLASSES = 169
+# equities are stored as unsigned 16 bit integers, this is the value of an equity of 1
+_SCALE = 0xFFFF
+
+_equities: List[List[float]] = None  # equity of each class for each number of opponents
+_ranks: List[List[float]] = None     # share of starting hands with lower equity, likewise
+
+
+def getClass(pockets: List[int]) -> int:
+    """
+    Gets the class of a starting hand. Starting hands that differ only by the suits, but are both suited or both
+    offsuited, have the same chances and thus are of the same class. Classes are numbered like the cells of a
+    13x13 matrix, where the entry in row i and column j stands for values i and j, suited if i > j and offsuited
+    otherwise.
+
+    pockets:
+    The two pocket cards.
+
+    return:
+    The class, from 0 to 168.
+    """
+    high = max(CU.getCardValue(pockets[0]), CU.getCardValue(pockets[1]))
+    low = min(CU.getCardValue(pockets[0]), CU.getCardValue(pockets[1]))
+    if CU.getCardSuit(pockets[0]) == CU.getCardSuit(pockets[1]):
+        return high * 13 + low
+    return low * 13 + high
+
+
+def _combos(handClass: int) -> int:
+    """
+    Number of different starting hands in a class.
+    """
+    row, col = divmod(handClass, 13)
+    if row == col:
+        return 6
+    return 4 if row > col else 12
+
+
+def _loadTable():
+    """
+    Reads the table from TABLE_FILE and derives the ranks of the starting hands.
+    """
+    global _equities, _ranks
+    values = array('H')
+    with open(TABLE_FILE, 'rb') as file:
+        values.fromfile(file, MAX_OPPONENTS * NUM_CLASSES)
+    if sys.byteorder == 'big':
+        values.byteswap()  # the file is little endian
+    equities = [[values[opp * NUM_CLASSES + cls] / _SCALE for cls in range(NUM_CLASSES)]
+                for opp in range(MAX_OPPONENTS)]
+    ranks = []
+    total = sum(_combos(cls) for cls in range(NUM_CLASSES))
+    for opp in range(MAX_OPPONENTS):
+        order = sorted(range(NUM_CLASSES), key=lambda cls: equities[opp][cls])
+        rank = [0.0] * NUM_CLASSES
+        below = 0
+        for cls in order:
+            rank[cls] = below / total
+            below += _combos(cls)
+        ranks.append(rank)
+    _equities, _ranks = equities, ranks
+
+
+def getPreflopEquity(pockets: List[int], opponents: int) -> float:
+    """
+    Looks up the equity of a starting hand against opponents with random pocket cards.
+
+    pockets:
+    The two pocket cards.
+
+    opponents:
+    Number of opponents, from 1 to MAX_OPPONENTS.
+
+    return:
+    The expected share of the pot, see Equity.Equity.
+    """
+    if _equities is None:
+        _loadTable()
+    return _equities[opponents - 1][getClass(pockets)]
+
+
+def getPreflopRank(pockets: List[int], opponents: int) -> float:
+    """
+    Looks up how a starting hand compares to all other starting hands against opponents with random pocket cards.
+
+    pockets:
+    The two pocket cards.
+
+    opponents:
+    Number of opponents, from 1 to MAX_OPPONENTS.
+
+    return:
+    Share of all starting hands with a lower equity, ranging from 0 for the worst to almost 1 for the best hand.
+    """
+    if _ranks is None:
+        _loadTable()
+    return _ranks[opponents - 1][getClass(pockets)]
+
+
+def buildTable(rollouts: int = 20000, seed: int = 0, workers: int = None):
+    """
+    Computes the equity of each class of starting hands by simulation and writes them to TABLE_FILE.
+
+    rollouts = 20000:
+    Number of rollouts per class and number of opponents.
+
+    seed = 0:
+    Root seed of the simulations.
+
+    workers = None:
+    Number of processes, see Parallel.mapShards(). The rollouts are sharded into chunks of a fixed size, so the
+    table does not depend on the number of workers.
+    """
+    values = array('H')
+    for opponents in range(1, MAX_OPPONENTS + 1):
+        for cls in range(NUM_CLASSES):
+            row, col = divmod(cls, 13)
+            # a representative of the class: clubs and, if offsuited, diamonds
+            pockets = [row, col] if row > col else [row, col + 13]
+            equity = EQ.monteCarloEquity(pockets, opponents=opponents, rollouts=rollouts,
+                                         seed=seed + (opponents - 1) * NUM_CLASSES + cls,
+                                         workers=workers, chunkSize=5000)
+            values.append(round(equity.equity * _SCALE))
+    if sys.byteorder == 'big':
+        values.byteswap()
+    with open(TABLE_FILE, 'wb') as file:
+        values.tofile(file)
+
+
+if __name__ == '__main__':
+    buildTable()
@@ -0,0 +1,181 @@
+from Croupier import Croupier
+from HeadlessGame import HeadlessGame
+from Player import Player
+from HandHistory import HandRecord, HandHistoryRecorder, DECISIONS, FOLD
+from typing import Iterable, Iterator, List
+
+
+class ScriptedCroupier(Croupier):
+    """
+    A croupier dealing the cards of a given deck in order, see setDeck().
+    """
+
+    _deck: List[int]  # the cards dealt in the next hand, in order
+
+    def __init__(self):
+        super().__init__()
+        self._deck = list(range(52))
+
+    def setDeck(self, cards: List[int]):
+        """
+        Sets the cards dealt in the next hand. The deck is completed by all cards missing, in order.
+
+        cards:
+        The cards in the order they are drawn.
+        """
+        missing = sorted(set(range(52)).difference(cards))
+        self._deck = list(cards) + missing
+
+    def shuffleForHand(self, rng, handNum: int):
+        # the cards left are drawn from the end of self.cards
+        self.cards = self._deck[::-1]
+        self.numLeft = len(self.cards)
+
+    def drawCards(self, numCards: int) -> List[int]:
+        left = self.numLeft
+        picks = min(max(0, numCards), left)
+        self.numLeft = left - picks
+        drawn = self.cards[left - picks:left]
+        drawn.reverse()
+        return drawn
+
+
+class ScriptedPlayer(Player):
+    """
+    A player repeating recorded decisions in order.
+    """
+
+    script: List[int]  # the bets returned by demandBet(), see Player.demandBet()
+    _next: int         # index of the next decision in the script
+
+    def __init__(self, name: str, script: List[int]):
+        super().__init__(name)
+        self.script = script
+        self._next = 0
+
+    def demandBet(self, demand: int, minRaiseValue: int, potSize: int) -> int:
+        """
+        raises:
+        RuntimeError if the player is asked more often than recorded.
+        """
+        if self._next >= len(self.script):
+            raise RuntimeError('replay of ' + self.name + ' ran out of decisions')
+        bet = self.script[self._next]
+        self._next += 1
+        return bet
+
+
+class Replayer():
+    """
+    Replays recorded hands in a HeadlessGame, each on its own: the players are seated with the stacks recorded at
+    the begin of the hand, the cards are dealt as recorded, and each player repeats their recorded decisions. The
+    course of the replay is recorded again, so it can be compared with the recording, see verify().
+    """
+
+    smallBlind: int                # the small blind the hands have been played with
+    game: HeadlessGame             # the game replaying the hands
+    recorder: HandHistoryRecorder  # spectator recording the replays
+
+    def __init__(self, smallBlind: int = 250):
+        """
+        smallBlind = 250:
+        The small blind the hands have been played with. The big blind is twice as high.
+        """
+        self.smallBlind = smallBlind
+        self.game = HeadlessGame(0)
+        self.game.croupier = ScriptedCroupier()
+        self.game.sb = smallBlind
+        self.game.bb = 2 * smallBlind
+        self.recorder = HandHistoryRecorder(_LastHand())
+        self.game.spectators = [self.recorder]
+
+    @staticmethod
+    def dealOrder(hand: HandRecord) -> List[int]:
+        """
+        Gets the cards of a hand in the order they have been drawn: the pocket cards beginning with the player left
+        to the dealer, then the community cards.
+        """
+        numSeats = len(hand.names)
+        cards = []
+        for idx in range(1, numSeats + 1):
+            cards.extend(hand.pockets[(hand.dealIdx + idx) % numSeats])
+        return cards + list(hand.board)
+
+    @staticmethod
+    def scripts(hand: HandRecord) -> List[List[int]]:
+        """
+        Gets the decisions of each player of a hand as bets returned by demandBet().
+        """
+        scripts = [[] for _ in hand.names]
+        for seat, kind, bet in hand.actions:
+            if kind in DECISIONS:
+                scripts[seat].append(-1 if kind == FOLD else bet)
+        return scripts
+
+    def replay(self, hand: HandRecord) -> HandRecord:
+        """
+        Replays a hand.
+
+        hand:
+        The recorded hand.
+
+        return:
+        The record of the replay. Its hand number is that of the recorded hand.
+
+        raises:
+        RuntimeError if a player is asked more often than recorded.
+        """
+        game = self.game
+        players = [ScriptedPlayer(name, script) for name, script in zip(hand.names, self.scripts(hand))]
+        game.players = players
+        for pl, stack in zip(players, hand.stacks):
+            pl.stack = stack
+        game.croupier.setDeck(self.dealOrder(hand))
+        game.dealIdx = hand.dealIdx
+        game.handNum = hand.handNum
+
+        self.recorder.numHands = hand.handNum
+        game.uas = players + game.spectators
+        game.userAgentsChanged()
+        game.broadcast('setPlayers', game.players)
+        game.finishHand(game.playAHand())
+        return self.recorder.writer.last
+
+    def verify(self, hands: Iterable[HandRecord]) -> Iterator[HandRecord]:
+        """
+        Replays hands and compares each replay with its recording.
+
+        hands:
+        The recorded hands, e.g. read by readHistory() or a BinaryHistoryReader.
+
+        return:
+        Generator of the hands whose replay differs from the recording, or fails with any exception, e.g. because
+        the record is corrupt.
+        """
+        for hand in hands:
+            try:
+                differs = self.replay(hand) != hand
+            except Exception:
+                differs = True
+            if differs:
+                yield hand
+
+
+class _LastHand():
+    """
+    A writer keeping just the last record written, see JsonHistoryWriter.
+    """
+
+    last: HandRecord
+
+    def __init__(self):
+        self.last = None
+
+    def writeHand(self, hand: HandRecord):
+        self.last = hand
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
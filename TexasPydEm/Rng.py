@@ -0,0 +1,62 @@
+import random
+from hashlib import blake2b
+from random import Random
+
+# the generator behind the functions of the random module, used where no other generator has been injected
+GLOBAL_RNG: Random = random.random.__self__
+
+
+def streamSeed(rootSeed: int, *path) -> int:
+    """
+    Derives the seed of a substream. The seed depends on nothing but the root seed and the path, so a substream
+    can be recreated without drawing any numbers from other streams first.
+
+    rootSeed:
+    The seed of the table or run.
+
+    path:
+    Names and counters identifying the substream, e.g. 'hand', 17.
+
+    return:
+    A 64 bit seed.
+    """
+    key = repr((rootSeed,) + path).encode()
+    return int.from_bytes(blake2b(key, digest_size=8).digest(), 'little')
+
+
+class Rng(Random):
+    """
+    A random generator that is a substream of a root seed. It has all methods of random.Random, whose
+    implementation in C is the fastest generator for single numbers available in Python, and can branch off
+    independent substreams, e.g. one per hand or per agent.
+    """
+
+    rootSeed: int  # the seed all substreams derive from
+    path: tuple    # identifies this stream among the substreams of the root seed
+
+    def __init__(self, rootSeed: int = None, *path):
+        """
+        rootSeed = None:
+        The root seed. 'None' draws one from GLOBAL_RNG, so seeding the random module still makes runs
+        reproducible.
+
+        path:
+        Identifies the stream, see streamSeed().
+        """
+        if rootSeed is None:
+            rootSeed = GLOBAL_RNG.getrandbits(64)
+        self.rootSeed = rootSeed
+        self.path = path
+        super().__init__(streamSeed(rootSeed, *path))
+
+    def substream(self, *path) -> 'Rng':
+        """
+        Branches off a substream. It does not draw numbers from this stream.
+
+        path:
+        Identifies the substream below this stream, e.g. 'hand', 17.
+
+        return:
+        The substream, always the same for the same path.
+        """
+        return Rng(self.rootSeed, *(self.path + path))
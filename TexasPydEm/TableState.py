@@ -0,0 +1,89 @@
+from typing import List
+
+INACTIVE = 0  # has folded or does not take part in the hand
+ELIGIBLE = 1  # is all in, may still win a (side) pot
+ACTIVE = 2    # is still actively playing the hand
+
+
+class TableState():
+    """
+    The state of the players at a table in parallel arrays, one entry per seat: status, bet, and stack. The number
+    of active and eligible players and the pot size, i.e. the sum of all bets, are maintained along with every
+    change, so they can be looked up without scanning the seats. Players are views on a seat, see Player.
+    """
+
+    status: List[int]  # status of each seat: INACTIVE, ELIGIBLE, or ACTIVE
+    bets: List[int]    # bet of each seat in the current hand
+    stacks: List[int]  # stack of each seat
+    numActive: int     # number of seats with status ACTIVE
+    numEligible: int   # number of seats with status ELIGIBLE or ACTIVE
+    potSize: int       # sum of all bets
+
+    def __init__(self):
+        self.status = []
+        self.bets = []
+        self.stacks = []
+        self.numActive = 0
+        self.numEligible = 0
+        self.potSize = 0
+
+    def addSeat(self, status: int = ACTIVE, bet: int = 0, stack: int = 0) -> int:
+        """
+        Adds a seat to the table.
+
+        status = ACTIVE, bet = 0, stack = 0:
+        Initial state of the seat.
+
+        return:
+        Index of the new seat.
+        """
+        self.status.append(INACTIVE)
+        self.bets.append(0)
+        self.stacks.append(stack)
+        seat = len(self.status) - 1
+        self.setStatus(seat, status)
+        self.setBet(seat, bet)
+        return seat
+
+    def setStatus(self, seat: int, status: int):
+        """
+        Sets the status of a seat and updates the counters.
+        """
+        old = self.status[seat]
+        self.status[seat] = status
+        self.numActive += (status == ACTIVE) - (old == ACTIVE)
+        self.numEligible += (status != INACTIVE) - (old != INACTIVE)
+
+    def setBet(self, seat: int, bet: int):
+        """
+        Sets the bet of a seat and updates the pot size.
+        """
+        self.potSize += bet - self.bets[seat]
+        self.bets[seat] = bet
+
+    def setAll(self, status: List[int], bets: List[int], stacks: List[int]):
+        """
+        Replaces the state of all seats at once and recounts the counters.
+
+        status, bets, stacks:
+        The new state of each seat. The sequences are copied.
+        """
+        self.status = list(status)
+        self.bets = list(bets)
+        self.stacks = list(stacks)
+        self.numActive = self.status.count(ACTIVE)
+        self.numEligible = len(self.status) - self.status.count(INACTIVE)
+        self.potSize = sum(self.bets)
+
+    def copy(self) -> 'TableState':
+        """
+        Copies the state. The copy is independent of this state, but there are no players viewing it.
+        """
+        state = TableState()
+        state.status = self.status[:]
+        state.bets = self.bets[:]
+        state.stacks = self.stacks[:]
+        state.numActive = self.numActive
+        state.numEligible = self.numEligible
+        state.potSize = self.potSize
+        return state
@@ -1,13 +1,18 @@
 from Croupier import Croupier
 from UserAgent import UserAgent as UA
 import Localization as Loc
-from random import randint
+from random import Random
+from Rng import Rng
 import CardUtils as CU
 from time import sleep
 from typing import List, Dict, Tuple
 from Player import Player
 from copy import copy
 from Pot import Pot
+from TableState import TableState, ACTIVE
+from GameSnapshot import GameSnapshot
+from EventBus import EventBus
+from DecisionClock import DecisionClock
 import HandEvaluator as HE
 
 
@@ -17,8 +22,11 @@ class TexasHoldEmGame():
     IN_GAME = 1
     __MAX_PLAYERS = 10
 
-    players: List[Player]  # the competing players
+    _players: List[Player]  # the competing players, see self.players
+    table: TableState      # status, bet, and stack of the competing players, in the order of self.players
     spectators: List[UA]   # a throng of allknowing spectators
+    bus: EventBus          # delivers the notifications to the user agents in self.uas
+    clock: DecisionClock   # bounds and records the duration of decisions, 'None' for no bounds
     sb: int                # current small blind
     bb: int                # current big blind
     startStack: int        # stack size at begin
@@ -27,8 +35,9 @@ class TexasHoldEmGame():
     raiser: int            # player has raised last - DEPRECATED (unused)
     curBet: int            # current height of bet
     comCards: List[int]    # community cards
-    pots: List[Pot]        # pot and side pots
-    potSize: int           # current pot size
+    pots: List[Pot]        # pot and side pots, built by evaluatePots(), main pot first
+    handNum: int           # number of the current hand in the game, starting at 0
+    rng: Random            # random generator of the table, the root of the streams of each hand and agent
     # the game exits if all of the players in the list have been eliminated. 'None' deactivates this
     # criterion.
     playersNeeded: List[Player]
@@ -38,13 +47,28 @@ class TexasHoldEmGame():
     # a long sleeping interval. Useful when human players are participating.
     longSleep: float
 
-    def __init__(self):
+    def __init__(self, seed: int = None):
+        """
+        seed = None:
+        Seed of all random numbers of the game: seating, cards, and the decisions of agents using their
+        generator set by setRng(). 'None' draws a seed from the random module.
+        """
         self.state = self.PRE_GAME
         self.shortSleep = -1
         self.longSleep = -1
-        self.croupier = Croupier()
+        self.rng = Rng(seed, 'table')
+        self.croupier = Croupier(self.rng.substream('deal'))
+        self.handNum = 0
+        self.dealIdx = 0
+        self.playIdx = 0
+        self.raiser = None
+        self.curBet = 0
+        self.comCards = []
+        self.pots = []
         self.players = []
         self.spectators = []
+        self.bus = EventBus()
+        self.clock = None
         self.sb = 250
         self.bb = 2*self.sb
         self.startStack = 20*self.bb
@@ -53,24 +77,97 @@ class TexasHoldEmGame():
 
     # _______________ pre game _______________
 
+    @property
+    def players(self) -> List[Player]:
+        """
+        The competing players. Whenever the list has been changed in place, self.seatPlayers() needs to be called.
+        """
+        return self._players
+
+    @players.setter
+    def players(self, players: List[Player]):
+        self._players = players
+        self.seatPlayers()
+
+    def seatPlayers(self):
+        """
+        Seats the players at a new table state in the order of self.players. The state of each player is kept.
+        """
+        self.table = TableState()
+        for pl in self._players:
+            pl.sitAt(self.table)
+
+    @property
+    def potSize(self) -> int:
+        """
+        Current pot size, i.e. the sum of all bets in the current hand.
+        """
+        return self.table.potSize
+
     def addPlayer(self, player):
         if self.state != TexasHoldEmGame.PRE_GAME:
             raise RuntimeError(Loc.getString(Loc.GAME_HAS_STARTED))
 
-        if len(self.players) >= TexasHoldEmGame.__MAX_PLAYERS:
+        if len(self._players) >= TexasHoldEmGame.__MAX_PLAYERS:
             raise RuntimeError(Loc.getString(Loc.TABLE_IS_FULL))
 
         if not isinstance(player, Player):
             raise RuntimeError(Loc.getString(Loc.NOT_AN_USERAGENT))
 
-        if player in self.players or player in self.spectators:
+        if player in self._players or player in self.spectators:
             raise RuntimeError(Loc.getString(Loc.NAME_GIVEN))
 
-        pos = randint(0, len(self.players))
-        self.players.insert(pos, player)
+        pos = self.rng.randint(0, len(self._players))
+        self._players.insert(pos, player)
+        self.seatPlayers()
+        player.setRng(self.rng.substream('agent', player.name))
 
     # _______________ in game _______________
 
+    def broadcast(self, hook: str, *args):
+        """
+        Notifies all user agents by calling the same method on each of them that overrides it, see EventBus.
+
+        hook:
+        Name of the method of UserAgent to be called, e.g. 'notifyFolding'.
+
+        args:
+        Arguments passed to the method.
+        """
+        for listener in self.bus.listeners[hook]:
+            listener(*args)
+
+    def notifyAgents(self, agents: List[UA], hook: str, *args):
+        """
+        Notifies some user agents by calling the same method on each of them that overrides it, see EventBus.
+
+        agents:
+        The user agents to be notified.
+
+        hook:
+        Name of the method of UserAgent to be called, e.g. 'notifyCardDealing'.
+
+        args:
+        Arguments passed to the method.
+        """
+        self.bus.notify(agents, hook, *args)
+
+    def userAgentsChanged(self):
+        """
+        Called whenever the list of user agents to be notified, self.uas, has changed. Subscribes them to the bus.
+        """
+        self.bus.setAgents(self.uas)
+
+    def pause(self, seconds: float):
+        """
+        Pauses the game for a moment, so that humans can follow.
+
+        seconds:
+        Duration of the pause. Non-positive values mean no pause at all.
+        """
+        if seconds > 0:
+            sleep(seconds)
+
     def getActivePlayers(self) -> List[Player]:
         """
         Returns the list of players still actively participating in the current hand. These are players that have
@@ -79,7 +176,7 @@ class TexasHoldEmGame():
         return:
         Players actively participating in the current hand.
         """
-        activePlayers = list(filter(lambda pl: pl.isActive(), self.players))
+        activePlayers = list(filter(lambda pl: pl.isActive(), self._players))
         return activePlayers
 
     def hasSeveralActives(self) -> bool:
@@ -90,7 +187,7 @@ class TexasHoldEmGame():
         return:
         more than one player is active?
         """
-        return len(self.getActivePlayers()) > 1
+        return self.table.numActive > 1
 
     def getEligiblePlayers(self) -> List[Player]:
         """
@@ -101,7 +198,7 @@ class TexasHoldEmGame():
         return:
         List of players that are to be considered when the pots are distributed.
         """
-        return list(filter(lambda pl: pl.isEligible(), self.players))
+        return list(filter(lambda pl: pl.isEligible(), self._players))
 
     def hasSeveralEligibles(self) -> bool:
         """
@@ -111,7 +208,7 @@ class TexasHoldEmGame():
         return:
         More than one player eligible for a win?
         """
-        return len(self.getEligiblePlayers()) > 1
+        return self.table.numEligible > 1
 
     def getActiveRightToDealer(self) -> Player:
         """
@@ -123,8 +220,8 @@ class TexasHoldEmGame():
         raises:
         RuntimeError when no player is active.
         """
-        for idx in range(len(self.players)):
-            pl = self.players[(self.dealIdx + 1 - idx) % len(self.players)]
+        for idx in range(len(self._players)):
+            pl = self._players[(self.dealIdx + 1 - idx) % len(self._players)]
             if pl.isActive():
                 return pl
         raise RuntimeError('no active players')
@@ -139,15 +236,17 @@ class TexasHoldEmGame():
         return:
         New value of self.playIndex, i.e., the index of the player who's turn it is now, or NONE.
         """
-        self.playIdx = (oldIdx + 1) % len(self.players)
-        while not self.players[self.playIdx].isActive():
-            self.playIdx = (self.playIdx + 1) % len(self.players)
+        status = self.table.status
+        numPlayers = len(status)
+        self.playIdx = (oldIdx + 1) % numPlayers
+        while status[self.playIdx] != ACTIVE:
+            self.playIdx = (self.playIdx + 1) % numPlayers
             if self.playIdx == oldIdx:
-                if self.players[self.playIdx].isActive():
+                if status[self.playIdx] == ACTIVE:
                     break
                 else:
                     return None
-        return self.players[self.playIdx]
+        return self._players[self.playIdx]
 
     def deactivatePlayer(self, player: Player, eligible: bool):
         """
@@ -174,29 +273,29 @@ class TexasHoldEmGame():
         """
         highCard = -1
         highPlayer: UA
-        for pl in self.players:
+        for pl in self._players:
             cards = self.croupier.drawCards(1)
             drawn = cards[0]
             if CU.isHigherCard(drawn, highCard):
                 highCard = drawn
                 highPlayer = pl
             pl.opens = cards
-            [ua.notifyCardDealing(pl) for ua in self.uas]
-        return self.players.index(highPlayer)
+            self.broadcast('notifyCardDealing', pl)
+        return self._players.index(highPlayer)
 
     def fold(self, player: Player):
         """
         Sets the player inactive and notifies all user agents.
         """
         player.setInactive()
-        [ua.notifyFolding(player) for ua in self.uas]
+        self.broadcast('notifyFolding', player)
 
     def check(self, player: Player, verbose: bool = True):
         """
         If and only if verbose is set, notifies all user agents. Does nothing else.
         """
         if verbose:
-            [ua.notifyCheck(player) for ua in self.uas]
+            self.broadcast('notifyCheck', player)
 
     def raiseBet(self, player: Player, verbose: bool = True):
         """
@@ -206,40 +305,13 @@ class TexasHoldEmGame():
         self.raiser = player
         self.curBet = player.bet
         if verbose:
-            [ua.notifyRaise(player) for ua in self.uas]
-
-    def addPlayerToPot(self, players: List[Player], bet: int):
-        """
-        Adds the given players to the (side) pot created at the given value of 'bet'. If no such pot exists, a new pot
-        becomes opened for the players.
-
-        players:
-        List of players to be added as eligible for winning the pot.
-
-        bet:
-        Betting level for the pot.
-        """
-        # look for an already existing pot that has been formed at this betting valuee
-        alreadyAside = list(filter(lambda pot: pot.bet == bet, self.pots))
-        if len(alreadyAside) == 0:
-            # open new side pot
-            sidePot = Pot(bet)
-            # the original list might be used elsewhere, so just a copy here
-            sidePot.eligible = copy(players)
-            self.pots.append(sidePot)
-        else:
-            # join the existing pot
-            # there can't be more than one side pot with the same value of bet as player has due
-            #     to the way we construct new pots
-            alreadyAside[0].eligible += players
+            self.broadcast('notifyRaise', player)
 
     def allIn(self, player: Player):
         """
-        Adds the player to the list of players eligible to the current pot (which may become a side pot)
-        and notifies all user agents.
+        Notifies all user agents that the player is all in. The side pots are built when the pots are evaluated.
         """
-        self.addPlayerToPot([player], player.bet)
-        [ua.notifyAllIn(player) for ua in self.uas]
+        self.broadcast('notifyAllIn', player)
 
     def dealPocketCards(self, numCards: int = 2):
         """
@@ -248,11 +320,12 @@ class TexasHoldEmGame():
         numCards:
         Number of cards dealt to each player.
         """
-        for idx in list(range(1, 1+len(self.players))):
-            self.playIdx = (self.dealIdx + idx) % len(self.players)
-            player = self.players[self.playIdx]
-            cards = self.croupier.drawCards(numCards)
-            player.pockets = cards
+        numPlayers = len(self._players)
+        cards = self.croupier.drawCards(numCards * numPlayers)
+        for idx in list(range(1, 1+numPlayers)):
+            self.playIdx = (self.dealIdx + idx) % numPlayers
+            player = self._players[self.playIdx]
+            player.pockets = cards[(idx - 1) * numCards:idx * numCards]
 
     def dealCommunityCards(self, numCards: int):
         """
@@ -262,9 +335,8 @@ class TexasHoldEmGame():
         Number of cards to be drawn.
         """
         self.comCards += self.croupier.drawCards(numCards)
-        [ua.notifyCommunityCards(self.comCards) for ua in self.uas]
-        if (self.shortSleep > 0):
-            sleep(2 * self.shortSleep)
+        self.broadcast('notifyCommunityCards', self.comCards)
+        self.pause(2 * self.shortSleep)
 
     def announceWins(self, wins: Dict[Player, int]):
         """
@@ -274,7 +346,7 @@ class TexasHoldEmGame():
         A dictonary that maps the players who have won something to the number of chips the have won in this hand.
         """
         for winner, win in wins.items():
-            [ua.notifyPotWin(winner, win) for ua in self.uas]
+            self.broadcast('notifyPotWin', winner, win)
 
     def allSevenCards(self, player: Player) -> List[int]:
         """
@@ -300,15 +372,14 @@ class TexasHoldEmGame():
             raise ValueError('determining best hand of anybody')
         elif len(comps) > 1:
             lead = [comps[0]]
-            leadHand = HE.evaluateHand(self.allSevenCards(lead[0]))
+            leadHand = HE.evaluateStrength(self.allSevenCards(lead[0]))
             others = comps[1: len(comps)]
             for pl in others:
-                hand = HE.evaluateHand(self.allSevenCards(pl))
-                compare = HE.compareHands(hand, leadHand)
-                if compare == HE.BETTER:
+                hand = HE.evaluateStrength(self.allSevenCards(pl))
+                if hand > leadHand:
                     lead = [pl]
                     leadHand = hand
-                elif compare == HE.EQUAL:
+                elif hand == leadHand:
                     lead.append(pl)
         else:
             lead = comps  # easy :)
@@ -330,28 +401,52 @@ class TexasHoldEmGame():
         of this pot.
         """
         potSize = 0
-        for pl in self.players:
+        for pl in self._players:
             if pl.bet > nextPotBet:
                 potSize += min(pl.bet, pot.bet) - nextPotBet
         winners: List[Player] = self.getBestHandOwner(pot.eligible)
-        win = potSize // len(winners)
-        remain = potSize % len(winners)
-        winList = {winner: win for winner in winners}
-        if remain > 0:
-            # find first eligible player left to the dealer
-            # TODO: one way chain of players makes life easy here
-            receivers = [self.players[(self.dealIdx+1+idx) % len(self.players)] for idx in range(len(self.players))
-                         if self.players[(self.dealIdx+1+idx) % len(self.players)] in pot.eligible]
-            idx = 0
-            while remain > 0:
-                winList[receivers[idx]] += 1
-                remain -= 1
-                idx = (idx + 1) % len(receivers)
+        winList = {}
+        self.shareOut(winners, potSize, self.getSeatOrder(), winList)
         return winList
 
+    def getSeatOrder(self) -> Dict[Player, int]:
+        """
+        Gets the order in which the players receive odd chips: first the player left to the dealer, last the dealer.
+
+        return:
+        A dictionary mapping each player to her/his position in that order.
+        """
+        numPlayers = len(self._players)
+        return {pl: (idx - self.dealIdx - 1) % numPlayers for idx, pl in enumerate(self._players)}
+
+    def shareOut(self, winners: List[Player], potSize: int, seatOrder: Dict[Player, int], wins: Dict[Player, int]):
+        """
+        Shares a pot equally among its winners. Odd chips go one each to the winners first in seat order.
+
+        winners:
+        The players with the best hand.
+
+        potSize:
+        Number of chips in the pot.
+
+        seatOrder:
+        Order of the players as returned by self.getSeatOrder().
+
+        wins:
+        Dictionary the wins of each player are added to.
+        """
+        win, remain = divmod(potSize, len(winners))
+        if remain > 0:
+            winners = sorted(winners, key=seatOrder.__getitem__)
+        for idx, winner in enumerate(winners):
+            wins[winner] = wins.get(winner, 0) + win + (1 if idx < remain else 0)
+
     def evaluatePots(self) -> Dict[Player, int]:
         """
-        Evaluates who wins how much.
+        Evaluates who wins how much. The pots are built from the bets in one pass: each eligible player's bet, or
+        the current bet for players still active, opens a pot, and a pot holds what all players have bet up to its
+        level above the level of the pot below. The hand of each player is evaluated at most once, and only if
+        there is more than one player eligible for a pot.
 
         return:
         A dict that says which player wins how much. The wins are gross wins, i.e. the player's contribution to the
@@ -359,29 +454,57 @@ class TexasHoldEmGame():
 
 
         raise:
-        If no community cards have been dealt, the evaluation may raise an index error when addressing a kicker that
-        is undefined.
-        """
-        # add remaining players to highest pot, create thsi pot if necessary
-        self.addPlayerToPot(self.getActivePlayers(), self.curBet)
-        # pots on decreasing order of betting value
-        self.pots.sort(key=lambda pot: pot.bet, reverse=True)
-        # a pivot pot at a betting value of 0, placed at the end of the list
-        self.pots.append(Pot(0))
-        wins = {}  # takes up a dict "player: win"
-
-        for idx in range(len(self.pots) - 1):  # for all pots except pivot pot
-            pot = self.pots[idx]
-            nextPot = self.pots[idx + 1]
-            winnersThisPot = self.evaluateSinglePot(pot, nextPot.bet)
-            for winner, win in winnersThisPot.items():
-                if winner in wins:
-                    wins[winner] += win
-                else:
-                    wins[winner] = win
-            # players eligible for higher pots are also eligible for lower pots
-            nextPot.eligible += pot.eligible
+        If no community cards have been dealt, the evaluation may raise a ValueError as hands of less than five
+        cards cannot be evaluated.
+        """
+        # players eligible for a pot by the bet level they have reached, in decreasing order
+        contenders = sorted(((self.curBet if pl.isActive() else pl.bet, pl) for pl in self.getEligiblePlayers()),
+                            key=lambda contender: contender[0], reverse=True)
+        levels = sorted({level for level, _ in contenders})
+        bets = sorted(pl.bet for pl in self._players)
 
+        # build the pots from the lowest level upwards
+        self.pots = []
+        potSizes = []
+        idx = 0
+        lower = 0
+        for level in levels:
+            potSize = 0
+            while idx < len(bets) and bets[idx] < level:
+                if bets[idx] > lower:
+                    potSize += bets[idx] - lower
+                idx += 1
+            potSize += (len(bets) - idx) * (level - lower)
+            self.pots.append(Pot(level))
+            potSizes.append(potSize)
+            lower = level
+
+        # share out the pots from the highest level downwards, the contenders for a pot are also contenders for
+        # all pots below
+        wins = {}
+        seatOrder = self.getSeatOrder()
+        eligible: List[Player] = []
+        strengths: Dict[Player, int] = {}
+        leaders: List[Player] = []
+        best = -1
+        nextIdx = 0
+        for pot, potSize in zip(reversed(self.pots), reversed(potSizes)):
+            while nextIdx < len(contenders) and contenders[nextIdx][0] >= pot.bet:
+                eligible.append(contenders[nextIdx][1])
+                nextIdx += 1
+            pot.eligible = copy(eligible)
+            if len(eligible) == 1:
+                leaders = copy(eligible)  # alone in the highest pot, no need to evaluate the hand
+            else:
+                # evaluate the hands of those who have just joined, in the order they have joined
+                for pl in eligible[len(strengths):]:
+                    strength = strengths[pl] = HE.evaluateStrength(self.allSevenCards(pl))
+                    if strength > best:
+                        best = strength
+                        leaders = [pl]
+                    elif strength == best:
+                        leaders.append(pl)
+            self.shareOut(leaders, potSize, seatOrder, wins)
         return wins
 
     def checkBilance(self, player: Player, verbose: bool = True):
@@ -403,10 +526,10 @@ class TexasHoldEmGame():
                 # first betting interval in case all other players call or folds
                 self.raiser = player
             if verbose:
-                [ua.notifyCall(player) for ua in self.uas]
+                self.broadcast('notifyCall', player)
         else:
             if verbose:
-                [ua.notifyLastPenny(player) for ua in self.uas]
+                self.broadcast('notifyLastPenny', player)
 
         if player.stack == 0:
             self.allIn(player)
@@ -419,9 +542,36 @@ class TexasHoldEmGame():
         player:
         The player we are talking about.
         """
+        self.applyBet(player, self.demandBet(player))
+
+    def demandBet(self, player: Player) -> int:
+        """
+        Asks a player for a bet. If there is a clock, a decision out of time is replaced by the default action of
+        the clock.
+
+        player:
+        The player in turn.
+
+        return:
+        The bet, see Player.demandBet().
+        """
         minRaise = self.curBet + self.bb
+        if self.clock is None:
+            return player.demandBet(self.curBet, minRaise, self.potSize)
+        return self.clock.demandBet(player, self.curBet, minRaise, self.potSize)
+
+    def applyBet(self, player: Player, playersBet: int):
+        """
+        Executes the reaction of a player asked for an action: folding, checking, calling, or raising. The bet is
+        clamped to what the player is able to bet, and a raise below the minimum raise is reduced to a call.
+
+        player:
+        The player in action.
 
-        playersBet = player.demandBet(self.curBet, minRaise, self.potSize)
+        playersBet:
+        The reaction as returned by Player.demandBet().
+        """
+        minRaise = self.curBet + self.bb
         if playersBet < 0:
             self.fold(player)
         else:
@@ -436,7 +586,6 @@ class TexasHoldEmGame():
             else:
                 player.incBet(playersBet - player.bet)
                 self.checkBilance(player)
-                self.potSize = sum([pl.bet for pl in self.players])
 
     def doesIntervalGoOn(self, player: Player) -> bool:
         """
@@ -454,54 +603,63 @@ class TexasHoldEmGame():
         """
         Plays an entire interval.
         """
-        player = self.players[self.playIdx]
+        player = self._players[self.playIdx]
         while self.doesIntervalGoOn(player):
             if player.yetUnasked:
                 player.yetUnasked = False  # remove flag
             self.playAction(player)
             player = self.shiftPlayIndex(self.playIdx)
-            if (self.shortSleep > 0):
-                sleep(self.shortSleep)
+            self.pause(self.shortSleep)
 
     def firstInterval(self):
         """
         Prepares and plays the pre-flop interval.
         """
+        self.postBlinds()
+        self.playInterval()
+
+    def postBlinds(self):
+        """
+        Prepares the pre-flop interval: sets the blinds and the player in turn.
+        """
         for pl in self.getActivePlayers():
             pl.yetUnasked = True
 
         # set blinds
-        if len(self.players) > 2:
+        if len(self._players) > 2:
             player = self.shiftPlayIndex(self.dealIdx)
         else:
-            player = self.players[self.dealIdx]
+            player = self._players[self.dealIdx]
 
         # small blind
         player.incBet(self.sb)
-        [ua.notifySmallBlind(player) for ua in self.uas]
+        self.broadcast('notifySmallBlind', player)
         self.checkBilance(player, False)
-        self.potSize += player.bet
 
         # big blind
         player = self.shiftPlayIndex(self.playIdx)
         player.incBet(self.bb)
-        [ua.notifyBigBlind(player) for ua in self.uas]
+        self.broadcast('notifyBigBlind', player)
         self.checkBilance(player, False)
-        self.potSize += player.bet
 
         self.raiser = None
         self.shiftPlayIndex(self.playIdx)
-        self.playInterval()
 
     def playFurtherInterval(self):
         """
         Prepares and plays a single interval that is not the pre-flop interval.
         """
+        self.prepareFurtherInterval()
+        self.playInterval()
+
+    def prepareFurtherInterval(self):
+        """
+        Prepares an interval that is not the pre-flop interval: sets the player in turn.
+        """
         for pl in self.getActivePlayers():
             pl.yetUnasked = True
         self.raiser = None
         self.shiftPlayIndex(self.dealIdx)
-        self.playInterval()
 
     def needsPlayingAnInterval(self) -> bool:
         """
@@ -510,69 +668,75 @@ class TexasHoldEmGame():
         return:
         Is playing the betting interval required?
         """
-        return len(self.getActivePlayers()) > 1
+        return self.hasSeveralActives()
 
-    def playAHand(self):
+    def prepareHand(self):
         """
-        Plays an entire hand including preparation, betting intervals, and showdown.
-
-        return:
-        The result of self.evaluatePots()
+        Resets everything for a new hand and deals the pocket cards.
         """
-        # reset everything
-        self.croupier.restoreDeck()
+        self.croupier.shuffleForHand(self.rng, self.handNum)
         self.curBet = 0
         self.comCards = []
         self.pots = []
-        self.potSize = 0
-        [pl.clearAll() for pl in self.players]
-        [ua.notifyBeginOfHand(self.players[self.dealIdx]) for ua in self.uas]
+        [pl.clearAll() for pl in self._players]
+        self.broadcast('notifyBeginOfHand', self._players[self.dealIdx])
 
-        # pockets
         self.dealPocketCards()
-        for pl in self.players:
-            pl.notifyCardDealing(pl)
-            [spec.notifyCardDealing(pl) for spec in self.spectators]
-        if (self.shortSleep > 0):
-            sleep(self.shortSleep)
+        for pl in self._players:
+            self.notifyAgents([pl] + self.spectators, 'notifyCardDealing', pl)
+        self.pause(self.shortSleep)
+
+    def showdown(self) -> Dict[Player, int]:
+        """
+        Reveals the cards of all eligible players and evaluates the pots.
+
+        return:
+        The result of self.evaluatePots()
+        """
+        # TODO: allow for folding at this point
+        for pl in self.getEligiblePlayers():
+            self.broadcast('revealAllCards', pl)
+        return self.evaluatePots()
+
+    def playAHand(self):
+        """
+        Plays an entire hand including preparation, betting intervals, and showdown.
+
+        return:
+        The result of self.evaluatePots()
+        """
+        self.prepareHand()
 
         # first interval
         self.firstInterval()
-        if len(self.getEligiblePlayers()) == 1:
+        if not self.hasSeveralEligibles():
             return self.evaluatePots()
 
         # flop and second interval
         self.dealCommunityCards(3)
-        if (self.shortSleep > 0):
-            sleep(self.shortSleep)
+        self.pause(self.shortSleep)
         if self.needsPlayingAnInterval():
             self.playFurtherInterval()
-        if len(self.getEligiblePlayers()) == 1:
+        if not self.hasSeveralEligibles():
             return self.evaluatePots()
 
         # turn and third interval
         self.dealCommunityCards(1)
-        if (self.shortSleep > 0):
-            sleep(self.shortSleep)
+        self.pause(self.shortSleep)
         if self.needsPlayingAnInterval():
             self.playFurtherInterval()
-        if len(self.getEligiblePlayers()) == 1:
+        if not self.hasSeveralEligibles():
             return self.evaluatePots()
 
         # river and fourth interval
         self.dealCommunityCards(1)
-        if (self.shortSleep > 0):
-            sleep(self.shortSleep)
+        self.pause(self.shortSleep)
         if self.needsPlayingAnInterval():
             self.playFurtherInterval()
-        if len(self.getEligiblePlayers()) == 1:
+        if not self.hasSeveralEligibles():
             return self.evaluatePots()
 
-        # showdown
-        # TODO: allow for folding at this point
-        for pl in self.getEligiblePlayers():
-            [ua.revealAllCards(pl) for ua in self.uas]
-        return self.evaluatePots()
+        return self.showdown()
 
     def continueGame(self):
         """
@@ -584,64 +748,149 @@ class TexasHoldEmGame():
         playersStillThere = self.playersNeeded is None
         if not playersStillThere:
             for pl in self.playersNeeded:
-                if pl in self.players:
+                if pl in self._players:
                     playersStillThere = True
                     break
-        return len(self.players) > max(self.playUntilLeft, 1) and playersStillThere
+        return len(self._players) > max(self.playUntilLeft, 1) and playersStillThere
 
-    def runGame(self):
+    def startGame(self):
         """
-        Starts and runs the game until the game stops to continue.
+        Prepares the game: sets the stacks, introduces the players to the user agents, and finds the first dealer.
 
-        return:
-        A dictionary mapping all remaining players to their stack size.
+        raises:
+        ValueError if there are less than two players.
         """
-        if len(self.players) < 2:
+        if len(self._players) < 2:
             raise ValueError(Loc.getString(Loc.LESS_THAN_TWO_PLAYERS))
 
         self.state = TexasHoldEmGame.PRE_GAME
-        for pl in self.players:
+        self.handNum = 0
+        for pl in self._players:
             pl.stack = self.startStack
-        self.uas = self.players + self.spectators
-        [ua.setPlayers(self.players) for ua in self.uas]
+        self.uas = self._players + self.spectators
+        self.userAgentsChanged()
+        self.broadcast('setPlayers', self._players)
 
         # get index of player that becomes the first dealer
         self.dealIdx = self.findFirstDealer()
-        [ua.announceFirstDealer(self.players[self.dealIdx]) for ua in self.uas]
+        self.broadcast('announceFirstDealer', self._players[self.dealIdx])
 
-        # game loop
-        while self.continueGame():
-            wins = self.playAHand()
-            self.announceWins(wins)
-            for pl, win in wins.items():
-                pl.stack += win
-
-            # eliminate players
-            out = list(filter(lambda pl: pl.stack == 0, self.players))
-            for pl in out:
-                # remove from players, take care of dealIdx
-                plIdx = self.players.index(pl)
-                if self.dealIdx >= plIdx:
-                    self.dealIdx -= 1
-                del self.players[plIdx]
-                [ua.notifyElimination(pl) for ua in self.uas]
-                # players alive become spectators
-                if pl.isHuman():
-                    self.addSpectator(pl)
-                else:
-                    self.uas.remove(pl)
+    def playNextHand(self) -> Tuple[Dict[Player, int], List[Player]]:
+        """
+        Plays a hand, pays out the wins, eliminates the players without chips left, and passes the dealer button.
+
+        return:
+        The wins of the hand as returned by self.playAHand(), and the list of players eliminated.
+        """
+        wins = self.playAHand()
+        return wins, self.finishHand(wins)
+
+    def finishHand(self, wins: Dict[Player, int]) -> List[Player]:
+        """
+        Pays out the wins of a hand, eliminates the players without chips left, and passes the dealer button.
+
+        wins:
+        The wins of the hand as returned by self.playAHand().
 
-            # shift dealer
-            self.dealIdx = (self.dealIdx + 1) % len(self.players)
-            [ua.notifyEndOfHand() for ua in self.uas]
-            if (self.longSleep > 0):
-                sleep(self.longSleep)
+        return:
+        The list of players eliminated.
+        """
+        self.announceWins(wins)
+        for pl, win in wins.items():
+            pl.stack += win
+
+        # eliminate players
+        out = list(filter(lambda pl: pl.stack == 0, self._players))
+        for pl in out:
+            # remove from players, take care of dealIdx
+            plIdx = self._players.index(pl)
+            if self.dealIdx >= plIdx:
+                self.dealIdx -= 1
+            del self._players[plIdx]
+            self.seatPlayers()
+            self.broadcast('notifyElimination', pl)
+            # players alive become spectators
+            if pl.isHuman():
+                self.addSpectator(pl)
+            else:
+                self.uas.remove(pl)
+            self.userAgentsChanged()
+
+        # shift dealer
+        self.dealIdx = (self.dealIdx + 1) % len(self._players)
+        self.handNum += 1
+        self.broadcast('notifyEndOfHand')
+        self.pause(self.longSleep)
+        return out
+
+    def runGame(self):
+        """
+        Starts and runs the game until the game stops to continue.
+
+        return:
+        A dictionary mapping all remaining players to their stack size.
+        """
+        self.startGame()
+        while self.continueGame():
+            self.playNextHand()
 
         # return winners
-        return {pl: pl.stack for pl in self.players}
+        return {pl: pl.stack for pl in self._players}
 
     # _______________ any time _______________
 
+    # _______________ snapshots _______________
+
+    def snapshot(self) -> GameSnapshot:
+        """
+        Takes a snapshot of the game, e.g. in the middle of a betting interval, so that the hand can be resumed
+        from there later, any number of times. The state of the user agents themselves is not part of it.
+
+        return:
+        The snapshot.
+        """
+        players = self._players
+        table = self.table
+        return GameSnapshot(tuple(players), tuple(table.status), tuple(table.bets), tuple(table.stacks),
+                            tuple(pl.yetUnasked for pl in players), tuple(tuple(pl.pockets) for pl in players),
+                            tuple(tuple(pl.opens) for pl in players), self.croupier.getState(),
+                            tuple(self.comCards), GameSnapshot.packPots(self.pots), self.curBet, self.dealIdx,
+                            self.playIdx, self.raiser, self.handNum, self.sb, self.bb)
+
+    def restore(self, snapshot: GameSnapshot):
+        """
+        Puts the game back into the state of a snapshot. The cards drawn from the deck afterwards are the same as
+        after the snapshot has been taken, unless the random generator of the croupier is replaced.
+
+        snapshot:
+        A snapshot taken by self.snapshot() of this game.
+        """
+        # in place, as the user agents have been passed the list by setPlayers
+        self._players[:] = snapshot.players
+        self.table = TableState()
+        self.table.setAll(snapshot.status, snapshot.bets, snapshot.stacks)
+        for seat, pl in enumerate(self._players):
+            pl.sitAt(self.table, seat)
+            pl.yetUnasked = snapshot.yetUnasked[seat]
+            pl.pockets = list(snapshot.pockets[seat])
+            pl.opens = list(snapshot.opens[seat])
+        self.croupier.setState(snapshot.deck)
+        self.comCards = list(snapshot.comCards)
+        self.pots = GameSnapshot.unpackPots(snapshot.pots)
+        self.curBet = snapshot.curBet
+        self.dealIdx = snapshot.dealIdx
+        self.playIdx = snapshot.playIdx
+        self.raiser = snapshot.raiser
+        self.handNum = snapshot.handNum
+        self.sb = snapshot.sb
+        self.bb = snapshot.bb
+        uas = getattr(self, 'uas', None)
+        if uas is not None and any(pl not in uas for pl in self._players):
+            # players eliminated after the snapshot has been taken are back in play
+            self.spectators = [spec for spec in self.spectators if spec not in self._players]
+            self.uas = self._players + self.spectators
+            self.userAgentsChanged()
+
     def addSpectator(self, spec):
         """
         Adds a spectator to the list of spectators.
@@ -656,7 +905,7 @@ class TexasHoldEmGame():
         if not isinstance(spec, UA):
             raise RuntimeError(Loc.getString(Loc.NOT_AN_USERAGENT))
 
-        if spec in self.players or spec in self.spectators:
+        if spec in self._players or spec in self.spectators:
             raise RuntimeError(Loc.getString(Loc.NAME_GIVEN))
 
         self.spectators.append(spec)
@@ -1,17 +1,32 @@
 import Localization as Loc
+from random import Random
 from typing import List
+from Rng import GLOBAL_RNG
 
 
 class UserAgent():
 
+    rng: Random  # random generator of the user agent, that of the random module unless set by the game
+
     def __init__(self, name):
         self.name = name
+        self.rng = GLOBAL_RNG
 
     def __hash__(self) -> int:
         return hash((self.name))
 
     # _______________ start a game _______________
 
+    def setRng(self, rng: Random):
+        """
+        Sets the random generator the user agent draws its random decisions from. The game passes a substream of
+        its own generator, so a seeded game makes the agent reproducible.
+
+        rng:
+        The random generator.
+        """
+        self.rng = rng
+
     def setPlayers(self, players):
         self.players = players
 
@@ -0,0 +1,353 @@
+import HandEvaluator as HE
+from TableState import INACTIVE, ELIGIBLE, ACTIVE
+from typing import Callable, List
+try:
+    import numpy as np
+except ImportError:
+    np = None  # the vectorized engine is not available
+
+# number of community cards on the table in each betting interval
+_BOARD_SIZES = [0, 3, 4, 5]
+# level of players not eligible for any pot, higher than any bet
+_NO_LEVEL = np.iinfo(np.int64).max if np is not None else None
+
+
+class VectorGame():
+    """
+    Plays Texas Hold'em at many tables at once. The state of all tables lives in NumPy arrays with one row per table
+    and one column per seat, and each phase of a hand (blinds, dealing, betting intervals, showdown) is applied to
+    all tables as an array operation. The rules are those of TexasHoldEmGame.
+
+    The decisions come from policies, one per seat. A policy is called as policy(game, tables) with the indices of
+    the tables at which the seat is in turn, and returns an array of bets, like Player.demandBet() does for a
+    single table: negative for folding, otherwise the total bet in the hand.
+    """
+
+    numTables: int
+    numSeats: int
+    policies: List[Callable]  # the policy of each seat
+    sb: int                   # small blind
+    bb: int                   # big blind
+    startStack: int           # stack of each player at the begin
+    handNum: int              # number of hands played
+    rng: 'np.random.Generator'  # generator of the decks and the first dealers
+
+    seated: 'np.ndarray'      # (tables, seats) is the seat still in the game?
+    status: 'np.ndarray'      # (tables, seats) INACTIVE, ELIGIBLE, or ACTIVE
+    bets: 'np.ndarray'        # (tables, seats) bet in the current hand
+    stacks: 'np.ndarray'      # (tables, seats) stacks
+    yetUnasked: 'np.ndarray'  # (tables, seats) not asked yet in the current betting interval?
+    pockets: 'np.ndarray'     # (tables, seats, 2) pocket cards
+    board: 'np.ndarray'       # (tables, 5) community cards, including those not dealt yet
+    boardSize: 'np.ndarray'   # (tables,) number of community cards dealt
+    dealIdx: 'np.ndarray'     # (tables,) seat of the dealer
+    playIdx: 'np.ndarray'     # (tables,) seat of the player in turn
+    inTurn: 'np.ndarray'      # (tables,) is there a player in turn?
+    curBet: 'np.ndarray'      # (tables,) current height of the bet
+
+    def __init__(self, numTables: int, policies: List[Callable], seed: int = None, smallBlind: int = 250,
+                 startStack: int = None):
+        """
+        numTables:
+        Number of tables.
+
+        policies:
+        The policy of each seat. The number of policies is the number of seats at each table.
+
+        seed = None:
+        Seed of the decks and the first dealers.
+
+        smallBlind = 250:
+        The small blind. The big blind is twice as high.
+
+        startStack = None:
+        Stack of each player at the begin. 'None' for twenty big blinds.
+
+        raises:
+        ImportError if NumPy is not available.
+        """
+        if np is None:
+            raise ImportError('VectorGame requires numpy')
+        self.numTables = numTables
+        self.numSeats = len(policies)
+        self.policies = policies
+        self.sb = smallBlind
+        self.bb = 2 * smallBlind
+        self.startStack = 20 * self.bb if startStack is None else startStack
+        self.rng = np.random.default_rng(seed)
+        self.handNum = 0
+
+        shape = (numTables, self.numSeats)
+        self.seated = np.zeros(shape, dtype=bool)
+        self.status = np.full(shape, INACTIVE, dtype=np.int8)
+        self.bets = np.zeros(shape, dtype=np.int64)
+        self.stacks = np.zeros(shape, dtype=np.int64)
+        self.yetUnasked = np.zeros(shape, dtype=bool)
+        self.pockets = np.zeros(shape + (2,), dtype=np.intp)
+        self.board = np.zeros((numTables, 5), dtype=np.intp)
+        self.boardSize = np.zeros(numTables, dtype=np.intp)
+        self.dealIdx = np.zeros(numTables, dtype=np.intp)
+        self.playIdx = np.zeros(numTables, dtype=np.intp)
+        self.inTurn = np.zeros(numTables, dtype=bool)
+        self.curBet = np.zeros(numTables, dtype=np.int64)
+
+    # _______________ game _______________
+
+    def startGame(self, dealers: 'np.ndarray' = None):
+        """
+        Seats all players with the start stack at each table.
+
+        dealers = None:
+        Seat of the first dealer at each table. 'None' for random seats.
+        """
+        self.seated[:] = True
+        self.stacks[:] = self.startStack
+        if dealers is None:
+            dealers = self.rng.integers(0, self.numSeats, self.numTables)
+        self.dealIdx[:] = dealers
+        self.handNum = 0
+
+    def continuing(self) -> 'np.ndarray':
+        """
+        Which tables go on with another hand, i.e., have more than one player left?
+        """
+        return self.seated.sum(axis=1) > 1
+
+    def shuffle(self) -> 'np.ndarray':
+        """
+        Shuffles a deck for each table by sorting random keys.
+
+        return:
+        Array of shape (tables, 52), the cards in the order they are drawn.
+        """
+        return np.argsort(self.rng.random((self.numTables, 52)), axis=1)
+
+    def playHand(self, decks: 'np.ndarray' = None) -> 'np.ndarray':
+        """
+        Plays a hand at each table that continues, pays out the wins, eliminates the players without chips left,
+        and passes the dealer button.
+
+        decks = None:
+        Array of shape (tables, 52) with the cards in the order they are drawn. 'None' shuffles new decks.
+
+        return:
+        Array of shape (tables, seats) with the gross win of each player.
+        """
+        running = self.continuing()
+        self.prepareHand(running, self.shuffle() if decks is None else decks)
+        self.postBlinds(running)
+        self.playInterval(running)
+        for interval in range(1, len(_BOARD_SIZES)):
+            running &= self.numEligible() > 1
+            self.boardSize[running] = _BOARD_SIZES[interval]
+            needed = running & (self.numActive() > 1)
+            self.prepareFurtherInterval(needed)
+            self.playInterval(needed)
+        wins = self.evaluatePots(self.continuing())
+        self.finishHand(wins)
+        return wins
+
+    def finishHand(self, wins: 'np.ndarray'):
+        """
+        Pays out the wins, eliminates the players without chips left, and passes the dealer button to the next
+        seat still in the game.
+        """
+        running = self.continuing()
+        self.stacks += wins
+        self.seated &= ~(running[:, np.newaxis] & (self.stacks == 0))
+        nextDealer, found = self.nextSeat(self.dealIdx, self.seated)
+        self.dealIdx = np.where(running & found, nextDealer, self.dealIdx)
+        self.handNum += 1
+
+    # _______________ hand _______________
+
+    def numActive(self) -> 'np.ndarray':
+        return (self.status == ACTIVE).sum(axis=1)
+
+    def numEligible(self) -> 'np.ndarray':
+        return (self.status != INACTIVE).sum(axis=1)
+
+    def nextSeat(self, seats: 'np.ndarray', mask: 'np.ndarray') -> tuple:
+        """
+        Finds the next seat to the left of the given seats for which the mask is set, the given seat coming last.
+
+        seats:
+        One seat per table.
+
+        mask:
+        Array of shape (tables, seats).
+
+        return:
+        The next seats and whether a seat has been found at each table.
+        """
+        rows = np.arange(len(seats))[:, np.newaxis]
+        candidates = (seats[:, np.newaxis] + np.arange(1, self.numSeats + 1)) % self.numSeats
+        hits = mask[rows, candidates]
+        first = hits.argmax(axis=1)
+        return candidates[rows[:, 0], first], hits.any(axis=1)
+
+    def prepareHand(self, running: 'np.ndarray', decks: 'np.ndarray'):
+        """
+        Resets the tables that are running and deals the cards, like TexasHoldEmGame.prepareHand(). The first player
+        left to the dealer gets the first two cards, and so on; the community cards follow.
+        """
+        tables = np.arange(self.numTables)
+        inHand = self.seated & running[:, np.newaxis]
+        self.status[:] = np.where(inHand, ACTIVE, INACTIVE)
+        self.bets[:] = 0
+        self.yetUnasked[:] = False
+        self.curBet[:] = 0
+        self.boardSize[:] = 0
+        self.inTurn[:] = False
+
+        # rank of each seat in dealing order among the seats in the hand
+        seats = np.arange(self.numSeats)
+        order = (seats - self.dealIdx[:, np.newaxis] - 1) % self.numSeats
+        order = np.where(inHand, order, order + self.numSeats)
+        rank = np.empty_like(order)
+        rank[tables[:, np.newaxis], np.argsort(order, axis=1)] = seats
+        rank = np.minimum(rank, self.numSeats - 1)  # keep the indices of seats not dealt to within the deck
+        self.pockets[:, :, 0] = decks[tables[:, np.newaxis], 2 * rank]
+        self.pockets[:, :, 1] = decks[tables[:, np.newaxis], 2 * rank + 1]
+        numDealt = 2 * inHand.sum(axis=1)
+        self.board[:] = decks[tables[:, np.newaxis], numDealt[:, np.newaxis] + np.arange(5)]
+
+    def incBet(self, tables: 'np.ndarray', seats: 'np.ndarray', values: 'np.ndarray'):
+        """
+        Moves chips from the stacks to the bets, limited to the stacks, like Player.incBet().
+        """
+        values = np.minimum(values, self.stacks[tables, seats])
+        self.stacks[tables, seats] -= values
+        self.bets[tables, seats] += values
+
+    def checkBilance(self, tables: 'np.ndarray', seats: 'np.ndarray'):
+        """
+        Raises the current bet and marks players all in, like TexasHoldEmGame.checkBilance().
+        """
+        self.curBet[tables] = np.maximum(self.curBet[tables], self.bets[tables, seats])
+        allIn = self.stacks[tables, seats] == 0
+        self.status[tables[allIn], seats[allIn]] = ELIGIBLE
+
+    def postBlinds(self, running: 'np.ndarray'):
+        """
+        Sets the blinds and the player in turn at the tables that are running, like TexasHoldEmGame.postBlinds().
+        """
+        tables = np.flatnonzero(running)
+        active = self.status == ACTIVE
+        self.yetUnasked[:] = active
+        dealers = self.dealIdx[tables]
+        afterDealer, _ = self.nextSeat(dealers, active[tables])
+        headsUp = self.seated[tables].sum(axis=1) == 2
+        small = np.where(headsUp, dealers, afterDealer)
+        self.incBet(tables, small, np.full(len(tables), self.sb))
+        self.checkBilance(tables, small)
+        big, _ = self.nextSeat(small, self.status[tables] == ACTIVE)
+        self.incBet(tables, big, np.full(len(tables), self.bb))
+        self.checkBilance(tables, big)
+        first, found = self.nextSeat(big, self.status[tables] == ACTIVE)
+        # like TexasHoldEmGame, the big blind stays in turn if no one is active any more
+        self.playIdx[tables] = np.where(found, first, big)
+        self.inTurn[tables] = True
+
+    def prepareFurtherInterval(self, needed: 'np.ndarray'):
+        """
+        Sets the player in turn at the tables that need another interval, like
+        TexasHoldEmGame.prepareFurtherInterval().
+        """
+        tables = np.flatnonzero(needed)
+        active = self.status[tables] == ACTIVE
+        self.yetUnasked[tables] = active
+        first, found = self.nextSeat(self.dealIdx[tables], active)
+        self.playIdx[tables] = np.where(found, first, self.dealIdx[tables])
+        self.inTurn[tables] = found
+
+    def intervalGoesOn(self, playing: 'np.ndarray') -> 'np.ndarray':
+        """
+        Like TexasHoldEmGame.doesIntervalGoOn() for each table.
+        """
+        tables = np.arange(self.numTables)
+        seats = self.playIdx
+        return (playing & self.inTurn & (self.numEligible() > 1)
+                & ((self.bets[tables, seats] < self.curBet) | (self.yetUnasked[tables, seats] & (self.numActive() > 1))))
+
+    def playInterval(self, playing: 'np.ndarray'):
+        """
+        Plays a betting interval at the tables given, one action per table and round, like
+        TexasHoldEmGame.playInterval().
+
+        playing:
+        Mask of the tables playing the interval.
+        """
+        while True:
+            tables = np.flatnonzero(self.intervalGoesOn(playing))
+            if len(tables) == 0:
+                return
+            seats = self.playIdx[tables]
+            self.yetUnasked[tables, seats] = False
+            actions = np.empty(len(tables), dtype=np.int64)
+            for seat, policy in enumerate(self.policies):
+                inTurn = seats == seat
+                if inTurn.any():
+                    actions[inTurn] = policy(self, tables[inTurn])
+            self.applyBets(tables, seats, actions)
+            nextPlayer, found = self.nextSeat(seats, self.status[tables] == ACTIVE)
+            self.playIdx[tables] = np.where(found, nextPlayer, seats)
+            self.inTurn[tables] = found
+
+    def applyBets(self, tables: 'np.ndarray', seats: 'np.ndarray', actions: 'np.ndarray'):
+        """
+        Executes the reactions of the players in turn, like TexasHoldEmGame.applyBet().
+        """
+        folding = actions < 0
+        self.status[tables[folding], seats[folding]] = INACTIVE
+        tables, seats, actions = tables[~folding], seats[~folding], actions[~folding]
+        bets = self.bets[tables, seats]
+        curBet = self.curBet[tables]
+        actions = np.minimum(self.stacks[tables, seats] + bets, actions)
+        actions = np.maximum(bets, actions)
+        actions = np.where((actions > curBet) & (actions < curBet + self.bb), curBet, actions)
+        betting = actions != bets
+        tables, seats = tables[betting], seats[betting]
+        self.incBet(tables, seats, actions[betting] - bets[betting])
+        self.checkBilance(tables, seats)
+
+    def evaluatePots(self, running: 'np.ndarray') -> 'np.ndarray':
+        """
+        Builds the pots and shares them out among the players with the best hands, like
+        TexasHoldEmGame.evaluatePots(). All hands are evaluated in a single batch.
+
+        running:
+        Mask of the tables that have played a hand.
+
+        return:
+        Array of shape (tables, seats) with the gross win of each player.
+        """
+        eligible = (self.status != INACTIVE) & running[:, np.newaxis]
+        levels = np.where(self.status == ACTIVE, self.curBet[:, np.newaxis], self.bets)
+        levels = np.where(eligible, levels, _NO_LEVEL)
+
+        # evaluate the hands at the tables with a showdown
+        strengths = np.full(eligible.shape, -1, dtype=np.int64)
+        showdown = eligible & (eligible.sum(axis=1) > 1)[:, np.newaxis]
+        tables, seats = np.nonzero(showdown)
+        if len(tables) > 0:
+            cards = np.concatenate((self.pockets[tables, seats], self.board[tables]), axis=1)
+            strengths[tables, seats] = HE.evaluateHands(cards)
+
+        # order of the seats for odd chips, starting left to the dealer
+        order = (np.arange(self.numSeats) - self.dealIdx[:, np.newaxis] - 1) % self.numSeats
+        before = order[:, np.newaxis, :] < order[:, :, np.newaxis]
+
+        wins = np.zeros(eligible.shape, dtype=np.int64)
+        lower = np.zeros(self.numTables, dtype=np.int64)
+        for level in np.sort(levels, axis=1).T:
+            level = np.where(level == _NO_LEVEL, lower, level)
+            potSize = np.clip(np.minimum(self.bets, level[:, np.newaxis]) - lower[:, np.newaxis], 0, None).sum(axis=1)
+            contenders = eligible & (levels >= level[:, np.newaxis])
+            best = np.where(contenders, strengths, -2).max(axis=1)
+            winners = contenders & (strengths == best[:, np.newaxis])
+            win, remain = np.divmod(potSize, np.maximum(winners.sum(axis=1), 1))
+            rank = (winners[:, np.newaxis, :] & before).sum(axis=2)
+            wins += winners * (win[:, np.newaxis] + (rank < remain[:, np.newaxis]))
+            lower = level
+        return wins
@@ -0,0 +1,78 @@
+import TestMain  # this includes the module pathes
+import unittest as UT
+import asyncio
+from TexasPydEm.TexasHoldEmGame import TexasHoldEmGame as Game
+from TexasPydEm.AsyncGame import AsyncGame, runGames
+# the game checks players against the modules it has imported itself
+from Player import Player
+from Players.AlwaysCallPlayer import AlwaysCallPlayer as ACP
+from Players.SimpleAIPlayer import SimpleAIPlayer as AIP
+
+
+class AsyncCallPlayer(Player):
+    """
+    Calls every bet after waiting a moment, and counts how many decisions are waited for at once.
+    """
+
+    waiting = 0     # number of decisions being waited for by all instances
+    maxWaiting = 0  # highest value of waiting
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.hands = 0
+
+    async def demandBet(self, demand: int, minRaiseValue: int, potSize: int) -> int:
+        AsyncCallPlayer.waiting += 1
+        AsyncCallPlayer.maxWaiting = max(AsyncCallPlayer.maxWaiting, AsyncCallPlayer.waiting)
+        await asyncio.sleep(0.001)
+        AsyncCallPlayer.waiting -= 1
+        return demand
+
+    async def notifyBeginOfHand(self, dealer):
+        await asyncio.sleep(0)
+        self.hands += 1
+
+
+def makeGame(gameClass, seed: int, hero) -> Game:
+    game = gameClass(seed)
+    game.addPlayer(hero('Hero'))
+    for name in ['Ann', 'Bob', 'Cid']:
+        game.addPlayer(AIP(name))
+    return game
+
+
+def stacksByName(stacks) -> list:
+    return sorted((pl.name, stack) for pl, stack in stacks.items())
+
+
+class AsyncGame_UT(UT.TestCase):
+
+    def test_syncAgents_sameAsGame(self):
+        for seed in range(3):
+            expected = stacksByName(makeGame(Game, seed, ACP).runGame())
+            stacks = asyncio.run(makeGame(AsyncGame, seed, ACP).runGame())
+            self.assertEqual(stacksByName(stacks), expected, 'async game took another course')
+
+    def test_asyncAgent_sameAsSync(self):
+        expected = stacksByName(makeGame(Game, 7, ACP).runGame())
+        game = makeGame(AsyncGame, 7, AsyncCallPlayer)
+        hero = [pl for pl in game.players if pl.name == 'Hero'][0]
+        stacks = asyncio.run(game.runGame())
+        self.assertEqual(stacksByName(stacks), expected, 'async player took another course')
+        self.assertGreater(hero.hands, 0, 'async notifications not awaited')
+
+    def test_threadedAgent_sameAsSync(self):
+        expected = stacksByName(makeGame(Game, 2, ACP).runGame())
+        game = makeGame(AsyncGame, 2, ACP)
+        game.runInThread(game.players[0])
+        stacks = asyncio.run(game.runGame())
+        self.assertEqual(stacksByName(stacks), expected, 'threaded player took another course')
+
+    def test_runGames_interleaved(self):
+        AsyncCallPlayer.maxWaiting = 0
+        games = [makeGame(AsyncGame, seed, AsyncCallPlayer) for seed in range(20)]
+        results = asyncio.run(runGames(games))
+        self.assertEqual(len(results), len(games), 'games missing')
+        for stacks in results:
+            self.assertEqual(sum(stacks.values()), 4 * Game().startStack, 'chips got lost')
+        self.assertGreater(AsyncCallPlayer.maxWaiting, 1, 'tables not interleaved')
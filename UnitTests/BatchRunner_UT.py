@@ -0,0 +1,48 @@
+import TestMain  # this includes the module pathes
+import unittest as UT
+import random
+import TexasPydEm.BatchRunner as BR
+import TexasPydEm.Croupier as CR
+from TexasPydEm.Players.SimpleAIPlayer import SimpleAIPlayer as AIP
+from TexasPydEm.Players.AlwaysCallPlayer import AlwaysCallPlayer as ACP
+
+
+class BatchRunner_UT(UT.TestCase):
+
+    def test_runHands(self):
+        factories = [lambda: AIP('Ann'), lambda: AIP('Bob'), lambda: AIP('Cid')]
+        results = list(BR.runHands(factories, 200, seed=3))
+        self.assertEqual(len(results), 200, 'incorrect number of hands')
+        for result in results:
+            self.assertEqual(sum(result.stacks.values()), 3 * 20 * 500, 'chips got lost')
+            if result.showdown:
+                self.assertTrue(set(result.wins) <= set(result.showdown), 'winner not in showdown')
+        self.assertTrue(results[-1].final, 'last hand not final')
+
+    def test_runTournamentsReproducible(self):
+        factories = [lambda: AIP('Ann'), lambda: AIP('Bob'), lambda: AIP('Cid')]
+        resultsA = [result.toDict() for result in BR.runTournaments(factories, 3, seed=9)]
+        resultsB = [result.toDict() for result in BR.runTournaments(factories, 3, seed=9)]
+        self.assertEqual(resultsA, resultsB, 'same seed, different results')
+        finals = [result for result in resultsA if result['final']]
+        self.assertEqual(len(finals), 3, 'incorrect number of tournaments')
+        for final in finals:
+            self.assertEqual(len([stack for stack in final['stacks'].values() if stack > 0]), 1,
+                             'tournament ended early')
+
+    @UT.skipIf(CR.np is None, 'numpy not available')
+    def test_pooledDecks(self):
+        factories = [lambda: AIP('Ann'), lambda: AIP('Bob'), lambda: AIP('Cid')]
+        resultsA = [result.toDict() for result in BR.runHands(factories, 100, seed=9, pooledDecks=True)]
+        resultsB = [result.toDict() for result in BR.runHands(factories, 100, seed=9, pooledDecks=True)]
+        self.assertEqual(resultsA, resultsB, 'same seed, different results')
+
+    def test_globalRandomUntouched(self):
+        # unlike simple bots, calling bots draw no random numbers when created
+        factories = [lambda: ACP('Ann'), lambda: ACP('Bob')]
+        for seed in [5, None]:
+            random.seed(1)
+            expected = random.random()
+            random.seed(1)
+            list(BR.runHands(factories, 20, seed=seed))
+            self.assertEqual(random.random(), expected, 'global generator reseeded')
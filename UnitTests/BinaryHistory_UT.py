@@ -0,0 +1,112 @@
+import TestMain  # this includes the module pathes
+import unittest as UT
+import os
+import tempfile
+from TexasPydEm.HeadlessGame import HeadlessGame
+# records are compared with the class the reader has imported itself
+import BinaryHistory as BH
+from BinaryHistory import BinaryHistoryWriter, BinaryHistoryReader
+from HandHistory import HandHistoryRecorder, HandRecord, readHistory
+from Players.SimpleAIPlayer import SimpleAIPlayer as AIP
+
+
+class BinaryHistory_UT(UT.TestCase):
+
+    def tempPath(self, suffix: str) -> str:
+        handle, path = tempfile.mkstemp(suffix=suffix)
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def recordGames(self, writer, numGames: int = 3) -> str:
+        """
+        Records games both by the writer given and as JSON.
+
+        return:
+        Path of the JSON file.
+        """
+        jsonPath = self.tempPath('.jsonl')
+        recorders = [HandHistoryRecorder(writer), HandHistoryRecorder(jsonPath, 'Json')]
+        for seed in range(numGames):
+            game = HeadlessGame(seed)
+            for name in ['Ann', 'Bob', 'Cid', 'Dan', 'Eve']:
+                game.addPlayer(AIP(name))
+            for recorder in recorders:
+                game.addSpectator(recorder)
+            game.runGame()
+        recorders[1].close()
+        return jsonPath
+
+    def test_sameAsJson(self):
+        path = self.tempPath('.tphh')
+        writer = BinaryHistoryWriter(path, flushEvery=7)
+        jsonPath = self.recordGames(writer)
+        writer.close()
+        expected = list(readHistory(jsonPath))
+        with BinaryHistoryReader(path) as reader:
+            self.assertEqual(len(reader), len(expected), 'hands missing')
+            self.assertEqual(list(reader), expected, 'records differ')
+            self.assertEqual(reader[5], expected[5], 'random access failed')
+            self.assertEqual(reader[-1], expected[-1], 'random access from the end failed')
+
+    def test_indexRebuilt(self):
+        path = self.tempPath('.tphh')
+        writer = BinaryHistoryWriter(path, flushEvery=1)
+        self.recordGames(writer, 1)
+        with BinaryHistoryReader(path) as reader:  # no index yet
+            self.assertEqual(len(reader), len(writer._offsets), 'index not rebuilt')
+        writer.close()
+
+    def test_encodeDecode(self):
+        hand = HandRecord(7)
+        hand.names = ['Ann', 'Bjørn']
+        hand.stacks = [900, 1100]
+        hand.dealIdx = 1
+        hand.pockets = [[51, 0], []]
+        hand.actions = [(1, 0, 250), (0, 1, 500), (1, 2, 250)]
+        hand.board = [1, 2, 3]
+        hand.streets = [3]
+        hand.wins = [(0, 750)]
+        hand.out = [1]
+        self.assertEqual(BH.decodeHand(BH.encodeHand(hand), 0), hand, 'record changed')
+
+    def test_writerClosedOnError(self):
+        path = self.tempPath('.tphh')
+        with self.assertRaises(RuntimeError):
+            with BinaryHistoryWriter(path, flushEvery=1) as writer:
+                self.recordGames(writer, 1)
+                raise RuntimeError('interrupted')
+        with open(path, 'rb') as file:
+            self.assertEqual(file.read()[-4:], BH.INDEX_MAGIC, 'index not written')
+        with BinaryHistoryReader(path) as reader:
+            self.assertEqual(len(reader), len(writer._offsets), 'hands missing')
+
+    def test_notAHistory(self):
+        path = self.tempPath('.tphh')
+        with open(path, 'wb') as file:
+            file.write(b'{"hand":0}\n')
+        with self.assertRaises(ValueError):
+            BinaryHistoryReader(path)
+
+    @UT.skipIf(BH.np is None, 'numpy not available')
+    def test_columns(self):
+        path = self.tempPath('.tphh')
+        writer = BinaryHistoryWriter(path)
+        self.recordGames(writer, 2)
+        writer.close()
+        with BinaryHistoryReader(path) as reader:
+            hands = list(reader)
+            columns = reader.columns()
+        self.assertEqual(columns['hand'].tolist(), [hand.handNum for hand in hands], 'hand numbers differ')
+        self.assertEqual(columns['dealer'].tolist(), [hand.dealIdx for hand in hands], 'dealers differ')
+        self.assertEqual(columns['stack'].tolist(), [stack for hand in hands for stack in hand.stacks],
+                         'stacks differ')
+        self.assertEqual(columns['pockets'].tolist(), [pockets for hand in hands for pockets in hand.pockets],
+                         'pocket cards differ')
+        self.assertEqual([[card for card in board if card != BH.NO_CARD] for board in columns['board'].tolist()],
+                         [hand.board for hand in hands], 'boards differ')
+        actions = list(zip(columns['actionSeat'].tolist(), columns['actionKind'].tolist(),
+                           columns['actionBet'].tolist()))
+        self.assertEqual(actions, [action for hand in hands for action in hand.actions], 'actions differ')
+        self.assertEqual(columns['actionHand'].tolist(),
+                         [idx for idx, hand in enumerate(hands) for _ in hand.actions], 'hands of actions differ')
@@ -0,0 +1,84 @@
+import TestMain  # this includes the module pathes
+import unittest as UT
+import TexasPydEm.Croupier as CR
+from TexasPydEm.Croupier import Croupier, PooledCroupier
+from TexasPydEm.Rng import Rng
+import random
+
+
+class Croupier_UT(UT.TestCase):
+
+    def test_drawCards_allDistinct(self):
+        croupier = Croupier()
+        drawn = croupier.drawCards(20) + croupier.drawCards(40)
+        self.assertEqual(sorted(drawn), list(range(52)), 'deck not dealt completely')
+        self.assertEqual(croupier.drawCards(1), [], 'card drawn from empty deck')
+
+    def test_drawCards_cardsLeft(self):
+        croupier = Croupier()
+        drawn = croupier.drawCards(7)
+        self.assertEqual(sorted(drawn + croupier.cardsLeft()), list(range(52)), 'cards lost')
+
+    def test_restoreDeck(self):
+        croupier = Croupier()
+        croupier.drawCards(30)
+        croupier.restoreDeck()
+        self.assertEqual(sorted(croupier.cardsLeft()), list(range(52)), 'deck not restored')
+
+    def test_drawCards_bulkSameAsSingle(self):
+        random.seed(5)
+        bulk = Croupier().drawCards(9)
+        random.seed(5)
+        croupier = Croupier()
+        single = [croupier.drawCards(1)[0] for _ in range(9)]
+        self.assertEqual(bulk, single, 'bulk draw differs')
+
+    def test_drawCards_reproducible(self):
+        deals = []
+        for _ in range(2):
+            random.seed(11)
+            croupier = Croupier()
+            deal = []
+            for _ in range(3):
+                croupier.restoreDeck()
+                deal.append(croupier.drawCards(9))
+            deals.append(deal)
+        self.assertEqual(deals[0], deals[1], 'same seed, different cards')
+
+    # _______________ pooled decks _______________
+
+    @UT.skipIf(CR.np is None, 'numpy not available')
+    def test_pooled_handsAreDecks(self):
+        croupier = PooledCroupier(poolSize=8)
+        rng = Rng(3)
+        for handNum in range(20):
+            croupier.shuffleForHand(rng, handNum)
+            drawn = croupier.drawCards(9) + croupier.drawCards(43)
+            self.assertEqual(sorted(drawn), list(range(52)), 'not a complete deck')
+            self.assertEqual(croupier.drawCards(1), [], 'card drawn from empty deck')
+
+    @UT.skipIf(CR.np is None, 'numpy not available')
+    def test_pooled_reproducible(self):
+        rng = Rng(3)
+        croupierA = PooledCroupier(poolSize=8)
+        croupierA.shuffleForHand(rng, 13)
+        croupierB = PooledCroupier(poolSize=8)
+        for handNum in range(14):
+            croupierB.shuffleForHand(rng, handNum)
+            drawn = croupierB.drawCards(9)
+        self.assertEqual(croupierA.drawCards(9), drawn, 'cards depend on history')
+
+    @UT.skipIf(CR.np is None, 'numpy not available')
+    def test_pooled_restoreDeckKeepsPool(self):
+        croupier = PooledCroupier(poolSize=8)
+        rng = Rng(3)
+        croupier.shuffleForHand(rng, 0)
+        deck = list(croupier.cards)
+        croupier.restoreDeck()
+        croupier.drawCards(52)
+        croupier.shuffleForHand(rng, 0)
+        self.assertEqual(croupier.cards, deck, 'pool changed')
+
+
+if __name__ == '__main__':
+    UT.main()
@@ -0,0 +1,152 @@
+import TestMain  # this includes the module pathes
+import unittest as UT
+import asyncio
+import threading
+import time
+from TexasPydEm.TexasHoldEmGame import TexasHoldEmGame as Game
+from TexasPydEm.AsyncGame import AsyncGame
+from TexasPydEm.DecisionClock import DecisionClock, CHECK, FOLD
+from Environment import PokerEnv, ExternalPlayer
+# the game checks players against the modules it has imported itself
+from Player import Player
+from Players.SimpleAIPlayer import SimpleAIPlayer as AIP
+
+
+class FakeTimer():
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SlowPlayer(Player):
+    """
+    Raises every bet, taking the given time on the fake timer.
+    """
+
+    def __init__(self, name, timer: FakeTimer, seconds: float):
+        super().__init__(name)
+        self.timer = timer
+        self.seconds = seconds
+
+    def demandBet(self, demand: int, minRaiseValue: int, potSize: int) -> int:
+        self.timer.now += self.seconds
+        return minRaiseValue
+
+
+class HangingPlayer(Player):
+    """
+    Does not decide until released.
+    """
+
+    def __init__(self, name, release: threading.Event):
+        super().__init__(name)
+        self.release = release
+
+    def demandBet(self, demand: int, minRaiseValue: int, potSize: int) -> int:
+        self.release.wait()
+        return minRaiseValue
+
+
+class AsyncHangingPlayer(Player):
+
+    async def demandBet(self, demand: int, minRaiseValue: int, potSize: int) -> int:
+        await asyncio.sleep(3600)
+        return minRaiseValue
+
+
+class DecisionClock_UT(UT.TestCase):
+
+    def test_timeBank(self):
+        clock = DecisionClock(timeout=1.0, timeBank=2.0)
+        player = Player('Ann')
+        self.assertEqual(clock.allowance(player), 3.0, 'incorrect allowance')
+        self.assertTrue(clock.charge(player, 0.5), 'in time but timed out')
+        self.assertTrue(clock.charge(player, 1.5), 'bank not used')
+        self.assertAlmostEqual(clock.banks[player], 1.5, msg='bank not drawn')
+        self.assertFalse(clock.charge(player, 3.0), 'bank overdrawn')
+        self.assertEqual(clock.banks[player], 0.0, 'bank not emptied')
+        stats = clock.stats[player]
+        self.assertEqual((stats.count, stats.timeouts, stats.longest), (3, 1, 3.0), 'incorrect stats')
+        self.assertAlmostEqual(stats.mean, 5.0 / 3)
+
+    def test_noTimeout_recordsOnly(self):
+        clock = DecisionClock()
+        player = Player('Ann')
+        self.assertIsNone(clock.allowance(player), 'limit without timeout')
+        self.assertTrue(clock.charge(player, 1000.0), 'timed out without timeout')
+
+    def test_defaultBet(self):
+        player = Player('Ann')
+        player.stack = 1000
+        player.bet = 100
+        self.assertEqual(DecisionClock(1.0).defaultBet(player, 100), 100, 'not checked')
+        self.assertEqual(DecisionClock(1.0).defaultBet(player, 200), -1, 'not folded')
+        self.assertEqual(DecisionClock(1.0, defaultAction=FOLD).defaultBet(player, 100), -1, 'not folded')
+        with self.assertRaises(ValueError):
+            DecisionClock(1.0, defaultAction='raise')
+
+    def test_game_slowPlayerTimedOut(self):
+        timer = FakeTimer()
+        game = Game(3)
+        slow = SlowPlayer('Slow', timer, 2.0)
+        game.addPlayer(slow)
+        for name in ['Ann', 'Bob']:
+            game.addPlayer(AIP(name))
+        game.clock = DecisionClock(timeout=1.0, timeBank=3.0, defaultAction=CHECK, timer=timer)
+        game.startGame()
+        for _ in range(5):
+            game.playNextHand()
+        stats = game.clock.stats[slow]
+        self.assertGreater(stats.count, 3, 'slow player not asked')
+        self.assertEqual(stats.timeouts, stats.count - 3, 'time bank not used up first')
+        self.assertEqual(game.clock.slowest(1), [slow], 'slow player not identified')
+
+    def test_preemptive_hangingPlayer(self):
+        release = threading.Event()
+        game = Game(3)
+        game.addPlayer(HangingPlayer('Hang', release))
+        game.addPlayer(AIP('Ann'))
+        game.clock = DecisionClock(timeout=0.01, defaultAction=FOLD, preemptive=True)
+        start = time.perf_counter()
+        try:
+            game.startGame()
+            game.playNextHand()
+        finally:
+            release.set()
+        self.assertLess(time.perf_counter() - start, 1.0, 'game waited for the hanging player')
+
+    def test_async_hangingPlayerCancelled(self):
+        game = AsyncGame(3)
+        hanging = AsyncHangingPlayer('Hang')
+        game.addPlayer(hanging)
+        game.addPlayer(AIP('Ann'))
+        game.clock = DecisionClock(timeout=0.01, defaultAction=FOLD)
+        game.startGame()
+        asyncio.run(game.playNextHand())
+        self.assertEqual(game.clock.stats[hanging].timeouts, 1, 'hanging player not timed out')
+
+    def test_charge_timedOut(self):
+        player = Player('Ann')
+        clock = DecisionClock(timeout=1.0, timeBank=5.0)
+        self.assertFalse(clock.charge(player, 0.5, timedOut=True), 'cut off decision in time')
+        self.assertEqual((clock.stats[player].timeouts, clock.banks[player]), (1, 0.0), 'timeout not recorded')
+
+    def test_env_slowPlayerTimedOut(self):
+        timer = FakeTimer()
+        game = Game(5)
+        game.addPlayer(ExternalPlayer('Hero'))
+        slow = SlowPlayer('Slow', timer, 2.0)
+        game.addPlayer(slow)
+        game.addPlayer(AIP('Ann'))
+        game.clock = DecisionClock(timeout=1.0, defaultAction=FOLD, timer=timer)
+        env = PokerEnv(game)
+        for _ in range(5):
+            observation, _, done, _ = env.reset()
+            while not done:
+                observation, _, done, _ = env.step(observation.demand)
+        stats = game.clock.stats[slow]
+        self.assertGreater(stats.count, 0, 'slow player not asked through the clock')
+        self.assertEqual(stats.timeouts, stats.count, 'slow player not timed out')
@@ -0,0 +1,91 @@
+import TestMain  # this includes the module pathes
+import unittest as UT
+from TexasPydEm.TexasHoldEmGame import TexasHoldEmGame as Game
+# the game checks players against the modules it has imported itself
+from Environment import PokerEnv, VectorPokerEnv, ExternalPlayer
+from TableState import ACTIVE
+from Players.AlwaysCallPlayer import AlwaysCallPlayer as ACP
+from Players.SimpleAIPlayer import SimpleAIPlayer as AIP
+
+
+def makeGame(seed: int, hero) -> Game:
+    game = Game(seed)
+    game.addPlayer(hero('Hero'))
+    for name in ['Ann', 'Bob', 'Cid']:
+        game.addPlayer(AIP(name))
+    return game
+
+
+class Environment_UT(UT.TestCase):
+
+    def test_env_sameCourseAsGame(self):
+        # an external player calling everything plays like AlwaysCallPlayer
+        game = makeGame(4, ACP)
+        game.startGame()
+        expected = []
+        while game.continueGame():
+            stacks = {pl: pl.stack for pl in game.players}
+            game.playNextHand()
+            expected.append({pl.name: pl.stack - stack for pl, stack in stacks.items()})
+
+        env = PokerEnv(makeGame(4, ExternalPlayer))
+        for hand in range(len(expected)):
+            observation, rewards, done, _ = env.reset()
+            while not done:
+                self.assertEqual(observation.names[observation.seat], 'Hero', 'external player not in turn')
+                observation, rewards, done, info = env.step(observation.demand)
+            self.assertEqual(rewards, expected[hand], 'env took another course')
+            self.assertEqual(sum(rewards.values()), 0, 'chips got lost')
+
+    def test_env_observation(self):
+        game = makeGame(2, ExternalPlayer)
+        env = PokerEnv(game)
+        numObservations = 0
+        for _ in range(20):
+            observation, _, done, _ = env.reset()
+            while not done:
+                seat = observation.seat
+                self.assertEqual(observation.names[seat], 'Hero', 'observed by another player')
+                self.assertEqual(observation.status[seat], ACTIVE, 'player in turn not active')
+                self.assertEqual(len(observation.pockets), 2, 'pocket cards missing')
+                self.assertEqual(observation.potSize, sum(observation.bets), 'incorrect pot size')
+                self.assertEqual(observation.potSize, sum(game.table.bets), 'pot size differs from the table')
+                self.assertEqual(sum(observation.bets) + sum(observation.stacks), 4 * game.startStack,
+                                 'chips got lost')
+                self.assertEqual(observation.demand, max(observation.bets), 'incorrect demand')
+                self.assertEqual(observation.minRaise, observation.demand + game.bb, 'incorrect minimum raise')
+                self.assertEqual(observation.maxBet, observation.bets[seat] + observation.stacks[seat],
+                                 'incorrect maximum bet')
+                self.assertLessEqual(observation.bets[seat], observation.demand, 'bet above the demand')
+                if not observation.comCards and max(observation.bets) == game.bb:
+                    # a full big blind posted and nobody raised
+                    self.assertEqual(observation.minRaise, 2 * game.bb, 'incorrect minimum raise before a raise')
+                numObservations += 1
+                observation, _, done, _ = env.step(observation.demand)
+        self.assertGreater(numObservations, 20, 'too few decisions observed')
+
+    def test_env_stepWithoutHand(self):
+        env = PokerEnv(makeGame(2, ExternalPlayer))
+        with self.assertRaises(RuntimeError):
+            env.step(0)
+
+    def test_vectorEnv(self):
+        vector = VectorPokerEnv([makeGame(seed, ExternalPlayer) for seed in range(8)])
+        observations = vector.reset()
+        finished = 0
+        for _ in range(200):
+            observations, rewards, dones, _ = vector.step([-1] * len(observations))  # always fold
+            self.assertTrue(all(observation is not None for observation in observations), 'observation missing')
+            for reward, done in zip(rewards, dones):
+                if done:
+                    finished += 1
+                    self.assertTrue(reward['Hero'] <= 0, 'folding won something')
+        self.assertEqual(finished, 200 * 8, 'folding did not end the hand')
+
+    def test_vectorEnv_needsExternalPlayer(self):
+        with self.assertRaises(ValueError):
+            VectorPokerEnv([makeGame(1, ACP)])
+
+
+if __name__ == '__main__':
+    UT.main()
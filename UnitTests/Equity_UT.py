@@ -0,0 +1,132 @@
+import TestMain  # this includes the module pathes
+import unittest as UT
+import TexasPydEm.Equity as EQ
+import TexasPydEm.Preflop as PF
+
+
+class Equity_UT(UT.TestCase):
+
+    def assertProbabilities(self, equity: EQ.Equity):
+        self.assertAlmostEqual(equity.win + equity.tie + equity.lose, 1, msg='probabilities do not add up')
+        self.assertTrue(equity.win <= equity.equity <= equity.win + equity.tie, 'equity out of range')
+
+    # _______________ monte carlo _______________
+
+    def test_monteCarlo_acesHeadsUp(self):
+        equity = EQ.monteCarloEquity([12, 12+13], rollouts=20000, seed=1)
+        self.assertProbabilities(equity)
+        self.assertEqual(equity.rollouts, 20000, 'incorrect number of rollouts')
+        # pocket aces have an equity of about 85% against a random hand
+        self.assertAlmostEqual(equity.equity, 0.852, delta=0.015)
+
+    def test_monteCarlo_reproducible(self):
+        equityA = EQ.monteCarloEquity([3, 20], [1, 2, 30], opponents=3, rollouts=3000, seed=42)
+        equityB = EQ.monteCarloEquity([3, 20], [1, 2, 30], opponents=3, rollouts=3000, seed=42)
+        self.assertEqual(equityA.win, equityB.win, 'same seed, different result')
+        self.assertEqual(equityA.tie, equityB.tie, 'same seed, different result')
+
+    def test_monteCarlo_royalFlushOnBoard(self):
+        # the board plays for everybody
+        equity = EQ.monteCarloEquity([0, 1], [8, 9, 10, 11, 12], opponents=2, rollouts=500, seed=3)
+        self.assertEqual(equity.tie, 1, 'split pot missed')
+        self.assertAlmostEqual(equity.equity, 1/3)
+
+    def test_monteCarlo_deadCards(self):
+        # with all other kings dead, the river can't save the opponent
+        equity = EQ.monteCarloEquity([12, 12+13], [11, 0, 1, 2+13], [11+13, 11+26, 11+39],
+                                     rollouts=2000, seed=4)
+        self.assertProbabilities(equity)
+        self.assertGreater(equity.win, 0.8, 'dead cards ignored')
+
+    def test_monteCarlo_timeLimit(self):
+        equity = EQ.monteCarloEquity([12, 12+13], rollouts=10**9, timeLimit=0.01, seed=5, batchSize=100)
+        self.assertGreater(equity.rollouts, 0, 'no rollouts done')
+        self.assertLess(equity.rollouts, 10**9, 'time limit ignored')
+
+    def test_monteCarlo_withoutNumpy(self):
+        np = EQ.np
+        try:
+            EQ.np = None
+            equity = EQ.monteCarloEquity([12, 12+13], rollouts=2000, seed=6)
+        finally:
+            EQ.np = np
+        self.assertProbabilities(equity)
+        self.assertAlmostEqual(equity.equity, 0.852, delta=0.04)
+
+    def test_monteCarlo_invalidCards(self):
+        with self.assertRaises(ValueError):
+            EQ.monteCarloEquity([12, 12])
+        with self.assertRaises(ValueError):
+            EQ.monteCarloEquity([12, 13], opponents=0)
+        with self.assertRaises(ValueError):
+            EQ.monteCarloEquity([12, 13], [0, 1, 2, 3, 4, 5])
+
+    # _______________ exhaustive enumeration _______________
+
+    def test_exact_riverIsDecided(self):
+        equities = EQ.exactEquity([[12, 11], [0, 13]], [2, 5, 20, 33, 47])
+        self.assertEqual(equities[0].rollouts, 1, 'incorrect number of runouts')
+        self.assertEqual(equities[1].win, 1, 'pair of twos loses')
+        self.assertEqual(equities[0].lose, 1, 'ace high wins')
+
+    def test_exact_turn(self):
+        # hearts flush draw against a pair of aces, 9 outs among 44 cards
+        equities = EQ.exactEquity([[12, 12+13], [2+26, 3+26]], [11+26, 9+26, 0, 7+39])
+        self.assertEqual(equities[0].rollouts, 44, 'incorrect number of runouts')
+        self.assertAlmostEqual(equities[1].win, 9/44)
+        self.assertAlmostEqual(equities[0].win, 35/44)
+
+    def test_exact_symmetriesDoNotChangeResult(self):
+        hands = [[12, 11], [0, 1]]
+        board = [5+13, 6+26]
+        symmetries = EQ._suitSymmetries
+        try:
+            EQ._suitSymmetries = lambda groups: symmetries(groups)[:1]
+            plain = EQ.exactEquity(hands, board)
+        finally:
+            EQ._suitSymmetries = symmetries
+        reduced = EQ.exactEquity(hands, board)
+        for idx in range(len(hands)):
+            self.assertAlmostEqual(plain[idx].win, reduced[idx].win)
+            self.assertAlmostEqual(plain[idx].tie, reduced[idx].tie)
+            self.assertAlmostEqual(plain[idx].equity, reduced[idx].equity)
+
+    def test_exact_withoutNumpy(self):
+        hands = [[12, 11], [0, 1], [5+26, 5+39]]
+        board = [5+13, 6+26, 7]
+        withNumpy = EQ.exactEquity(hands, board, [8])
+        np = EQ.np
+        try:
+            EQ.np = None
+            withoutNumpy = EQ.exactEquity(hands, board, [8])
+        finally:
+            EQ.np = np
+        for idx in range(len(hands)):
+            self.assertAlmostEqual(withNumpy[idx].win, withoutNumpy[idx].win)
+            self.assertAlmostEqual(withNumpy[idx].tie, withoutNumpy[idx].tie)
+            self.assertAlmostEqual(withNumpy[idx].equity, withoutNumpy[idx].equity)
+
+    def test_exact_invalidHands(self):
+        with self.assertRaises(ValueError):
+            EQ.exactEquity([[12, 11]])
+        with self.assertRaises(ValueError):
+            EQ.exactEquity([[12, 11], [11, 10]])
+
+    # _______________ preflop table _______________
+
+    def test_preflop_classes(self):
+        self.assertEqual(PF.getClass([12, 11]), PF.getClass([12+26, 11+26]), 'suited hands differ')
+        self.assertEqual(PF.getClass([12, 11+13]), PF.getClass([11+39, 12+26]), 'offsuited hands differ')
+        self.assertNotEqual(PF.getClass([12, 11]), PF.getClass([12, 11+13]), 'suited equals offsuited')
+        classes = set(PF.getClass([first, second]) for first in range(52) for second in range(52) if first != second)
+        self.assertEqual(len(classes), PF.NUM_CLASSES, 'incorrect number of classes')
+
+    def test_preflop_equityAgreesWithSimulation(self):
+        for pockets, opponents in [([12, 12+13], 1), ([0, 5+13], 1), ([9, 8], 4)]:
+            equity = EQ.monteCarloEquity(pockets, opponents=opponents, rollouts=10000, seed=11)
+            self.assertAlmostEqual(PF.getPreflopEquity(pockets, opponents), equity.equity, delta=0.02)
+
+    def test_preflop_ranks(self):
+        for opponents in range(1, PF.MAX_OPPONENTS + 1):
+            self.assertGreater(PF.getPreflopRank([12, 12+13], opponents), 0.99, 'aces are not the best')
+            self.assertLess(PF.getPreflopRank([0, 5+13], opponents), 0.05, 'seven deuce is not among the worst')
@@ -0,0 +1,88 @@
+import TestMain  # this includes the module pathes
+import unittest as UT
+from TexasPydEm.TexasHoldEmGame import TexasHoldEmGame as Game
+# the game checks user agents against the modules it has imported itself
+from UserAgent import UserAgent as UA
+from EventBus import EventBus, Event, SILENT_HOOKS, isListening
+from Players.SimpleAIPlayer import SimpleAIPlayer as AIP
+
+
+class FoldCounter(UA):
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.folds = 0
+
+    def notifyFolding(self, player):
+        self.folds += 1
+
+
+class Recorder(UA):
+    """
+    Records every notification as an event.
+    """
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.events = []
+
+
+def recordingHook(hook: str):
+    def record(self, *args):
+        self.events.append(Event(hook, args))
+    return record
+
+
+for hook in SILENT_HOOKS:
+    setattr(Recorder, hook, recordingHook(hook))
+
+
+class EventBus_UT(UT.TestCase):
+
+    def test_isListening(self):
+        self.assertFalse(isListening(UA('Spec'), 'notifyFolding'), 'silent hook called')
+        self.assertTrue(isListening(UA('Spec'), 'setPlayers'), 'setPlayers not called')
+        self.assertTrue(isListening(FoldCounter('Spec'), 'notifyFolding'), 'overridden hook not called')
+        ua = UA('Spec')
+        ua.notifyCheck = lambda player: None
+        self.assertTrue(isListening(ua, 'notifyCheck'), 'hook set on the agent not called')
+
+    def test_publish_onlyListeners(self):
+        bus = EventBus()
+        counter = FoldCounter('Counter')
+        bus.setAgents([UA('Spec'), counter])
+        self.assertEqual(len(bus.listeners['notifyFolding']), 1, 'silent agent subscribed')
+        self.assertEqual(bus.listeners['notifyCheck'], [], 'agent subscribed to a silent hook')
+        bus.publish('notifyFolding', counter)
+        bus.publish('notifyCheck', counter)
+        self.assertEqual(counter.folds, 1, 'event not delivered')
+
+    def test_buffer(self):
+        bus = EventBus()
+        buffer = bus.addBuffer(frozenset(['notifyFolding']))
+        bus.publish('notifyFolding', 'Ann')
+        bus.publish('notifyCheck', 'Bob')
+        bus.notify([], 'notifyFolding', 'Cid')
+        self.assertEqual(buffer.drain(), [Event('notifyFolding', ('Ann',)), Event('notifyFolding', ('Cid',))],
+                         'events not buffered')
+        self.assertEqual(buffer.drain(), [], 'events not drained')
+        bus.removeBuffer(buffer)
+        bus.publish('notifyFolding', 'Ann')
+        self.assertEqual(buffer.events, [], 'removed buffer still subscribed')
+
+    def test_game_bufferSameAsSpectator(self):
+        # a spectator catching up with a buffer sees what a live spectator sees
+        game = Game(5)
+        for name in ['Ann', 'Bob', 'Cid']:
+            game.addPlayer(AIP(name))
+        live = Recorder('Live')
+        game.addSpectator(live)
+        buffer = game.bus.addBuffer()
+        late = Recorder('Late')
+        game.startGame()
+        for _ in range(3):
+            if game.continueGame():
+                game.playNextHand()
+        buffer.deliver(late)
+        self.assertGreater(len(live.events), 0, 'no events')
+        self.assertEqual(late.events, live.events, 'buffered events differ')
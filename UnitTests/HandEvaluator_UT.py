@@ -1,8 +1,12 @@
 import TestMain  # this includes the module pathes
 import unittest as UT
+import os
+import pickle
+import tempfile
 import TexasPydEm.HandEvaluator as HE
 from typing import Dict
 from functools import reduce
+from random import Random
 import TexasPydEm.CardUtils as CU
 
 
@@ -586,6 +590,114 @@ class HandEvaluator_UT(UT.TestCase):
         self.assertEqual(
             0, len(outs), 'bogus two pair outs: '+self.asStr(outs))
 
+    # _______________  integer strength  _______________
+
+    def test_strength_agreesWithDirectEvaluation(self):
+        rnd = Random(4711)
+        for _ in range(2000):
+            hand = rnd.sample(range(52), rnd.randint(5, 7))
+            self.assertEqual(HE.strengthToHand(HE.evaluateStrength(hand)), HE._evaluateHandDirect(hand),
+                             'incorrect evaluation of '+self.asStr(hand))
+
+    def test_strength_ordersLikeCompareHands(self):
+        rnd = Random(815)
+        for _ in range(2000):
+            handA = HE.evaluateHand(rnd.sample(range(52), 7))
+            handB = HE.evaluateHand(rnd.sample(range(52), 7))
+            strA = HE.handToStrength(handA)
+            strB = HE.handToStrength(handB)
+            self.assertEqual(HE.compareHands(handA, handB), (strA > strB) - (strA < strB),
+                             'order differs for '+str(handA)+' and '+str(handB))
+
+    def test_strength_roundTrip(self):
+        for hand in HandEvaluator_UT.hands:
+            combi = HE.evaluateHand(hand)
+            self.assertEqual(HE.strengthToHand(HE.handToStrength(combi)), combi, 'round trip failed')
+
+    def test_strength_twoTriplets(self):
+        cards = [3, 3+13, 3+26, 7, 7+13, 7+26, 12]
+        self.assertEqual(HE.evaluateHand(cards), (HE.FULLHOUSE, 7, 3), 'full house missed')
+
+    def test_strength_straightAndFlushButNoStraightFlush(self):
+        cards = [0, 1, 2, 3, 17, 8, 11]
+        self.assertEqual(HE.evaluateHand(cards)[0], HE.FLUSH, 'flush missed')
+
+    def test_strength_tooFewCards(self):
+        with self.assertRaises(ValueError):
+            HE.evaluateStrength([1, 2, 3, 4])
+
+    def test_tables_staleCacheRebuilt(self):
+        handle, path = tempfile.mkstemp(suffix='.tables')
+        os.close(handle)
+        saved = (HE.TABLE_FILE, HE._buildTables, HE._valueTable, HE._flushTable)
+        built = ({1: 1}, {2: 2})
+        try:
+            HE.TABLE_FILE = path
+            HE._buildTables = lambda: built
+            # tables cached without a format, as written before the format was checked
+            with open(path, 'wb') as file:
+                pickle.dump(({3: 3}, {4: 4}), file)
+            HE.loadTables()
+            self.assertEqual((HE._valueTable, HE._flushTable), built, 'stale tables loaded')
+            HE._buildTables = lambda: ({}, {})
+            HE.loadTables()
+            self.assertEqual((HE._valueTable, HE._flushTable), built, 'tables not cached with their format')
+            # a foreign pickle referring to a class that cannot be imported
+            with open(path, 'wb') as file:
+                file.write(b'cnoSuchModule\nNoSuchClass\n.')
+            HE._valueTable = HE._flushTable = None
+            HE.loadTables()
+            self.assertEqual((HE._valueTable, HE._flushTable), ({}, {}), 'foreign tables not rebuilt')
+        finally:
+            HE.TABLE_FILE, HE._buildTables, HE._valueTable, HE._flushTable = saved
+            os.remove(path)
+
+    # _______________  bit masks  _______________
+
+    def test_mask_roundTrip(self):
+        cards = [0, 12, 13, 25, 26, 38, 39, 51]
+        mask = CU.cardsToMask(cards)
+        self.assertEqual(CU.maskToCards(mask), cards, 'round trip failed')
+        self.assertEqual(CU.getSuitMask(mask, 2), 1 | 1 << 12, 'incorrect suit mask')
+
+    def test_mask_agreesWithStrength(self):
+        rnd = Random(1234)
+        for _ in range(2000):
+            hand = rnd.sample(range(52), rnd.randint(5, 7))
+            self.assertEqual(HE.evaluateMask(CU.cardsToMask(hand)), HE.evaluateStrength(hand),
+                             'incorrect evaluation of '+self.asStr(hand))
+
+    def test_mask_allCombinations(self):
+        for idx in range(len(HandEvaluator_UT.hands)):
+            hand = HandEvaluator_UT.hands[idx]
+            strength = HE.evaluateMask(CU.cardsToMask(hand))
+            self.assertEqual(HE.strengthToHand(strength), HE.evaluateHand(hand), 'combination missed: '+str(idx))
+
+    # _______________  batch evaluation  _______________
+
+    @UT.skipIf(HE.np is None, 'numpy not available')
+    def test_batch_agreesWithStrength(self):
+        rnd = Random(2024)
+        for numCards in range(5, 8):
+            hands = [rnd.sample(range(52), numCards) for _ in range(500)]
+            strengths = HE.evaluateHands(hands)
+            self.assertEqual(strengths.shape, (len(hands),), 'incorrect shape')
+            for idx in range(len(hands)):
+                self.assertEqual(strengths[idx], HE.evaluateStrength(hands[idx]),
+                                 'incorrect evaluation of '+self.asStr(hands[idx]))
+
+    @UT.skipIf(HE.np is None, 'numpy not available')
+    def test_batch_wrongNumberOfCards(self):
+        with self.assertRaises(ValueError):
+            HE.evaluateHands([[1, 2, 3, 4]])
+
+    @UT.skipIf(HE.np is None, 'numpy not available')
+    def test_batch_duplicateCards(self):
+        # a pair of duplicates that looks like a plain hand, and a flush of a single card
+        for hand in ([0, 13, 13, 27, 40, 41], [0, 0, 0, 0, 0]):
+            with self.assertRaises(ValueError):
+                HE.evaluateHands([[0, 14, 28, 42, 5], hand])
+
     #############
 
     def asStr(self, lst):
@@ -0,0 +1,83 @@
+import TestMain  # this includes the module pathes
+import unittest as UT
+import io
+import os
+import tempfile
+from TexasPydEm.HeadlessGame import HeadlessGame
+from TexasPydEm.HandHistory import HandHistoryRecorder, HandRecord, JsonHistoryWriter, readHistory
+from TexasPydEm.HandHistory import SMALL_BLIND, BIG_BLIND
+from Players.SimpleAIPlayer import SimpleAIPlayer as AIP
+
+
+def recordGame(recorder: HandHistoryRecorder, seed: int, numHands: int = None) -> HeadlessGame:
+    game = HeadlessGame(seed)
+    for name in ['Ann', 'Bob', 'Cid', 'Dan']:
+        game.addPlayer(AIP(name))
+    game.addSpectator(recorder)
+    game.startGame()
+    while game.continueGame() and (numHands is None or game.handNum < numHands):
+        game.playNextHand()
+    return game
+
+
+def lastBets(hand: HandRecord) -> dict:
+    bets = {seat: 0 for seat in range(len(hand.names))}
+    for seat, _, bet in hand.actions:
+        bets[seat] = bet
+    return bets
+
+
+class HandHistory_UT(UT.TestCase):
+
+    def test_recordsConsistent(self):
+        stream = io.StringIO()
+        recorder = HandHistoryRecorder(stream)
+        game = recordGame(recorder, 4)
+        recorder.close()
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), game.handNum, 'not one line per hand')
+
+        path = self.writeTemp(stream.getvalue())
+        hands = list(readHistory(path))
+        stacks = None
+        for hand in hands:
+            self.assertEqual([kind for _, kind, _ in hand.actions[:2]], [SMALL_BLIND, BIG_BLIND], 'no blinds')
+            self.assertTrue(all(len(pockets) == 2 for pockets in hand.pockets), 'pocket cards missing')
+            bets = lastBets(hand)
+            self.assertEqual(sum(win for _, win in hand.wins), sum(bets.values()), 'wins differ from the pot')
+            if stacks is not None:
+                self.assertEqual(dict(zip(hand.names, hand.stacks)),
+                                 {name: stack for name, stack in stacks.items() if stack > 0}, 'stacks differ')
+            stacks = {name: stack - bets[seat] for seat, (name, stack) in enumerate(zip(hand.names, hand.stacks))}
+            for seat, win in hand.wins:
+                stacks[hand.names[seat]] += win
+            self.assertEqual(sorted(hand.out), [seat for seat, name in enumerate(hand.names) if stacks[name] == 0],
+                             'incorrect eliminations')
+        self.assertEqual({pl.name: pl.stack for pl in game.players},
+                         {name: stack for name, stack in stacks.items() if stack > 0}, 'final stacks differ')
+
+    def test_roundTrip(self):
+        hand = HandRecord(3)
+        hand.names = ['Ann', 'Bob']
+        hand.stacks = [900, 1100]
+        hand.dealIdx = 1
+        hand.pockets = [[1, 2], [3, 4]]
+        hand.actions = [(1, SMALL_BLIND, 250), (0, BIG_BLIND, 500)]
+        hand.wins = [(0, 750)]
+        path = self.writeTemp(JsonHistoryWriter(io.StringIO()).encode(hand))
+        self.assertEqual(list(readHistory(path)), [hand], 'record changed')
+
+    def test_bufferedWrites(self):
+        stream = io.StringIO()
+        recorder = HandHistoryRecorder(stream, flushEvery=1000)
+        recordGame(recorder, 2, numHands=5)
+        self.assertEqual(stream.getvalue(), '', 'written before the batch is full')
+        recorder.flush()
+        self.assertEqual(len(stream.getvalue().splitlines()), recorder.numHands, 'not all hands written')
+
+    def writeTemp(self, text: str) -> str:
+        handle, path = tempfile.mkstemp(suffix='.jsonl')
+        with os.fdopen(handle, 'w') as file:
+            file.write(text)
+        self.addCleanup(os.remove, path)
+        return path
@@ -0,0 +1,51 @@
+import TestMain  # this includes the module pathes
+import unittest as UT
+import random
+import TexasPydEm.Parallel as PA
+import TexasPydEm.Equity as EQ
+from TexasPydEm.TexasHoldEmGame import TexasHoldEmGame as Game
+from TexasPydEm.Players.FullyRandomPlayer import FullyRandomPlayer as FRP
+
+
+def makeGame(seed: int) -> Game:
+    game = Game(seed)
+    for name in ['Ann', 'Bob', 'Cid']:
+        game.addPlayer(FRP(name))
+    return game
+
+
+def square(value: int) -> int:
+    return value * value
+
+
+class Parallel_UT(UT.TestCase):
+
+    def test_spawnSeeds_reproducible(self):
+        seedsA = PA.spawnSeeds(42, 5)
+        seedsB = PA.spawnSeeds(42, 5)
+        self.assertEqual(seedsA, seedsB, 'same root seed, different seeds')
+        self.assertEqual(len(set(seedsA)), 5, 'seeds not distinct')
+
+    def test_mapShards_keepsOrder(self):
+        results = PA.mapShards(square, [(val,) for val in range(20)], workers=2, chunkSize=3)
+        self.assertEqual(results, [val * val for val in range(20)], 'results out of order')
+
+    def test_runGames_independentOfWorkers(self):
+        single = PA.runGames(makeGame, 3, seed=7, workers=1)
+        multi = PA.runGames(makeGame, 3, seed=7, workers=2)
+        self.assertEqual(single, multi, 'results depend on number of workers')
+        for stacks in single:
+            self.assertEqual(sum(stacks.values()), 3 * Game().startStack, 'chips got lost')
+
+    def test_runGames_globalRandomUntouched(self):
+        random.seed(11)
+        state = random.getstate()
+        PA.runGames(makeGame, 2, seed=7, workers=1)
+        self.assertEqual(random.getstate(), state, 'global random generator changed')
+
+    def test_monteCarloEquity_independentOfWorkers(self):
+        equityA = EQ.monteCarloEquity([12, 12+13], rollouts=6000, seed=1, workers=2, chunkSize=1000)
+        equityB = EQ.monteCarloEquity([12, 12+13], rollouts=6000, seed=1, workers=3, chunkSize=1000)
+        self.assertEqual(equityA.rollouts, 6000, 'incorrect number of rollouts')
+        self.assertEqual(equityA.win, equityB.win, 'results depend on number of workers')
+        self.assertEqual(equityA.tie, equityB.tie, 'results depend on number of workers')
@@ -0,0 +1,118 @@
+import TestMain  # this includes the module pathes
+import unittest as UT
+from TexasPydEm.HeadlessGame import HeadlessGame
+from HandHistory import HandHistoryRecorder, HandRecord
+from HandHistory import SMALL_BLIND, BIG_BLIND, FOLD, CHECK, CALL, RAISE
+from PlayerStats import PlayerStats, StatsAggregator
+from Players.SimpleAIPlayer import SimpleAIPlayer as AIP
+
+
+class ListWriter():
+    """
+    Keeps the records written in a list.
+    """
+
+    def __init__(self):
+        self.hands = []
+
+    def writeHand(self, hand: HandRecord):
+        self.hands.append(hand)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class ActionLog(StatsAggregator):
+    """
+    Logs the actions counted.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.log = []
+
+    def _act(self, seat: int, kind: int, bet: int):
+        self.log.append((self.numHands, seat, kind, bet))
+        super()._act(seat, kind, bet)
+
+
+class PlayerStats_UT(UT.TestCase):
+
+    def test_liveSameAsRecorded(self):
+        writer = ListWriter()
+        recorder = HandHistoryRecorder(writer)
+        live = StatsAggregator(snapshotEvery=10)
+        for seed in range(3):
+            game = HeadlessGame(seed)
+            for name in ['Ann', 'Bob', 'Cid', 'Dan', 'Eve']:
+                game.addPlayer(AIP(name))
+            game.addSpectator(recorder)
+            game.addSpectator(live)
+            game.runGame()
+        offline = StatsAggregator()
+        offline.addHands(writer.hands)
+        self.assertEqual(offline.numHands, len(writer.hands), 'hands missing')
+        self.assertEqual(live.snapshot(), offline.snapshot(), 'live statistics differ')
+        self.assertEqual(sum(stats.net for stats in live.stats.values()), 0, 'chips not conserved')
+        self.assertEqual([numHands for numHands, _ in live.snapshots], list(range(10, live.numHands + 1, 10)),
+                         'snapshots missing')
+        for stats in live.stats.values():
+            self.assertTrue(stats.preflopRaises <= stats.voluntary <= stats.hands, 'inconsistent pre-flop counters')
+            self.assertTrue(stats.wonShowdowns <= stats.showdowns <= stats.sawFlop, 'inconsistent showdowns')
+
+    def test_counters(self):
+        hand = HandRecord()
+        hand.names = ['Ann', 'Bob', 'Cid', 'Dan']
+        hand.stacks = [5000] * 4
+        hand.board = [0, 1, 2, 3, 4]
+        # Dan opens, Ann 3-bets, Bob folds, Cid calls from the big blind, Dan calls; then checked down
+        hand.actions = [(1, SMALL_BLIND, 250), (2, BIG_BLIND, 500), (3, RAISE, 1500), (0, RAISE, 4000),
+                        (1, FOLD, 250), (2, CALL, 4000), (3, CALL, 4000),
+                        (2, RAISE, 4500), (3, FOLD, 4000), (0, CALL, 4500),
+                        (2, CHECK, 4500), (0, CHECK, 4500), (2, CHECK, 4500), (0, CHECK, 4500)]
+        hand.streets = [7, 10, 12]
+        hand.shown = [0, 2]
+        hand.wins = [(0, 13250)]
+        aggregator = StatsAggregator()
+        aggregator.addHand(hand)
+        stats = {name: stats.toDict() for name, stats in aggregator.stats.items()}
+        self.assertEqual(stats['Ann'], {'hands': 1, 'voluntary': 1, 'preflopRaises': 1, 'threeBetChances': 1,
+                                        'threeBets': 1, 'aggressive': 0, 'passive': 1, 'sawFlop': 1,
+                                        'showdowns': 1, 'wonShowdowns': 1, 'net': 8750})
+        self.assertEqual(stats['Bob'], {'hands': 1, 'voluntary': 0, 'preflopRaises': 0, 'threeBetChances': 0,
+                                        'threeBets': 0, 'aggressive': 0, 'passive': 0, 'sawFlop': 0,
+                                        'showdowns': 0, 'wonShowdowns': 0, 'net': -250})
+        self.assertEqual(stats['Cid'], {'hands': 1, 'voluntary': 1, 'preflopRaises': 0, 'threeBetChances': 0,
+                                        'threeBets': 0, 'aggressive': 1, 'passive': 0, 'sawFlop': 1,
+                                        'showdowns': 1, 'wonShowdowns': 0, 'net': -4500})
+        self.assertEqual(stats['Dan'], {'hands': 1, 'voluntary': 1, 'preflopRaises': 1, 'threeBetChances': 0,
+                                        'threeBets': 0, 'aggressive': 0, 'passive': 0, 'sawFlop': 1,
+                                        'showdowns': 0, 'wonShowdowns': 0, 'net': -4000})
+        ann = aggregator.stats['Ann']
+        self.assertEqual((ann.vpip, ann.threeBet, ann.aggression, ann.wtsd, ann.wsd), (1.0, 1.0, 0.0, 1.0, 1.0))
+        self.assertEqual(aggregator.stats['Cid'].aggression, float('inf'), 'no calls, but aggressive')
+        self.assertEqual(aggregator.stats['Dan'].netPerHand, -4000.0, 'incorrect result per hand')
+        self.assertEqual(PlayerStats.fromDict(stats['Cid']).toDict(), stats['Cid'], 'counters changed')
+
+    def test_missingStreets(self):
+        hand = HandRecord()
+        hand.names = ['Ann', 'Bob']
+        hand.board = [0, 1, 2]
+        with self.assertRaises(ValueError):
+            StatsAggregator().addHand(hand)
+
+    def test_liveSameActionsAsRecorded(self):
+        writer = ListWriter()
+        live = ActionLog()
+        game = HeadlessGame(6)
+        for name in ['Ann', 'Bob', 'Cid']:
+            game.addPlayer(AIP(name))
+        game.addSpectator(HandHistoryRecorder(writer))
+        game.addSpectator(live)
+        game.runGame()
+        offline = ActionLog()
+        offline.addHands(writer.hands)
+        self.assertEqual(live.log, offline.log, 'live actions differ from recorded ones')
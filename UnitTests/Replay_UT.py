@@ -0,0 +1,69 @@
+import TestMain  # this includes the module pathes
+import unittest as UT
+from TexasPydEm.HeadlessGame import HeadlessGame
+# records are compared with the class the replayer has imported itself
+from HandHistory import HandHistoryRecorder, HandRecord, RAISE
+from Replay import Replayer
+from Players.SimpleAIPlayer import SimpleAIPlayer as AIP
+
+
+class ListWriter():
+    """
+    Keeps the records written in a list.
+    """
+
+    def __init__(self):
+        self.hands = []
+
+    def writeHand(self, hand: HandRecord):
+        self.hands.append(hand)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def recordHands(numGames: int) -> list:
+    writer = ListWriter()
+    recorder = HandHistoryRecorder(writer)
+    for seed in range(numGames):
+        game = HeadlessGame(seed)
+        for name in ['Ann', 'Bob', 'Cid', 'Dan', 'Eve', 'Fay']:
+            game.addPlayer(AIP(name))
+        game.addSpectator(recorder)
+        game.runGame()
+    return writer.hands
+
+
+class Replay_UT(UT.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.hands = recordHands(5)
+
+    def test_verify_allMatch(self):
+        self.assertEqual(list(Replayer().verify(self.hands)), [], 'replay differs from recording')
+
+    def test_replay_jumpToHand(self):
+        hand = self.hands[len(self.hands) // 2]
+        self.assertEqual(Replayer().replay(hand), hand, 'hand not reproduced')
+
+    def test_verify_findsTamperedWins(self):
+        hand = HandRecord.fromDict(self.hands[3].toDict())
+        seat, win = hand.wins[0]
+        hand.wins[0] = (seat, win + 1)
+        self.assertEqual(list(Replayer().verify([self.hands[2], hand])), [hand], 'tampered hand not found')
+
+    def test_verify_findsMissingDecisions(self):
+        # a hand with a raise, recorded without the rest of the betting
+        hand = next(hand for hand in self.hands if any(kind == RAISE for _, kind, _ in hand.actions))
+        hand = HandRecord.fromDict(hand.toDict())
+        hand.actions = hand.actions[:[kind for _, kind, _ in hand.actions].index(RAISE) + 1]
+        self.assertEqual(list(Replayer().verify([hand])), [hand], 'incomplete hand not found')
+
+    def test_verify_goesOnAfterCorruptRecord(self):
+        hand = HandRecord.fromDict(self.hands[4].toDict())
+        hand.actions[2] = (len(hand.names), RAISE, 1000)  # seat out of range
+        self.assertEqual(list(Replayer().verify([hand, self.hands[5]])), [hand], 'corrupt hand not reported')
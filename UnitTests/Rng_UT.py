@@ -0,0 +1,29 @@
+import TestMain  # this includes the module pathes
+import unittest as UT
+from TexasPydEm.Rng import Rng, streamSeed
+import random
+
+
+class Rng_UT(UT.TestCase):
+
+    def test_streamSeed_dependsOnPath(self):
+        self.assertEqual(streamSeed(1, 'hand', 3), streamSeed(1, 'hand', 3), 'seed not reproducible')
+        self.assertNotEqual(streamSeed(1, 'hand', 3), streamSeed(1, 'hand', 4), 'same seed for other hand')
+        self.assertNotEqual(streamSeed(1, 'hand', 3), streamSeed(2, 'hand', 3), 'same seed for other root')
+
+    def test_substream_independentOfDraws(self):
+        rng = Rng(7, 'table')
+        first = rng.substream('hand', 2).random()
+        [rng.random() for _ in range(10)]
+        self.assertEqual(rng.substream('hand', 2).random(), first, 'substream depends on draws')
+        self.assertEqual(Rng(7, 'table', 'hand', 2).random(), first, 'substream differs from path')
+
+    def test_noSeed_drawnFromRandomModule(self):
+        random.seed(4)
+        rootA = Rng().rootSeed
+        random.seed(4)
+        self.assertEqual(Rng().rootSeed, rootA, 'root seed not reproducible')
+
+
+if __name__ == '__main__':
+    UT.main()
@@ -0,0 +1,51 @@
+import TestMain  # this includes the module pathes
+import unittest as UT
+from TexasPydEm.TableState import TableState, INACTIVE, ELIGIBLE, ACTIVE
+from TexasPydEm.TexasHoldEmGame import TexasHoldEmGame as Game
+
+
+class TableState_UT(UT.TestCase):
+
+    def setUp(self) -> None:
+        self.table = TableState()
+        for stack in [100, 200, 300]:
+            self.table.addSeat(ACTIVE, 0, stack)
+
+    def test_counters(self):
+        self.assertEqual((self.table.numActive, self.table.numEligible), (3, 3), 'incorrect initial counters')
+        self.table.setStatus(0, ELIGIBLE)
+        self.table.setStatus(1, INACTIVE)
+        self.assertEqual((self.table.numActive, self.table.numEligible), (1, 2), 'incorrect counters')
+        self.table.setStatus(1, INACTIVE)
+        self.assertEqual((self.table.numActive, self.table.numEligible), (1, 2), 'status set twice counted twice')
+
+    def test_potSize(self):
+        self.table.setBet(0, 50)
+        self.table.setBet(2, 70)
+        self.table.setBet(0, 80)
+        self.assertEqual(self.table.potSize, 150, 'incorrect pot size')
+
+    def test_copy(self):
+        copy = self.table.copy()
+        copy.setBet(1, 10)
+        copy.setStatus(1, INACTIVE)
+        self.assertEqual(self.table.potSize, 0, 'original changed')
+        self.assertEqual(self.table.numActive, 3, 'original changed')
+        self.assertEqual(copy.stacks, [100, 200, 300], 'stacks not copied')
+
+    def test_playersAreViews(self):
+        game = Game()
+        players = [TestMain.TestPlayer(name) for name in ['Ann', 'Bob', 'Cid']]
+        players[0].stack = 500
+        game.players = players
+        self.assertEqual(game.table.stacks, [500, 0, 0], 'state not taken along')
+        players[1].stack = 100
+        players[1].incBet(30)
+        players[2].setInactive()
+        self.assertEqual(game.table.stacks[1], 70, 'stack not in table')
+        self.assertEqual(game.potSize, 30, 'incorrect pot size')
+        self.assertEqual(game.table.numActive, 2, 'incorrect number of active players')
+
+
+if __name__ == '__main__':
+    UT.main()
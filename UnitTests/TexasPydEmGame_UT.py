@@ -2,6 +2,29 @@ from TestMain import TestPlayer as TP
 import unittest as UT
 from TexasPydEm.Pot import Pot
 from TexasPydEm.TexasHoldEmGame import TexasHoldEmGame as Game
+from TexasPydEm.HeadlessGame import HeadlessGame
+# the game checks user agents against the module it has imported itself
+from UserAgent import UserAgent as UA
+from Player import Player
+import EventBus
+from TexasPydEm.Players.SimpleAIPlayer import SimpleAIPlayer as AIP
+import random
+
+
+class SnapshotPlayer(Player):
+    """
+    Calls every bet and takes a snapshot of the game when asked for the first time.
+    """
+
+    def __init__(self, name, game):
+        super().__init__(name)
+        self.game = game
+        self.snap = None
+
+    def demandBet(self, demand: int, minRaiseValue: int, potSize: int) -> int:
+        if self.snap is None:
+            self.snap = self.game.snapshot()
+        return demand
 
 
 class TexasPydEmGame_UT(UT.TestCase):
@@ -270,3 +293,129 @@ class TexasPydEmGame_UT(UT.TestCase):
                          'player flush got incorrect value')
         self.assertEqual(wins[self.twoPair], 250,
                          'player twoPair got incorrect value')
+
+    def test_sidePotsMultiWayAllIn(self):
+        # flush all in for 100, pair all in for 200, two pair all in for 300, further called 300 and folded
+        further = TP('Player_further')
+        further.pockets = [8+26, 9+26]  # 10 and jack of hearts: high card
+        further.bet = 300
+        further.setInactive()
+        self.players.append(further)
+        for pl, bet in [(self.flush, 100), (self.pair, 200), (self.twoPair, 300)]:
+            pl.bet = bet
+            pl.setEligibleOnly()
+        self.game.curBet = 300
+
+        wins = self.game.evaluatePots()
+        self.assertEqual(wins, {self.flush: 400, self.twoPair: 300 + 200}, 'incorrect side pots')
+        self.assertEqual([pot.bet for pot in self.game.pots], [100, 200, 300], 'incorrect pot levels')
+        self.assertEqual(len(self.game.pots[0].eligible), 3, 'incorrect eligible players of main pot')
+
+    # _______________ headless game _______________
+
+    def playSeededGames(self, gameClass) -> list:
+        results = []
+        for seed in range(5):
+            random.seed(seed)
+            game = gameClass()
+            for name in ['Ann', 'Bob', 'Cid', 'Dan', 'Eve']:
+                game.addPlayer(AIP(name))
+            game.addSpectator(UA('Spec'))
+            stacks = game.runGame()
+            results.append(sorted((pl.name, stack) for pl, stack in stacks.items()))
+        return results
+
+    def test_headless_sameOutcome(self):
+        self.assertEqual(self.playSeededGames(Game), self.playSeededGames(HeadlessGame),
+                         'headless game took another course')
+
+    def test_headless_silentAgentNotCalled(self):
+        calls = []
+        spec = UA('Spec')
+
+        def spy(hook: str):
+            def call(ua, *args):
+                if ua is spec:
+                    calls.append(hook)
+            return call
+
+        saved = {hook: getattr(UA, hook) for hook in EventBus.SILENT_HOOKS}
+        try:
+            # the hooks stay those of UserAgent, so the agent still counts as silent
+            for hook in saved:
+                setattr(UA, hook, spy(hook))
+            game = HeadlessGame(5)
+            for name in ['Ann', 'Bob', 'Cid']:
+                game.addPlayer(AIP(name))
+            game.addSpectator(spec)
+            game.startGame()
+            game.playAHand()
+        finally:
+            for hook, method in saved.items():
+                setattr(UA, hook, method)
+        self.assertEqual(calls, [], 'silent agent notified')
+
+    # _______________ seeding _______________
+
+    def test_seed_reproducible(self):
+        def play(seed: int) -> list:
+            game = Game(seed)
+            for name in ['Ann', 'Bob', 'Cid']:
+                game.addPlayer(AIP(name))
+            return [(pl.name, pl.stack) for pl in game.players], game.runGame()
+
+        random.seed(1)
+        seatsA, resultA = play(42)
+        random.seed(2)
+        seatsB, resultB = play(42)
+        self.assertEqual(seatsA, seatsB, 'same seed, different seats')
+        self.assertEqual({pl.name: stack for pl, stack in resultA.items()},
+                         {pl.name: stack for pl, stack in resultB.items()}, 'same seed, different game')
+
+    def test_seed_handsIndependent(self):
+        # the cards of a hand depend on the seed and the number of the hand only
+        gameA = Game(5)
+        gameB = Game(5)
+        gameB.croupier.drawCards(13)
+        for game in [gameA, gameB]:
+            game.handNum = 3
+            game.croupier.restoreDeck(game.rng.substream('hand', game.handNum))
+        self.assertEqual(gameA.croupier.drawCards(9), gameB.croupier.drawCards(9), 'cards depend on history')
+
+    # _______________ snapshots _______________
+
+    def test_snapshot_restore(self):
+        game = Game(8)
+        players = [SnapshotPlayer(name, game) for name in ['Ann', 'Bob', 'Cid']]
+        for pl in players:
+            game.addPlayer(pl)
+        game.startGame()
+        game.playAHand()
+        snap = next(pl.snap for pl in players if pl.snap is not None)
+        flop = game.comCards[:3]
+        self.assertNotEqual(game.snapshot(), snap, 'hand has not gone on')
+
+        game.restore(snap)
+        self.assertEqual(game.snapshot(), snap, 'state not restored')
+        self.assertEqual(game.potSize, sum(snap.bets), 'incorrect pot size')
+        self.assertEqual(game.table.numActive, 3, 'incorrect number of active players')
+        self.assertEqual(game.croupier.drawCards(3), flop, 'deck not restored')
+        game.restore(snap)
+        self.assertEqual(game.snapshot(), snap, 'snapshot not reusable')
+
+    def test_snapshot_restoreSeenBySpectators(self):
+        game = Game(8)
+        for name in ['Ann', 'Bob', 'Cid']:
+            game.addPlayer(AIP(name))
+        spectator = UA('Spec')
+        game.addSpectator(spectator)
+        game.startGame()
+        snap = game.snapshot()
+        while len(game.players) == 3:
+            game.playNextHand()
+        out = next(pl for pl in snap.players if pl not in game.players)
+
+        game.restore(snap)
+        self.assertIs(spectator.players, game.players, 'spectator sees a stale list of players')
+        self.assertEqual(spectator.players, list(snap.players), 'spectator sees other players')
+        self.assertIn(out, game.uas, 'player eliminated after the snapshot not notified')
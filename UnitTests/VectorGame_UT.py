@@ -0,0 +1,118 @@
+import TestMain  # this includes the module pathes
+import unittest as UT
+import numpy as np
+import TexasPydEm.VectorGame as VG
+from TexasPydEm.TexasHoldEmGame import TexasHoldEmGame as Game
+from TexasPydEm.Croupier import Croupier
+# the game checks players against the modules it has imported itself
+from Player import Player
+
+NUM_SEATS = 6
+BB = 500
+
+
+def decide(seat: int, pockets, numComCards: int, bet: int, demand: int) -> int:
+    """
+    A deterministic decision that depends on the cards and the bets, so the hands take various courses.
+    """
+    choice = (pockets[0] + 3 * pockets[1] + numComCards + bet // BB + seat) % 12
+    if choice == 0:
+        return -1
+    if choice <= 6:
+        return demand
+    if choice <= 10:
+        return demand + BB
+    return 1000000
+
+
+class DecidingPlayer(Player):
+
+    def __init__(self, name: str, seat: int, game: Game):
+        super().__init__(name)
+        self.seatNum = seat
+        self.game = game
+
+    def demandBet(self, demand: int, minRaiseValue: int, potSize: int) -> int:
+        return decide(self.seatNum, self.pockets, len(self.game.comCards), self.bet, demand)
+
+
+def decidingPolicy(seat: int):
+    def policy(game: VG.VectorGame, tables: np.ndarray) -> np.ndarray:
+        return np.array([decide(seat, game.pockets[table, seat], game.boardSize[table], game.bets[table, seat],
+                                game.curBet[table]) for table in tables])
+    return policy
+
+
+class FixedCroupier(Croupier):
+    """
+    Deals given decks in order, one per hand.
+    """
+
+    def __init__(self, decks):
+        super().__init__()
+        self.decks = decks
+        self.pos = 0
+
+    def shuffleForHand(self, rng, handNum: int):
+        self.cards = list(self.decks[handNum])
+        self.pos = 0
+
+    def drawCards(self, numCards: int):
+        drawn = self.cards[self.pos:self.pos + numCards]
+        self.pos += numCards
+        return drawn
+
+
+@UT.skipIf(VG.np is None, 'numpy not available')
+class VectorGame_UT(UT.TestCase):
+
+    def test_sameAsGame(self):
+        numTables, numHands = 40, 150
+        rng = np.random.default_rng(17)
+        decks = np.argsort(rng.random((numHands, numTables, 52)), axis=2)
+        vector = VG.VectorGame(numTables, [decidingPolicy(seat) for seat in range(NUM_SEATS)], seed=3)
+        vector.startGame()
+
+        games = []
+        for table in range(numTables):
+            game = Game()
+            game.croupier = FixedCroupier(decks[:, table].tolist())
+            game.players = [DecidingPlayer(str(seat), seat, game) for seat in range(NUM_SEATS)]
+            game.startGame()
+            game.dealIdx = int(vector.dealIdx[table])
+            games.append(game)
+
+        for hand in range(numHands):
+            if not vector.continuing().any():
+                break
+            vector.playHand(decks[hand])
+            for table, game in enumerate(games):
+                if game.continueGame():
+                    game.playNextHand()
+                stacks = [0] * NUM_SEATS
+                for pl in game.players:
+                    stacks[pl.seatNum] = pl.stack
+                self.assertEqual(vector.stacks[table].tolist(), stacks,
+                                 'table {} differs in hand {}'.format(table, hand))
+                self.assertEqual(bool(vector.continuing()[table]), game.continueGame(), 'game not over')
+        self.assertFalse(vector.continuing().any(), 'games too long for the test')
+
+    def test_chipsKept(self):
+        vector = VG.VectorGame(200, [decidingPolicy(seat) for seat in range(4)], seed=5)
+        vector.startGame()
+        total = 4 * vector.startStack
+        while vector.continuing().any():
+            wins = vector.playHand()
+            self.assertTrue((wins >= 0).all(), 'negative win')
+            self.assertTrue((vector.stacks.sum(axis=1) == total).all(), 'chips got lost')
+        self.assertTrue((vector.seated.sum(axis=1) == 1).all(), 'more than one winner left')
+
+    def test_seedReproducible(self):
+        stacks = []
+        for _ in range(2):
+            vector = VG.VectorGame(30, [decidingPolicy(seat) for seat in range(3)], seed=8)
+            vector.startGame()
+            for _ in range(5):
+                vector.playHand()
+            stacks.append(vector.stacks.tolist())
+        self.assertEqual(stacks[0], stacks[1], 'same seed, different course')